@@ -5,15 +5,78 @@ Script untuk melakukan otomatisasi vote fuel frame di Farcaster
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import time
 import random
-import uuid
 import datetime
+import functools
+import logging
+import sys
 import pytz
-from urllib.parse import unquote, quote
+from urllib.parse import unquote, quote_from_bytes
 import os
+import collections
+import atexit
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 
+try:
+    import orjson  # Opsional: decode/encode JSON lebih cepat
+except ImportError:
+    orjson = None
+
+ujson = None
+if orjson is None:
+    try:
+        import ujson  # Fallback jika wheel orjson tidak tersedia (mis. di PyPy)
+    except ImportError:
+        pass
+
+logger = logging.getLogger("farcaster_auto_vote")
+
+# Timezone di-cache sekali, jangan lookup ulang setiap format; pytz hanya untuk tampilan WIB
+_WIB = pytz.timezone('Asia/Jakarta')
+_UTC = datetime.timezone.utc
+_now = datetime.datetime.now
+
+def _dumps_bytes(obj):
+    """Serialize ke JSON bytes compact, pakai orjson/ujson jika tersedia"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    if ujson is not None:
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode()
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+def _pp(obj):
+    """Pretty-print JSON indent 2 untuk output diagnostik, pakai orjson jika tersedia"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+# Datadog RUM memakai id 63-bit; trace id 64-bit di-pad ke 128-bit pada traceparent
+_TRACEPARENT_PAD = "00-" + "0" * 16
+# Di-bind sekali supaya tidak lookup atribut modul random/time di jalur header/tracking
+_getrandbits = random.getrandbits
+_time_ns = time.time_ns
+
+def _trace_headers():
+    """Generate header traceparent + x-datadog id dari satu buffer os.urandom"""
+    buf = bytearray(os.urandom(16))
+    buf[0] &= 0x7f  # clear bit teratas -> id 63-bit
+    buf[8] &= 0x7f
+    trace_bytes = bytes(buf[:8])
+    parent_bytes = bytes(buf[8:])
+    return {
+        "traceparent": _TRACEPARENT_PAD + trace_bytes.hex() + "-" + parent_bytes.hex() + "-01",
+        "x-datadog-parent-id": str(int.from_bytes(parent_bytes, 'big')),
+        "x-datadog-trace-id": str(int.from_bytes(trace_bytes, 'big'))
+    }
+
+@functools.lru_cache(maxsize=256)
 def parse_iso_time(iso_string):
     """Parse ISO time string ke datetime object"""
     try:
@@ -23,67 +86,100 @@ def parse_iso_time(iso_string):
     except:
         return None
 
+# (voting_start, voting_end) hanya untuk match yang sedang aktif; di-reset saat match berganti
+_MATCH_WINDOWS = {}
+
+def match_window(match_data):
+    """Ambil (voting_start, voting_end) match, di-cache per match ID"""
+    match_id = match_data.get('_id')
+    window = _MATCH_WINDOWS.get(match_id)
+    if window is None:
+        voting_start_str = match_data.get('votingStartTime')
+        voting_end_str = match_data.get('votingEndTime') or match_data.get('endTime')
+        window = (
+            parse_iso_time(voting_start_str) if voting_start_str else None,
+            parse_iso_time(voting_end_str) if voting_end_str else None
+        )
+        if match_id is not None and all(window):
+            # Match baru: buang window match sebelumnya (window belum lengkap tidak di-cache)
+            _MATCH_WINDOWS.clear()
+            _MATCH_WINDOWS[match_id] = window
+    return window
+
+def extract_fuel_balance(payload, default=0):
+    """Ambil data.data.fuelBalance dari payload /v1/user/data sebagai int, default jika bentuknya tidak sesuai"""
+    try:
+        return int(payload['data']['data']['fuelBalance'])
+    except (KeyError, TypeError, ValueError):
+        return default
+
 def format_time_wib(dt):
     """Format datetime ke WIB timezone"""
     if not dt:
         return "Unknown"
     
     # Convert ke WIB (UTC+7)
-    wib_tz = pytz.timezone('Asia/Jakarta')
-    dt_wib = dt.astimezone(wib_tz)
-    return dt_wib.strftime('%Y-%m-%d %H:%M:%S WIB')
+    return dt.astimezone(_WIB).strftime('%Y-%m-%d %H:%M:%S WIB')
 
 def format_duration(seconds):
     """Format duration dalam seconds ke readable string"""
     if seconds <= 0:
         return "0s"
     
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    
-    if hours > 0:
-        return f"{hours}h {minutes}m {secs}s"
-    elif minutes > 0:
-        return f"{minutes}m {secs}s"
-    else:
-        return f"{secs}s"
+    hours, rem = divmod(int(seconds), 3600)
+    minutes, secs = divmod(rem, 60)
+    return f"{hours}h {minutes}m {secs}s" if hours else (f"{minutes}m {secs}s" if minutes else f"{secs}s")
 
-def format_time_diff(dt):
+def format_time_diff(dt, now=None):
     """Format time difference menjadi readable string"""
     if not dt:
         return "Unknown"
     
-    now = datetime.datetime.now(pytz.UTC)
-    diff = dt - now
+    if now is None:
+        now = _now(_UTC)
+    diff_seconds = (dt - now).total_seconds()
+    hours, rem = divmod(int(abs(diff_seconds)), 3600)
+    minutes, seconds = divmod(rem, 60)
     
-    if diff.total_seconds() < 0:
+    if diff_seconds < 0:
         # Waktu sudah lewat
-        diff = abs(diff)
-        total_seconds = int(diff.total_seconds())
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
-        
-        if hours > 0:
-            return f"{hours}h {minutes}m ago"
-        elif minutes > 0:
-            return f"{minutes}m {seconds}s ago"
-        else:
-            return f"{seconds}s ago"
-    else:
-        # Waktu di masa depan
-        total_seconds = int(diff.total_seconds())
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
-        
-        if hours > 0:
-            return f"in {hours}h {minutes}m"
-        elif minutes > 0:
-            return f"in {minutes}m {seconds}s"
-        else:
-            return f"in {seconds}s"
+        return f"{hours}h {minutes}m ago" if hours else (f"{minutes}m {seconds}s ago" if minutes else f"{seconds}s ago")
+    # Waktu di masa depan
+    return f"in {hours}h {minutes}m" if hours else (f"in {minutes}m {seconds}s" if minutes else f"in {seconds}s")
+
+_PROGRESS_MIN_INTERVAL = 1.0  # Maksimal 1 update progress per detik
+
+def _write_progress(label, seconds):
+    """Tulis satu baris progress (overwrite dengan \\r) langsung ke stdout"""
+    sys.stdout.write(f"{label} {format_duration(seconds)}\r")
+    sys.stdout.flush()
+
+def sleep_with_progress(seconds, label, interval=60):
+    """Tidur sekali sampai deadline; ETA dicetak oleh thread ticker tiap interval detik"""
+    if seconds <= 0:
+        return
+    interval = max(interval, _PROGRESS_MIN_INTERVAL)
+    deadline = time.monotonic() + seconds
+    stop = threading.Event()
+    
+    def ticker():
+        while not stop.wait(interval):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            _write_progress(label, remaining)
+    
+    _write_progress(label, seconds)
+    thread = threading.Thread(target=ticker, daemon=True)
+    thread.start()
+    try:
+        time.sleep(seconds)
+        # Koreksi singkat jika sleep kembali lebih awal
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+    finally:
+        stop.set()
 
 def show_match_timing_info(match_data):
     """Display match timing information"""
@@ -100,33 +196,196 @@ def show_match_timing_info(match_data):
     print(f"📊 Status: {match_data.get('status')}")
     print(f"🏆 Total Votes: {match_data.get('totalVotes', 0)}")
     
-    now = datetime.datetime.now(pytz.UTC)
+    now = _now(_UTC)
     print(f"🕐 Current Time: {format_time_wib(now)}")
     
     if voting_start and voting_end:
         print(f"\n📅 Voting Window:")
-        print(f"   🟢 Start: {format_time_wib(voting_start)} ({format_time_diff(voting_start)})")
-        print(f"   🔴 End: {format_time_wib(voting_end)} ({format_time_diff(voting_end)})")
+        print(f"   🟢 Start: {format_time_wib(voting_start)} ({format_time_diff(voting_start, now)})")
+        print(f"   🔴 End: {format_time_wib(voting_end)} ({format_time_diff(voting_end, now)})")
         
         # Check voting status
         if now < voting_start:
-            voting_status = f"⏳ Voting opens {format_time_diff(voting_start)}"
+            voting_status = f"⏳ Voting opens {format_time_diff(voting_start, now)}"
         elif now > voting_end:
-            voting_status = f"⏰ Voting ended {format_time_diff(voting_end)}"
+            voting_status = f"⏰ Voting ended {format_time_diff(voting_end, now)}"
         else:
-            voting_status = f"✅ Voting is OPEN (ends {format_time_diff(voting_end)})"
+            voting_status = f"✅ Voting is OPEN (ends {format_time_diff(voting_end, now)})"
         
         print(f"\n🗳️  Status: {voting_status}")
     
     if match_start and match_end:
         print(f"\n🎮 Match Schedule:")
-        print(f"   🏁 Start: {format_time_wib(match_start)} ({format_time_diff(match_start)})")
-        print(f"   🏁 End: {format_time_wib(match_end)} ({format_time_diff(match_end)})")
+        print(f"   🏁 Start: {format_time_wib(match_start)} ({format_time_diff(match_start, now)})")
+        print(f"   🏁 End: {format_time_wib(match_end)} ({format_time_diff(match_end, now)})")
     
     print("=" * 50)
 
+def _show_timing_and_return_end(match_details):
+    """Tampilkan timing match aktif dari payload match details, return voting_end (None jika tidak ada)"""
+    try:
+        match_data = match_details['data']['matchData'] if match_details else None
+        if not match_data:
+            return None
+        current_match = match_data[0]
+        show_match_timing_info(current_match)
+        return match_window(current_match)[1]
+    except Exception as e:
+        print(f"⚠️ Could not load timing info: {e}")
+        return None
+
+# Header per-endpoint yang tidak pernah berubah (bagian browser sudah ada di session)
+_VERSUS_JSON_HEADERS = MappingProxyType({"content-type": "application/json"})
+_AMPLITUDE_HEADERS = MappingProxyType({
+    "content-type": "application/x-www-form-urlencoded; charset=UTF-8",
+    "cross-origin-resource-policy": "cross-origin"
+})
+_AMP_URL = "https://client.farcaster.xyz/v2/amp/api"
+# Event amplitude ditampung lalu dikirim sekaligus begitu jumlahnya mencapai batas ini,
+# atau begitu event tertua sudah menunggu lebih dari _AMP_MAX_AGE_SECONDS
+_AMP_BATCH_SIZE = 10
+_AMP_MAX_AGE_SECONDS = 30
+# Body urlencoded amplitude: checksum, client, e (JSON array event, sudah di-quote), upload_time
+_AMP_BODY_FMT = "checksum=%s&client=%s&e=%s&upload_time=%d&v=2"
+_AMP_CLIENT = "7dd7b12861158f5e89ab5508bd9ce4c0"
+_AMP_CHECKSUM_FRAME = "c637ef550ee809550511f2993af810c3"  # Dapat digenerate atau hardcode
+_AMP_CHECKSUM_CAST = "164f2070e0f5360795d082772f7b168e"  # Dari share_endpoint.txt
+_API_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+# Variasi text cast dengan typo natural untuk avoid spam detection
+_TEXT_VARIATIONS = (
+    "Help me get Fuel by likeing this cast!\n5 Likes = 1 Fuel🔋\nSupport my mech battles in Wreck League Versus 🤖 by @towerecosystem",
+    "Pls help me get Fuel by liking this cast!\n5 Like = 1 Fuel🔋\nSuport my mech battles in Wreck League Versus 🤖 by @towerecosystem",
+    "Help me get Fuel by likng this cast!\n5 Likes = 1 Fuel🔋\nSupport my mech batles in Wreck League Versus 🤖 by @towerecosystem",
+    "Help me get Fuel by liking this cast pls!\n5 Likes = 1 Fuel🔋\nSupport my mech battles in Wreck League Versus 🤖 by @towerecosystem",
+    "Help me get Fuel by liking this cast!\n5 Likes = 1 Fuel🔋\nSupport my mech battles in Wreck League Versus 🤖 by @towerecosystem thx!",
+    "Hlp me get Fuel by liking this cast!\n5 Likes = 1 Fuel🔋\nSupport my mech battles in Wreck League Versus 🤖 by @towerecosystem",
+    "Help me get Fuel by liking this cast!\n5 likes = 1 fuel🔋\nSupport my mech battles in Wreck League Versus 🤖 by @towerecosystem",
+    "Help me get Fuel by likeing this cast plz!\n5 Likes = 1 Fuel🔋\nSupport my mech battles in Wreck League Versus 🤖 by @towerecosystem"
+)
+
+# Jeda minimal antara trigger share task dan post cast, dihitung sejak trigger dikirim
+_SHARE_SETTLE_SECONDS = 2.0
+
+# TTL cache response GET: match details dipakai 2-3x per cycle, user data (fuel) lebih jarang berubah
+_MATCH_TTL_SECONDS = 5.0
+_USER_DATA_TTL_SECONDS = 15.0
+
+# Interval poll match berikutnya saat belum ada window voting. Poll ke match/details
+# direvalidasi pakai ETag (304 tanpa body), jadi interval pendek tetap murah
+_NEXT_MATCH_POLL_SECONDS = 15
+
+# Backoff retry vote gagal di mode continuous: min(base * 2**streak, cap) + jitter acak
+_RETRY_BASE_SECONDS = 30
+_RETRY_CAP_SECONDS = 900
+_RETRY_JITTER_SECONDS = 30
+
+# Jumlah UUID yang di-generate per isi ulang pool (satu kali os.urandom)
+_UUID_POOL_SIZE = 256
+
+# Telemetry amplitude bersifat fire-and-forget: dikirim di background supaya tidak
+# menahan loop vote. Satu executor dipakai bersama semua instance (bot dibuat ulang tiap cycle)
+_TRACKING_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="amp-tracking")
+atexit.register(_TRACKING_EXECUTOR.shutdown, wait=False)
+
+def _log_tracking_result(future):
+    """Callback hasil tracking background, hanya untuk log debug"""
+    exc = future.exception()
+    if exc is not None:
+        logger.debug("Background tracking error: %s", exc)
+    else:
+        logger.debug("Background tracking sent: %s", future.result())
+
+def _flush_amplitude_buffer(session, buffer, lock):
+    """Kirim semua event amplitude di buffer, satu POST per checksum"""
+    with lock:
+        pending = list(buffer.items())
+        buffer.clear()
+    ok = True
+    for checksum, events in pending:
+        upload_time = _time_ns() // 1_000_000
+        payload = _AMP_BODY_FMT % (checksum, _AMP_CLIENT, quote_from_bytes(_dumps_bytes(events), safe=b''), upload_time)
+        try:
+            response = session.post(_AMP_URL, headers=_AMPLITUDE_HEADERS, data=payload)
+            logger.debug("Amplitude flush (%d events) response status: %s", len(events), response.status_code)
+            ok = ok and response.status_code == 200
+        except Exception as e:
+            logger.debug("Amplitude flush error: %s", e)
+            ok = False
+    return ok
+
+# Penanda error cast yang umum, dicek langsung di body (lowercase) sebelum parse JSON
+_CAST_ERR_MARKERS = (
+    (b"duplicate", "ℹ️  Duplicate cast detected - you recently posted similar content"),
+    (b"rate limit", "ℹ️  Rate limited - please wait before posting again"),
+    (b"invalid", "ℹ️  Invalid cast format"),
+)
+
+# Label tim per index mech: Index 0 = Merah = Kiri, Index 1 = Biru = Kanan
+_TEAM_LABELS = (" (� Tim Merah/Kiri)", " (� Tim Biru/Kanan)")
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter dengan timeout default supaya request tidak menggantung selamanya"""
+    def __init__(self, *args, timeout=10.0, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+    
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        return super().send(request, **kwargs)
+
+class _WriteSafeRetry(Retry):
+    """Retry yang juga mengulang POST/PUT, tapi hanya untuk status yang berarti request belum diproses"""
+    # 503: ditolak sebelum diproses -> aman di-retry walau vote/cast tidak idempotent;
+    # 502/504 tidak termasuk karena backend bisa saja sudah menyimpan vote.
+    # 429 juga tidak: rate limit pada write sudah ditangani retry_on_overload (satu layer retry saja)
+    UNPROCESSED_STATUS_CODES = frozenset({503})
+    WRITE_METHODS = frozenset({"POST", "PUT"})
+    
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if method.upper() in self.WRITE_METHODS:
+            return bool(self.total) and status_code in self.UNPROCESSED_STATUS_CODES
+        return super().is_retry(method, status_code, has_retry_after)
+
+class FarcasterOverloadError(Exception):
+    """Server menolak request karena overload / rate limit"""
+
+def retry_on_overload(max_attempts=3, retry_interval_seconds=1.5):
+    """Decorator untuk retry dengan exponential backoff saat FarcasterOverloadError"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            delay = retry_interval_seconds
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    return func(*args, **kwargs)
+                except FarcasterOverloadError as e:
+                    if attempt == max_attempts:
+                        print(f"❌ Server still overloaded after {max_attempts} attempts: {e}")
+                        return False
+                    print(f"⏳ Server overloaded ({e}), retrying in {delay:.1f}s... ({attempt}/{max_attempts})")
+                    time.sleep(delay)
+                    delay *= 2
+        return wrapper
+    return decorator
+
 class FarcasterAutoVote:
-    def __init__(self, authorization_token, fuel_amount=None, max_fuel=5, team_preference=None, privy_token=None):
+    # Header browser yang sama untuk semua request, dipasang sekali di session
+    _STATIC_HEADERS = {
+        "accept": "*/*",
+        "accept-language": "en-US,en;q=0.9",
+        "priority": "u=1, i",
+        "sec-ch-ua": '"Not;A=Brand";v="99", "Microsoft Edge";v="139", "Chromium";v="139"',
+        "sec-ch-ua-mobile": "?0",
+        "sec-ch-ua-platform": '"Windows"',
+        "sec-fetch-dest": "empty",
+        "sec-fetch-mode": "cors",
+        "sec-fetch-site": "same-site",
+        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36 Edg/139.0.0.0"
+    }
+    
+    def __init__(self, authorization_token, fuel_amount=None, max_fuel=5, team_preference=None, privy_token=None, session=None):
         """
         Initialize FarcasterAutoVote
         
@@ -136,57 +395,219 @@ class FarcasterAutoVote:
             max_fuel (int): Maximum fuel yang bisa digunakan (default: 5)
             team_preference (str): Preferensi tim - 'blue'/'biru', 'red'/'merah', atau None untuk auto-select terbaik
             privy_token (str): Token untuk Privy API
+            session (requests.Session): Session yang dipakai bersama (mis. _SHARED_SESSION). Jika None, bot membuat session sendiri
         """
         self.authorization_token = authorization_token
         self.privy_token = privy_token
         self.device_id = "BWlTSwbJOzW_A58ybrzqz6"  # Device ID dari endpoint.txt
-        self.session_id = str(int(time.time() * 1000) - random.randint(1000, 5000))  # Generate session ID
+        self.session_id = str(_time_ns() // 1_000_000 - random.randint(1000, 5000))  # Generate session ID
         self.user_id = "1284274"  # User ID dari endpoint.txt
         self.fuel_amount = fuel_amount
         self.max_fuel = max_fuel
         self.team_preference = team_preference.lower() if team_preference else None
-        self.base_headers = self._get_base_headers()
-        
-    def _get_base_headers(self):
-        """Generate headers dasar untuk request"""
-        return {
-            "accept": "*/*",
-            "accept-language": "en-US,en;q=0.9",
+        self._cache = {}  # url -> (monotonic timestamp, payload, etag)
+        self._fail_streak = 0  # jumlah vote gagal berturut-turut, untuk backoff retry
+        self.last_failure = None  # alasan vote terakhir gagal: "window_closed", "overload", "server", "rejected"
+        self._uuid_pool = collections.deque()  # UUID siap pakai; popleft aman dipanggil dari thread tracking
+        self._refill_uuid_pool()
+        # Header khusus akun untuk request ke client.farcaster.xyz (bagian statis ada di session)
+        self.base_headers = {
             "authorization": f"Bearer {self.authorization_token}",
             "content-type": "application/json; charset=utf-8",
             "fc-amplitude-device-id": self.device_id,
-            "fc-amplitude-session-id": self.session_id,
-            "priority": "u=1, i",
-            "sec-ch-ua": '"Not;A=Brand";v="99", "Microsoft Edge";v="139", "Chromium";v="139"',
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": '"Windows"',
-            "sec-fetch-dest": "empty",
-            "sec-fetch-mode": "cors",
-            "sec-fetch-site": "same-site",
-            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36 Edg/139.0.0.0"
+            "fc-amplitude-session-id": self.session_id
+        }
+        # Bagian konstan header request bertrace (mini-app-event, cast); per call cukup overlay id baru
+        self._cast_header_static = MappingProxyType({
+            **self.base_headers,
+            "x-datadog-origin": "rum",
+            "x-datadog-sampling-priority": "1"
+        })
+        # Header untuk versus-prod-api, dibuat sekali lalu dipakai ulang di semua helper share/claim
+        self._api_headers_accept = MappingProxyType({
+            "Authorization": f"Bearer {self.authorization_token}",
+            "Accept": "application/json",
+            "User-Agent": _API_USER_AGENT
+        })
+        self._api_headers_json = MappingProxyType({
+            **self._api_headers_accept,
+            "Content-Type": "application/json"
+        })
+        # Kerangka event amplitude; per kirim cukup .copy() lalu isi field yang berubah
+        self._amp_event_template = {
+            "device_id": self.device_id,
+            "user_id": self.user_id,
+            "timestamp": None,
+            "event_id": None,
+            "session_id": self.session_id,
+            "event_type": None,
+            "version_name": None,
+            "platform": "Web",
+            "os_name": "Edge",
+            "os_version": "139",
+            "device_model": "Windows",
+            "device_manufacturer": None,
+            "language": "en-US",
+            "api_properties": {},
+            "event_properties": None,
+            "user_properties": {},
+            "uuid": None,
+            "library": {
+                "name": "amplitude-js",
+                "version": "8.21.9"
+            },
+            "sequence_number": None,
+            "groups": {},
+            "group_properties": {},
+            "user_agent": self._STATIC_HEADERS["user-agent"],
+            "partner_id": None
+        }
+        self._amp_evprop_template = {
+            "action": None,
+            "frameDomain": "versus.wreckleague.xyz",
+            "frameName": "Wreck League Versus",
+            "alreadyFavorited": True,
+            "path": "/miniapps",
+            "warpcastPlatform": "web"
+        }
+        # Properti event cast message tidak pernah berubah (sesuai share_endpoint.txt)
+        self._cast_evprop_template = {
+            "is reply": False,
+            "is channel": False,
+            "channel name": "",
+            "is long cast": False,
+            "is from intent": True,
+            "is caststrorm": 1,
+            "is scheduled": False,
+            "warpcastPlatform": "web"
         }
+        
+        # Satu session untuk semua request supaya koneksi TCP/TLS di-reuse;
+        # session hanya ditutup oleh close() jika dibuat sendiri oleh instance ini
+        self._owns_session = session is None
+        self.session = self.get_session() if session is None else session
+        self._tracking_executor = _TRACKING_EXECUTOR
+        # Buffer event amplitude per checksum; sisa buffer dikirim saat close/GC/exit
+        self._amp_buffer = {}
+        self._amp_lock = threading.Lock()
+        self._amp_finalizer = weakref.finalize(self, _flush_amplitude_buffer, self.session, self._amp_buffer, self._amp_lock)
+    
+    @classmethod
+    def get_session(cls):
+        """Buat requests.Session dengan connection pool, retry, dan header browser statis"""
+        # GET di-retry untuk semua error transient; PUT/POST hanya untuk 503 (lihat _WriteSafeRetry),
+        # read error PUT/POST tidak di-retry supaya vote / cast tidak terkirim dua kali
+        retry = _WriteSafeRetry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"GET", "HEAD", "OPTIONS"}),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        session = requests.Session()
+        session.mount("https://", _TimeoutHTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+        session.headers.update(cls._STATIC_HEADERS)
+        return session
+    
+    def close(self):
+        """Kirim sisa event amplitude lalu tutup session HTTP (jika milik instance ini)"""
+        self._amp_finalizer()
+        if self._owns_session:
+            self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def track_in_background(self, func, *args, **kwargs):
+        """Submit fungsi tracking ke executor background, return Future tanpa menunggu"""
+        future = self._tracking_executor.submit(func, *args, **kwargs)
+        future.add_done_callback(_log_tracking_result)
+        return future
+    
+    def fetch_concurrently(self, *calls):
+        """Jalankan beberapa request independen secara paralel, hasil sesuai urutan calls"""
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            futures = [executor.submit(call) for call in calls]
+            return [future.result() for future in futures]
+        
+    def _json(self, response):
+        """Decode body response JSON, pakai orjson/ujson jika tersedia"""
+        if orjson is not None:
+            return orjson.loads(response.content)
+        if ujson is not None:
+            return ujson.loads(response.content)
+        return response.json()
+    
+    def _cached_get(self, url, headers=None, ttl=2.0):
+        """GET JSON dengan cache singkat + revalidasi ETag per URL, return (status_code, data)"""
+        entry = self._cache.get(url)
+        if entry is not None:
+            if time.monotonic() - entry[0] < ttl:
+                return 200, entry[1]
+            if entry[2]:
+                # Kirim ETag terakhir, server balas 304 tanpa body jika belum berubah
+                headers = {**headers, "if-none-match": entry[2]} if headers else {"if-none-match": entry[2]}
+        
+        response = self.session.get(url, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            self._cache[url] = (time.monotonic(), entry[1], entry[2])
+            return 304, entry[1]
+        if response.status_code != 200:
+            return response.status_code, None
+        data = self._json(response)
+        self._cache[url] = (time.monotonic(), data, response.headers.get('ETag'))
+        return 200, data
+    
+    def retry_delay(self):
+        """Delay sebelum retry vote: exponential backoff + jitter, streak gagal naik setiap dipanggil"""
+        delay = min(_RETRY_BASE_SECONDS * 2 ** self._fail_streak, _RETRY_CAP_SECONDS)
+        self._fail_streak += 1
+        return delay + random.uniform(0, _RETRY_JITTER_SECONDS)
+    
+    def invalidate_cache(self):
+        """Tandai semua response cache kadaluarsa; ETag tetap disimpan untuk revalidasi 304"""
+        for url, (_, data, etag) in list(self._cache.items()):
+            self._cache[url] = (float('-inf'), data, etag)
+    
+    def _refill_uuid_pool(self):
+        """Isi pool dengan _UUID_POOL_SIZE UUID v4 yang sudah diformat, dari satu os.urandom"""
+        buf = os.urandom(16 * _UUID_POOL_SIZE).hex()
+        # Set version (4) dan variant (10xx) sesuai RFC 4122
+        self._uuid_pool.extend(
+            f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{'89ab'[int(h[16], 16) & 3]}{h[17:20]}-{h[20:]}"
+            for h in (buf[i:i + 32] for i in range(0, len(buf), 32))
+        )
     
     def _generate_uuid(self):
         """Generate UUID untuk request"""
-        return str(uuid.uuid4())
+        try:
+            return self._uuid_pool.popleft()
+        except IndexError:
+            self._refill_uuid_pool()
+            return self._uuid_pool.popleft()
     
-    def _generate_idempotency_key(self):
-        """Generate idempotency key"""
-        return str(uuid.uuid4())
+    # Idempotency key diambil langsung dari pool UUID yang sama (tanpa frame pembungkus)
+    _generate_idempotency_key = _generate_uuid
+    
+    def _traced_headers(self):
+        """Header dengan idempotency-key + trace id baru di atas _cast_header_static (tanpa copy)"""
+        dynamic = _trace_headers()
+        dynamic["idempotency-key"] = self._generate_idempotency_key()
+        return collections.ChainMap(dynamic, self._cast_header_static)
     
     def get_frame_info(self, domain="versus.wreckleague.xyz"):
         """Mendapatkan informasi frame"""
         try:
             url = f"https://client.farcaster.xyz/v1/frame?domain={domain}"
-            headers = self.base_headers.copy()
-            headers["if-none-match"] = 'W/"hmuRfiKTIpNKs+g2C7YFhVWoFX4="'
-            
-            response = requests.get(url, headers=headers)
-            print(f"Frame info response status: {response.status_code}")
             
-            if response.status_code == 200:
-                return response.json()
-            return None
+            # ttl=0: selalu revalidasi ke server, body di-reuse saat 304
+            status_code, data = self._cached_get(url, self.base_headers, ttl=0)
+            logger.debug("Frame info response status: %s", status_code)
+            return data
         except Exception as e:
             print(f"Error getting frame info: {e}")
             return None
@@ -195,13 +616,7 @@ class FarcasterAutoVote:
         """Send mini app event"""
         try:
             url = "https://client.farcaster.xyz/v2/mini-app-event"
-            headers = self.base_headers.copy()
-            headers["idempotency-key"] = self._generate_idempotency_key()
-            headers["traceparent"] = f"00-000000000000000000{random.randint(100000000000, 999999999999)}-{random.randint(1000000000000000, 9999999999999999):x}-01"
-            headers["x-datadog-origin"] = "rum"
-            headers["x-datadog-parent-id"] = str(random.randint(1000000000000000000, 9999999999999999999))
-            headers["x-datadog-sampling-priority"] = "1"
-            headers["x-datadog-trace-id"] = str(random.randint(1000000000000000, 9999999999999999999))
+            headers = self._traced_headers()
             
             payload = {
                 "domain": domain,
@@ -209,8 +624,8 @@ class FarcasterAutoVote:
                 "platformType": "web"
             }
             
-            response = requests.put(url, headers=headers, json=payload)
-            print(f"Mini app event response status: {response.status_code}")
+            response = self.session.put(url, headers=headers, json=payload)
+            logger.debug("Mini app event response status: %s", response.status_code)
             return response.status_code == 200
         except Exception as e:
             print(f"Error sending mini app event: {e}")
@@ -222,89 +637,30 @@ class FarcasterAutoVote:
             fid = fid or self.user_id
             url = f"https://versus-prod-api.wreckleague.xyz/v1/match/details?fId={fid}"
             
-            headers = {
-                "accept": "*/*",
-                "accept-language": "en-US,en;q=0.9",
-                "if-none-match": 'W/"100b-Y/gj6927mGNPyq8v7gTfbP0qRuM"',
-                "priority": "u=1, i",
-                "sec-ch-ua": '"Not;A=Brand";v="99", "Microsoft Edge";v="139", "Chromium";v="139"',
-                "sec-ch-ua-mobile": "?0",
-                "sec-ch-ua-platform": '"Windows"',
-                "sec-fetch-dest": "empty",
-                "sec-fetch-mode": "cors",
-                "sec-fetch-site": "same-site",
-                "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36 Edg/139.0.0.0"
-            }
-            
-            response = requests.get(url, headers=headers)
-            print(f"Match details response status: {response.status_code}")
-            
-            if response.status_code == 200:
-                return response.json()
-            return None
+            status_code, data = self._cached_get(url, ttl=_MATCH_TTL_SECONDS)
+            logger.debug("Match details response status: %s", status_code)
+            return data
         except Exception as e:
             print(f"Error getting match details: {e}")
             return None
     
     def get_latest_match_id(self, fid=None):
-        """Mendapatkan match ID terbaru yang tersedia"""
+        """Mendapatkan match ID terbaru dari payload match details yang sudah di-cache"""
         try:
-            fid = fid or self.user_id
-            # Coba endpoint untuk list match atau active match
-            url = f"https://versus-prod-api.wreckleague.xyz/v1/match/details?fId={fid}"
-            
-            headers = {
-                "accept": "*/*",
-                "accept-language": "en-US,en;q=0.9",
-                "priority": "u=1, i",
-                "sec-ch-ua": '"Not;A=Brand";v="99", "Microsoft Edge";v="139", "Chromium";v="139"',
-                "sec-ch-ua-mobile": "?0",
-                "sec-ch-ua-platform": '"Windows"',
-                "sec-fetch-dest": "empty",
-                "sec-fetch-mode": "cors",
-                "sec-fetch-site": "same-site",
-                "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36 Edg/139.0.0.0"
-            }
-            
-            response = requests.get(url, headers=headers)
-            print(f"🔍 Checking for latest match... Status: {response.status_code}")
+            data = self.get_match_details(fid)
+            if not data or 'data' not in data:
+                return None
             
-            if response.status_code == 200:
-                data = response.json()
-                print(f"🔍 Debug response structure: {json.dumps(data, indent=2)[:500]}...")
-                
-                if data.get('data') and data['data'].get('matchDetails'):
-                    match_details = data['data']['matchDetails']
-                    if isinstance(match_details, list) and len(match_details) > 0:
-                        # Ambil match ID dari match pertama (biasanya yang terbaru)
-                        latest_match = match_details[0]
-                        match_id = latest_match.get('matchId')
-                        if match_id:
-                            print(f"✅ Found latest match ID: {match_id}")
-                            return match_id
-                        else:
-                            print("⚠️ No match ID found in response")
-                    else:
-                        print("⚠️ No match details available")
-                elif data.get('data') and data['data'].get('matchData'):
-                    # Coba struktur alternatif
-                    match_data = data['data']['matchData']
-                    if isinstance(match_data, list) and len(match_data) > 0:
-                        latest_match = match_data[0]
-                        match_id = latest_match.get('_id')
-                        if match_id:
-                            print(f"✅ Found latest match ID from matchData: {match_id}")
-                            return match_id
-                        else:
-                            print("⚠️ No _id found in matchData")
-                    else:
-                        print("⚠️ No match data available")
-                else:
-                    print("⚠️ No match data in response")
+            match_details = data['data'].get('matchDetails') or []
+            if match_details and match_details[0].get('matchId'):
+                match_id = match_details[0]['matchId']
             else:
-                print(f"❌ Failed to get latest match: {response.status_code}")
+                match_data = data['data'].get('matchData') or []
+                match_id = match_data[0].get('_id') if match_data else None
             
-            return None
+            if match_id:
+                print(f"✅ Found latest match ID: {match_id}")
+            return match_id
         except Exception as e:
             print(f"❌ Error getting latest match ID: {e}")
             return None
@@ -317,80 +673,61 @@ class FarcasterAutoVote:
             mech_details (list): List detail mech dari match
             
         Returns:
-            dict: Mech yang dipilih
+            tuple: (index, mech) yang dipilih, atau (None, None) jika kosong
         """
         if not mech_details:
-            return None
+            return None, None
             
         if len(mech_details) == 1:
-            return mech_details[0]
+            return 0, mech_details[0]
         
-        # Jika ada preferensi tim
-        if self.team_preference:
-            # Coba identifikasi tim berdasarkan posisi atau data
-            for i, mech in enumerate(mech_details):
-                team_indicator = ""
-                
+        wanted_team = None
+        if self.team_preference in ['blue', 'biru', 'kanan', 'right']:
+            wanted_team = "blue"
+        elif self.team_preference in ['red', 'merah', 'kiri', 'left']:
+            wanted_team = "red"
+        
+        # Satu pass: cek preferensi tim sekaligus hitung skor strategy terbaik
+        # Prioritas skor: 1. Winning probability, 2. Vote count, 3. Fuel points
+        best_index, best_score = 0, None
+        for i, mech in enumerate(mech_details):
+            if wanted_team:
                 # CORRECTED MAPPING berdasarkan info user:
                 # Biru = Kanan (index 1), Merah = Kiri (index 0)
-                if i == 0:
-                    team_indicator = "red"   # Index 0 = Kiri = Merah
-                elif i == 1:
-                    team_indicator = "blue"  # Index 1 = Kanan = Biru
+                team_indicator = "red" if i == 0 else ("blue" if i == 1 else "")
                 
                 # Cek berdasarkan field mechType jika ada
-                if 'mechType' in mech:
-                    if mech['mechType'] == 'left':
-                        team_indicator = "red"   # Left = Merah
-                    elif mech['mechType'] == 'right':
-                        team_indicator = "blue"  # Right = Biru
+                mech_type = mech.get('mechType')
+                if mech_type == 'left':
+                    team_indicator = "red"   # Left = Merah
+                elif mech_type == 'right':
+                    team_indicator = "blue"  # Right = Biru
                 
-                # Cek berdasarkan publicPossession (yang lebih kecil biasanya merah/kiri)
-                if not team_indicator and 'publicPossession' in mech:
-                    possession = mech.get('publicPossession', 50)
-                    # Tidak reliable untuk mapping, skip ini
-                
-                # Match dengan preferensi user (CORRECTED)
-                if (self.team_preference in ['blue', 'biru', 'kanan', 'right'] and team_indicator == "blue") or \
-                   (self.team_preference in ['red', 'merah', 'kiri', 'left'] and team_indicator == "red"):
+                if team_indicator == wanted_team:
                     print(f"🎯 Selected mech by team preference: {self.team_preference} -> {mech['mechId']}")
                     print(f"   Team: {team_indicator.upper()} (Index: {i})")
-                    return mech
-        
-        # Jika tidak ada preferensi atau tidak ditemukan, pilih yang terbaik
-        # Prioritas: 1. Winning probability, 2. Vote count, 3. Fuel points
-        best_mech = max(mech_details, key=lambda m: (
-            m.get('winningProbability', 0),
-            m.get('mechVotes', {}).get('voteCount', 0),
-            m.get('mechVotes', {}).get('fuelPoints', 0)
-        ))
+                    return i, mech
+            
+            votes = mech.get('mechVotes') or {}
+            score = (mech.get('winningProbability', 0), votes.get('voteCount', 0), votes.get('fuelPoints', 0))
+            if best_score is None or score > best_score:
+                best_index, best_score = i, score
         
+        # Tidak ada preferensi atau tidak ditemukan, pakai mech dengan skor terbaik
+        return best_index, mech_details[best_index]
+    
+    def _get_user_data_raw(self, fid=None):
+        """Ambil payload /v1/user/data, di-cache singkat supaya user data & fuel cukup satu request"""
+        fid = fid or self.user_id
+        url = f"https://versus-prod-api.wreckleague.xyz/v1/user/data?fId={fid}"
+        status_code, data = self._cached_get(url, ttl=_USER_DATA_TTL_SECONDS)
+        logger.debug("User data response status: %s", status_code)
+        return data
+    
     def get_user_data(self, fid=None):
         """Mendapatkan data user"""
         try:
-            fid = fid or self.user_id
-            url = f"https://versus-prod-api.wreckleague.xyz/v1/user/data?fId={fid}"
-            
-            headers = {
-                "accept": "*/*",
-                "accept-language": "en-US,en;q=0.9",
-                "if-none-match": 'W/"158-rOBHgTHczeddj//B7BCGN2xjD38"',
-                "priority": "u=1, i",
-                "sec-ch-ua": '"Not;A=Brand";v="99", "Microsoft Edge";v="139", "Chromium";v="139"',
-                "sec-ch-ua-mobile": "?0",
-                "sec-ch-ua-platform": '"Windows"',
-                "sec-fetch-dest": "empty",
-                "sec-fetch-mode": "cors",
-                "sec-fetch-site": "same-site",
-                "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36 Edg/139.0.0.0"
-            }
-            
-            response = requests.get(url, headers=headers)
-            print(f"User data response status: {response.status_code}")
-            
-            if response.status_code == 200:
-                return response.json()
-            return None
+            return self._get_user_data_raw(fid)
         except Exception as e:
             print(f"Error getting user data: {e}")
             return None
@@ -398,113 +735,30 @@ class FarcasterAutoVote:
     def get_user_fuel_info(self, fid=None):
         """Mendapatkan info fuel user"""
         try:
-            fid = fid or self.user_id
-            url = f"https://versus-prod-api.wreckleague.xyz/v1/user/data?fId={fid}"
-            
-            headers = {
-                "accept": "*/*",
-                "accept-language": "en-US,en;q=0.9",
-                "priority": "u=1, i",
-                "sec-ch-ua": '"Not;A=Brand";v="99", "Microsoft Edge";v="139", "Chromium";v="139"',
-                "sec-ch-ua-mobile": "?0",
-                "sec-ch-ua-platform": '"Windows"',
-                "sec-fetch-dest": "empty",
-                "sec-fetch-mode": "cors",
-                "sec-fetch-site": "same-site",
-                "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36 Edg/139.0.0.0"
-            }
-            
-            response = requests.get(url, headers=headers)
-            if response.status_code == 200:
-                data = response.json()
-                
-                # Berdasarkan response yang dilihat: data.data.fuelBalance
-                if 'data' in data and 'data' in data['data'] and 'fuelBalance' in data['data']['data']:
-                    fuel_info = data['data']['data']['fuelBalance']
-                    return fuel_info if fuel_info > 0 else 0
-                
-            return 0
+            return max(extract_fuel_balance(self._get_user_data_raw(fid)), 0)
         except Exception as e:
             return 0
-        """Mendapatkan data user"""
-        try:
-            fid = fid or self.user_id
-            url = f"https://versus-prod-api.wreckleague.xyz/v1/user/data?fId={fid}"
-            
-            headers = {
-                "accept": "*/*",
-                "accept-language": "en-US,en;q=0.9",
-                "if-none-match": 'W/"158-rOBHgTHczeddj//B7BCGN2xjD38"',
-                "priority": "u=1, i",
-                "sec-ch-ua": '"Not;A=Brand";v="99", "Microsoft Edge";v="139", "Chromium";v="139"',
-                "sec-ch-ua-mobile": "?0",
-                "sec-ch-ua-platform": '"Windows"',
-                "sec-fetch-dest": "empty",
-                "sec-fetch-mode": "cors",
-                "sec-fetch-site": "same-site",
-                "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36 Edg/139.0.0.0"
-            }
-            
-            response = requests.get(url, headers=headers)
-            print(f"User data response status: {response.status_code}")
-            
-            if response.status_code == 200:
-                return response.json()
-            return None
-        except Exception as e:
-            print(f"Error getting user data: {e}")
-            return None
-        """Mendapatkan data user"""
-        try:
-            fid = fid or self.user_id
-            url = f"https://versus-prod-api.wreckleague.xyz/v1/user/data?fId={fid}"
-            
-            headers = {
-                "accept": "*/*",
-                "accept-language": "en-US,en;q=0.9",
-                "if-none-match": 'W/"158-rOBHgTHczeddj//B7BCGN2xjD38"',
-                "priority": "u=1, i",
-                "sec-ch-ua": '"Not;A=Brand";v="99", "Microsoft Edge";v="139", "Chromium";v="139"',
-                "sec-ch-ua-mobile": "?0",
-                "sec-ch-ua-platform": '"Windows"',
-                "sec-fetch-dest": "empty",
-                "sec-fetch-mode": "cors",
-                "sec-fetch-site": "same-site",
-                "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36 Edg/139.0.0.0"
-            }
-            
-            response = requests.get(url, headers=headers)
-            print(f"User data response status: {response.status_code}")
-            
-            if response.status_code == 200:
-                return response.json()
-            return None
-        except Exception as e:
-            print(f"Error getting user data: {e}")
-            return None
     
+    @retry_on_overload()
     def submit_prediction(self, fid=None, mech_id=None, match_id=None, fuel_points=None):
         """Submit prediction/vote dengan fuel points"""
         try:
             fid = fid or self.user_id
             
-            # Auto-detect latest match ID jika tidak disediakan
-            if not match_id:
-                print("🔍 Auto-detecting latest match ID...")
-                match_id = self.get_latest_match_id(fid)
-                if not match_id:
-                    print("❌ Could not auto-detect match ID")
-                    return False
-                print(f"✅ Using auto-detected match ID: {match_id}")
-            
-            # Ambil match details untuk data terbaru  
+            # Satu fetch match details (cached) untuk match ID sekaligus data terbaru
             match_details = self.get_match_details(fid)
             if not match_details or 'data' not in match_details or not match_details['data']['matchData']:
                 print("❌ No active match found")
+                self.last_failure = "window_closed"
                 return False
 
             current_match = match_details['data']['matchData'][0]
             
+            # Auto-detect latest match ID jika tidak disediakan
+            if not match_id:
+                match_id = current_match['_id']
+                print(f"✅ Using auto-detected match ID: {match_id}")
+            
             # Cek apakah sudah vote - tapi tetap lanjut karena bisa vote tim yang sama
             if current_match.get('isVoted', False):
                 print("ℹ️  Previous vote detected, checking if additional vote possible...")
@@ -524,19 +778,15 @@ class FarcasterAutoVote:
             # Pilih mech berdasarkan preferensi atau strategy
             if not mech_id and 'mechDetails' in current_match:
                 mech_details = current_match['mechDetails']
-                selected_mech = self.select_mech_by_preference(mech_details)
+                mech_index, selected_mech = self.select_mech_by_preference(mech_details)
                 
                 if selected_mech:
                     mech_id = selected_mech['mechId']
                     
                     # Tampilkan info mech yang dipilih
                     team_info = ""
-                    if len(mech_details) >= 2:
-                        mech_index = next((i for i, m in enumerate(mech_details) if m['mechId'] == mech_id), -1)
-                        if mech_index == 0:
-                            team_info = " (� Tim Merah/Kiri)"  # Index 0 = Merah = Kiri
-                        elif mech_index == 1:
-                            team_info = " (� Tim Biru/Kanan)"  # Index 1 = Biru = Kanan
+                    if len(mech_details) >= 2 and mech_index in (0, 1):
+                        team_info = _TEAM_LABELS[mech_index]
                     
                     print(f"🎯 Selected mech {mech_id}{team_info}")
                     print(f"   👤 Owner: {selected_mech['userData']['displayName']}")
@@ -582,20 +832,6 @@ class FarcasterAutoVote:
             
             url = "https://versus-prod-api.wreckleague.xyz/v2/matches/predict"
             
-            headers = {
-                "accept": "*/*",
-                "accept-language": "en-US,en;q=0.9",
-                "content-type": "application/json",
-                "priority": "u=1, i",
-                "sec-ch-ua": '"Not;A=Brand";v="99", "Microsoft Edge";v="139", "Chromium";v="139"',
-                "sec-ch-ua-mobile": "?0",
-                "sec-ch-ua-platform": '"Windows"',
-                "sec-fetch-dest": "empty",
-                "sec-fetch-mode": "cors",
-                "sec-fetch-site": "same-site",
-                "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36 Edg/139.0.0.0"
-            }
-            
             payload = {
                 "fId": int(fid),
                 "mechId": str(mech_id),
@@ -605,119 +841,94 @@ class FarcasterAutoVote:
             
             print(f"🚀 Submitting prediction with payload: {payload}")
             
-            response = requests.put(url, headers=headers, json=payload)
-            print(f"Prediction submission response status: {response.status_code}")
+            response = self.session.put(url, headers=_VERSUS_JSON_HEADERS, json=payload)
+            logger.debug("Prediction submission response status: %s", response.status_code)
             
             if response.status_code == 200:
-                result = response.json()
+                result = self._json(response)
                 print(f"✅ Prediction submitted successfully!")
                 print(f"📊 Result: {result}")
                 return True
-            else:
-                print(f"❌ Prediction submission failed with status {response.status_code}")
-                try:
-                    error_data = response.json()
-                    print(f"📄 Error details: {error_data}")
-                    
-                    # Cek jenis error
-                    if 'message' in error_data:
-                        error_msg = error_data['message']
-                        if "cannot powerup at this time" in error_msg.lower():
-                            print("ℹ️  Cannot powerup at this time")
-                            print("🔍 Possible reasons:")
-                            print("   - Voting window closed")
-                            print("   - Already voted for different team")
-                            print("   - Match ended")
-                            print("💡 Try selecting the SAME team you voted before")
-                        elif "already voted" in error_msg.lower():
-                            print("ℹ️  Already voted for this match")
-                            print("💡 You can vote again but only for the SAME team!")
-                            print("   - Biru = Kanan (Right)")
-                            print("   - Merah = Kiri (Left)")
-                        elif "insufficient fuel" in error_msg.lower():
-                            print("⛽ Insufficient fuel points")
-                        elif "invalid match" in error_msg.lower():
-                            print("🎯 Match might be inactive or ended")
-                        else:
-                            print(f"📝 Error message: {error_msg}")
-                except:
-                    print(f"📄 Raw response: {response.text}")
+            
+            print(f"❌ Prediction submission failed with status {response.status_code}")
+            if response.status_code == 429:
+                self.last_failure = "overload"
+                raise FarcasterOverloadError("HTTP 429 Too Many Requests")
+            self.last_failure = "server" if response.status_code >= 500 else "rejected"
+            
+            try:
+                error_data = self._json(response)
+            except ValueError:
+                print(f"📄 Raw response: {response.text}")
                 return False
+            print(f"📄 Error details: {error_data}")
+            
+            # Cek jenis error
+            error_msg = error_data.get('message', '') if isinstance(error_data, dict) else ''
+            error_lower = error_msg.lower()
+            if "cannot powerup" in error_lower or "rate limit" in error_lower:
+                print(f"ℹ️  {error_msg}")
+                self.last_failure = "overload"
+                raise FarcasterOverloadError(error_msg)
+            elif "already voted" in error_lower:
+                print("ℹ️  Already voted for this match")
+                print("💡 You can vote again but only for the SAME team!")
+                print("   - Biru = Kanan (Right)")
+                print("   - Merah = Kiri (Left)")
+            elif "insufficient fuel" in error_lower:
+                print("⛽ Insufficient fuel points")
+            elif "invalid match" in error_lower:
+                print("🎯 Match might be inactive or ended")
+                self.last_failure = "window_closed"
+            elif error_msg:
+                print(f"📝 Error message: {error_msg}")
+            return False
                 
+        except FarcasterOverloadError:
+            raise
         except Exception as e:
             print(f"Error submitting prediction: {e}")
+            self.last_failure = "server"
             return False
     
+    def _queue_amplitude_event(self, checksum, event_data):
+        """Masukkan event ke buffer amplitude lalu flush jika batch sudah penuh atau sudah terlalu lama.
+        Return True berarti event diterima (terkirim atau masih di-buffer), bukan bukti sudah sampai server"""
+        with self._amp_lock:
+            self._amp_buffer.setdefault(checksum, []).append(event_data)
+        return self.flush_amplitude()
+    
+    def flush_amplitude(self, force=False):
+        """Kirim buffer event amplitude jika sudah mencapai _AMP_BATCH_SIZE, event tertua lebih tua dari
+        _AMP_MAX_AGE_SECONDS, atau selalu jika force"""
+        if not force:
+            with self._amp_lock:
+                if not self._amp_buffer:
+                    return True
+                pending = sum(len(events) for events in self._amp_buffer.values())
+                oldest = min(events[0]["timestamp"] for events in self._amp_buffer.values())
+            age = _time_ns() // 1_000_000 - oldest
+            if pending < _AMP_BATCH_SIZE and age < _AMP_MAX_AGE_SECONDS * 1000:
+                return True
+        return _flush_amplitude_buffer(self.session, self._amp_buffer, self._amp_lock)
+    
     def send_amplitude_tracking(self, event_type="frame action", action="add mini app"):
-        """Send amplitude tracking event"""
+        """Send amplitude tracking event (di-buffer, dikirim per batch; True = event diterima buffer/terkirim)"""
         try:
-            url = "https://client.farcaster.xyz/v2/amp/api"
-            
-            headers = {
-                "accept": "*/*",
-                "accept-language": "en-US,en;q=0.9",
-                "content-type": "application/x-www-form-urlencoded; charset=UTF-8",
-                "cross-origin-resource-policy": "cross-origin",
-                "priority": "u=1, i",
-                "sec-ch-ua": '"Not;A=Brand";v="99", "Microsoft Edge";v="139", "Chromium";v="139"',
-                "sec-ch-ua-mobile": "?0",
-                "sec-ch-ua-platform": '"Windows"',
-                "sec-fetch-dest": "empty",
-                "sec-fetch-mode": "cors",
-                "sec-fetch-site": "same-site",
-                "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36 Edg/139.0.0.0"
-            }
-            
-            timestamp = int(time.time() * 1000)
-            event_id = random.randint(140, 200)
-            
-            event_data = {
-                "device_id": self.device_id,
-                "user_id": self.user_id,
-                "timestamp": timestamp,
-                "event_id": event_id,
-                "session_id": self.session_id,
-                "event_type": event_type,
-                "version_name": None,
-                "platform": "Web",
-                "os_name": "Edge",
-                "os_version": "139",
-                "device_model": "Windows",
-                "device_manufacturer": None,
-                "language": "en-US",
-                "api_properties": {},
-                "event_properties": {
-                    "action": action,
-                    "frameDomain": "versus.wreckleague.xyz",
-                    "frameName": "Wreck League Versus",
-                    "alreadyFavorited": True,
-                    "path": "/miniapps",
-                    "warpcastPlatform": "web"
-                },
-                "user_properties": {},
-                "uuid": self._generate_uuid(),
-                "library": {
-                    "name": "amplitude-js",
-                    "version": "8.21.9"
-                },
-                "sequence_number": event_id,
-                "groups": {},
-                "group_properties": {},
-                "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36 Edg/139.0.0.0",
-                "partner_id": None
-            }
-            
-            checksum = "c637ef550ee809550511f2993af810c3"  # Dapat digenerate atau hardcode
-            client = "7dd7b12861158f5e89ab5508bd9ce4c0"
-            
-            payload = f"checksum={checksum}&client={client}&e={quote(json.dumps([event_data]))}&upload_time={timestamp}&v=2"
-            
-            response = requests.post(url, headers=headers, data=payload)
-            print(f"Amplitude tracking response status: {response.status_code}")
-            
-            return response.status_code == 200
+            timestamp = _time_ns() // 1_000_000
+            event_id = 140 + _getrandbits(6) % 61
+            
+            event_data = self._amp_event_template.copy()
+            event_data["timestamp"] = timestamp
+            event_data["event_id"] = event_id
+            event_data["event_type"] = event_type
+            event_data["event_properties"] = {**self._amp_evprop_template, "action": action}
+            event_data["uuid"] = self._generate_uuid()
+            event_data["sequence_number"] = event_id
+            
+            return self._queue_amplitude_event(_AMP_CHECKSUM_FRAME, event_data)
         except Exception as e:
-            print(f"Error sending amplitude tracking: {e}")
+            logger.warning("Error sending amplitude tracking: %s", e)
             return False
     
     def trigger_share_task(self):
@@ -726,196 +937,117 @@ class FarcasterAutoVote:
             # Endpoint untuk trigger analysis task (dari share_endpoint.txt)
             url = "https://versus-prod-api.wreckleague.xyz/v1/analysis"
             
-            headers = {
-                "Authorization": f"Bearer {self.authorization_token}",
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-            
-            print(f"🎯 Triggering share task...")
-            response = requests.post(url, headers=headers)
+            logger.info("🎯 Triggering share task...")
+            response = self.session.post(url, headers=self._api_headers_json)
             
             if response.status_code == 200:
-                print(f"   ✅ Share task triggered successfully")
+                logger.info("   ✅ Share task triggered successfully")
                 return True
             else:
-                print(f"   ❌ Failed to trigger share task: {response.status_code}")
+                logger.warning("   ❌ Failed to trigger share task: %s", response.status_code)
                 return False
                 
         except Exception as e:
-            print(f"   ❌ Error triggering share task: {e}")
+            logger.warning("   ❌ Error triggering share task: %s", e)
             return False
 
+    def _post_cast(self, custom_text=None, *, send_tracking=True):
+        """Post cast promosi (text custom atau variasi random), return True jika berhasil"""
+        url = "https://client.farcaster.xyz/v2/casts"
+        
+        # Template text atau custom
+        cast_text = custom_text or random.choice(_TEXT_VARIATIONS)
+        embed = f"https://versus.wreckleague.xyz/{self.user_id}"
+        payload = {
+            "text": cast_text,
+            "embeds": [embed]
+        }
+        
+        logger.info("📝 Posting promotional cast...")
+        logger.info("   Text: %s...", cast_text[:50])
+        logger.info("   Embed: %s", embed)
+        
+        # Headers berdasarkan data di share_endpoint.txt
+        response = self.session.post(url, headers=self._traced_headers(), json=payload)
+        logger.debug("Cast submission response status: %s", response.status_code)
+        
+        if response.status_code in [200, 201]:  # 200 OK atau 201 Created
+            logger.info("✅ Cast posted successfully!")
+            
+            if send_tracking:
+                # Tambahkan tracking untuk cast message (dari share_endpoint.txt)
+                self.track_in_background(self.send_cast_tracking)
+            
+            # Body hanya dipakai untuk detail cast, jadi tidak di-parse kalau output info mati
+            if logger.isEnabledFor(logging.INFO):
+                result = self._json(response)
+                if 'result' in result and 'cast' in result['result']:
+                    cast_info = result['result']['cast']
+                    logger.info("📊 Cast details:")
+                    logger.info("   🆔 Cast hash: %s", cast_info.get('hash', 'Unknown'))
+                    logger.info("   👤 Author: %s", cast_info.get('author', {}).get('username', 'Unknown'))
+                    logger.info("   📅 Timestamp: %s", cast_info.get('timestamp', 'Unknown'))
+                    logger.info("   📝 Text: %s...", cast_info.get('text', 'Unknown')[:50])
+            
+            return True
+        
+        logger.warning("❌ Cast submission failed with status %s", response.status_code)
+        raw = response.content.lower()
+        for marker, hint in _CAST_ERR_MARKERS:
+            if marker in raw:
+                logger.info(hint)
+                return False
+        
+        # Error tidak dikenal: baru parse JSON untuk detail
+        try:
+            error_data = self._json(response)
+            logger.warning("📄 Error details: %s", error_data)
+            
+            if 'message' in error_data:
+                logger.warning("📝 Error message: %s", error_data['message'])
+        except:
+            logger.warning("📄 Raw response: %s", response.text)
+        return False
+    
     def auto_share_cast(self, custom_text=None):
         """Auto share cast workflow: trigger task dulu, lalu post cast untuk dapat like"""
         try:
             # Step 1: Trigger share task dulu
+            trigger_sent = time.monotonic()
             if not self.trigger_share_task():
-                print("❌ Failed to trigger share task, skipping cast posting")
+                logger.warning("❌ Failed to trigger share task, skipping cast posting")
                 return False
-                
-            # Delay sebentar
-            time.sleep(2)
             
-            # Step 2: Post cast untuk promosi dan dapat like
-            url = "https://client.farcaster.xyz/v2/casts"
-            
-            # Headers berdasarkan data di share_endpoint.txt
-            headers = self.base_headers.copy()
-            headers.update({
-                "idempotency-key": self._generate_idempotency_key(),
-                "traceparent": f"00-000000000000000000{random.randint(100000000000, 999999999999)}-{random.randint(1000000000000000, 9999999999999999):x}-01",
-                "x-datadog-origin": "rum",
-                "x-datadog-parent-id": str(random.randint(1000000000000000000, 9999999999999999999)),
-                "x-datadog-sampling-priority": "1",
-                "x-datadog-trace-id": str(random.randint(1000000000000000, 9999999999999999999))
-            })
-            
-            # Template text atau custom
-            if custom_text:
-                cast_text = custom_text
-            else:
-                # Random variasi text dengan typo natural untuk avoid spam detection
-                text_variations = [
-                    "Help me get Fuel by likeing this cast!\n5 Likes = 1 Fuel🔋\nSupport my mech battles in Wreck League Versus 🤖 by @towerecosystem",
-                    "Pls help me get Fuel by liking this cast!\n5 Like = 1 Fuel🔋\nSuport my mech battles in Wreck League Versus 🤖 by @towerecosystem", 
-                    "Help me get Fuel by likng this cast!\n5 Likes = 1 Fuel🔋\nSupport my mech batles in Wreck League Versus 🤖 by @towerecosystem",
-                    "Help me get Fuel by liking this cast pls!\n5 Likes = 1 Fuel🔋\nSupport my mech battles in Wreck League Versus 🤖 by @towerecosystem",
-                    "Help me get Fuel by liking this cast!\n5 Likes = 1 Fuel🔋\nSupport my mech battles in Wreck League Versus 🤖 by @towerecosystem thx!",
-                    "Hlp me get Fuel by liking this cast!\n5 Likes = 1 Fuel🔋\nSupport my mech battles in Wreck League Versus 🤖 by @towerecosystem",
-                    "Help me get Fuel by liking this cast!\n5 likes = 1 fuel🔋\nSupport my mech battles in Wreck League Versus 🤖 by @towerecosystem",
-                    "Help me get Fuel by likeing this cast plz!\n5 Likes = 1 Fuel🔋\nSupport my mech battles in Wreck League Versus 🤖 by @towerecosystem"
-                ]
-                cast_text = random.choice(text_variations)
-            
-            # Payload
-            payload = {
-                "text": cast_text,
-                "embeds": [f"https://versus.wreckleague.xyz/{self.user_id}"]
-            }
-            
-            print(f"📝 Posting promotional cast...")
-            print(f"   Text: {cast_text[:50]}...")
-            print(f"   Embed: https://versus.wreckleague.xyz/{self.user_id}")
-            
-            response = requests.post(url, headers=headers, json=payload)
-            print(f"Cast submission response status: {response.status_code}")
+            # Delay sebentar: sisa jeda settle setelah round-trip trigger
+            remaining = _SHARE_SETTLE_SECONDS - (time.monotonic() - trigger_sent)
+            if remaining > 0:
+                time.sleep(remaining)
             
-            if response.status_code in [200, 201]:  # 200 OK atau 201 Created
-                result = response.json()
-                print("✅ Cast posted successfully!")
-                
-                # Tambahkan tracking untuk cast message (dari share_endpoint.txt)
-                self.send_cast_tracking()
-                
-                if 'result' in result and 'cast' in result['result']:
-                    cast_info = result['result']['cast']
-                    print(f"📊 Cast details:")
-                    print(f"   🆔 Cast hash: {cast_info.get('hash', 'Unknown')}")
-                    print(f"   👤 Author: {cast_info.get('author', {}).get('username', 'Unknown')}")
-                    print(f"   📅 Timestamp: {cast_info.get('timestamp', 'Unknown')}")
-                    print(f"   📝 Text: {cast_info.get('text', 'Unknown')[:50]}...")
-                    
-                return True
-            else:
-                print(f"❌ Cast submission failed with status {response.status_code}")
-                try:
-                    error_data = response.json()
-                    print(f"📄 Error details: {error_data}")
-                    
-                    if 'message' in error_data:
-                        error_msg = error_data['message']
-                        if "duplicate" in error_msg.lower():
-                            print("ℹ️  Duplicate cast detected - you recently posted similar content")
-                        elif "rate limit" in error_msg.lower():
-                            print("ℹ️  Rate limited - please wait before posting again")
-                        elif "invalid" in error_msg.lower():
-                            print("ℹ️  Invalid cast format")
-                        else:
-                            print(f"📝 Error message: {error_msg}")
-                except:
-                    print(f"📄 Raw response: {response.text}")
-                return False
+            # Step 2: Post cast untuk promosi dan dapat like
+            return self._post_cast(custom_text, send_tracking=True)
                 
         except Exception as e:
-            print(f"Error posting cast: {e}")
+            logger.warning("Error posting cast: %s", e)
             return False
     
     def send_cast_tracking(self):
-        """Send tracking untuk cast message berdasarkan share_endpoint.txt"""
+        """Send tracking untuk cast message berdasarkan share_endpoint.txt (di-buffer, dikirim per batch; True = event diterima buffer/terkirim)"""
         try:
-            url = "https://client.farcaster.xyz/v2/amp/api"
-            
-            headers = {
-                "accept": "*/*",
-                "accept-language": "en-US,en;q=0.9",
-                "content-type": "application/x-www-form-urlencoded; charset=UTF-8",
-                "cross-origin-resource-policy": "cross-origin",
-                "priority": "u=1, i",
-                "sec-ch-ua": '"Not;A=Brand";v="99", "Microsoft Edge";v="139", "Chromium";v="139"',
-                "sec-ch-ua-mobile": "?0",
-                "sec-ch-ua-platform": '"Windows"',
-                "sec-fetch-dest": "empty",
-                "sec-fetch-mode": "cors",
-                "sec-fetch-site": "same-site",
-                "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36 Edg/139.0.0.0"
-            }
-            
-            timestamp = int(time.time() * 1000)
-            event_id = random.randint(150, 200)
+            timestamp = _time_ns() // 1_000_000
+            event_id = 150 + _getrandbits(6) % 51
             
             # Event data berdasarkan format di share_endpoint.txt
-            event_data = {
-                "device_id": self.device_id,
-                "user_id": self.user_id,
-                "timestamp": timestamp,
-                "event_id": event_id,
-                "session_id": self.session_id,
-                "event_type": "cast message",  # Sesuai share_endpoint.txt
-                "version_name": None,
-                "platform": "Web",
-                "os_name": "Edge",
-                "os_version": "139",
-                "device_model": "Windows",
-                "device_manufacturer": None,
-                "language": "en-US",
-                "api_properties": {},
-                "event_properties": {
-                    "is reply": False,
-                    "is channel": False,
-                    "channel name": "",
-                    "is long cast": False,
-                    "is from intent": True,
-                    "is caststrorm": 1,
-                    "is scheduled": False,
-                    "warpcastPlatform": "web"
-                },
-                "user_properties": {},
-                "uuid": self._generate_uuid(),
-                "library": {
-                    "name": "amplitude-js",
-                    "version": "8.21.9"
-                },
-                "sequence_number": event_id,
-                "groups": {},
-                "group_properties": {},
-                "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36 Edg/139.0.0.0",
-                "partner_id": None
-            }
-            
-            # Checksum dari share_endpoint.txt
-            checksum = "164f2070e0f5360795d082772f7b168e"
-            client = "7dd7b12861158f5e89ab5508bd9ce4c0"
-            
-            payload = f"checksum={checksum}&client={client}&e={quote(json.dumps([event_data]))}&upload_time={timestamp}&v=2"
-            
-            response = requests.post(url, headers=headers, data=payload)
-            print(f"Cast tracking response status: {response.status_code}")
-            
-            return response.status_code == 200
+            event_data = self._amp_event_template.copy()
+            event_data["timestamp"] = timestamp
+            event_data["event_id"] = event_id
+            event_data["event_type"] = "cast message"  # Sesuai share_endpoint.txt
+            event_data["event_properties"] = self._cast_evprop_template
+            event_data["uuid"] = self._generate_uuid()
+            event_data["sequence_number"] = event_id
+            
+            return self._queue_amplitude_event(_AMP_CHECKSUM_CAST, event_data)
         except Exception as e:
-            print(f"Error sending cast tracking: {e}")
+            logger.warning("Error sending cast tracking: %s", e)
             return False
     
     def claim_fuel_reward(self):
@@ -924,33 +1056,26 @@ class FarcasterAutoVote:
             # Endpoint untuk claim fuel reward
             url = f"https://versus-prod-api.wreckleague.xyz/v1/user/fuelReward?fId={self.user_id}"
             
-            headers = {
-                "Authorization": f"Bearer {self.authorization_token}",
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-            
-            print(f"⛽ Claiming fuel reward...")
-            response = requests.post(url, headers=headers)
+            logger.info("⛽ Claiming fuel reward...")
+            response = self.session.post(url, headers=self._api_headers_json)
             
             if response.status_code == 200:
-                result = response.json()
-                print(f"   ✅ Fuel reward claimed successfully!")
+                result = self._json(response)
+                logger.info("   ✅ Fuel reward claimed successfully!")
                 if 'fuel' in result:
-                    print(f"   ⛽ New fuel amount: {result['fuel']}")
+                    logger.info("   ⛽ New fuel amount: %s", result['fuel'])
                 return True
             else:
-                print(f"   ❌ Failed to claim fuel reward: {response.status_code}")
+                logger.warning("   ❌ Failed to claim fuel reward: %s", response.status_code)
                 try:
-                    error_data = response.json()
-                    print(f"   📄 Error: {error_data}")
-                except:
-                    print(f"   📄 Raw response: {response.text}")
+                    error_data = self._json(response)
+                    logger.warning("   📄 Error: %s", error_data)
+                except ValueError:
+                    logger.warning("   📄 Raw response: %s", response.text)
                 return False
                 
         except Exception as e:
-            print(f"   ❌ Error claiming fuel reward: {e}")
+            logger.warning("   ❌ Error claiming fuel reward: %s", e)
             return False
     
     def check_share_details(self):
@@ -959,23 +1084,16 @@ class FarcasterAutoVote:
             # Coba endpoint fuel reward untuk detail share
             url = f"https://versus-prod-api.wreckleague.xyz/v1/user/fuelReward?fId={self.user_id}"
             
-            headers = {
-                "Authorization": f"Bearer {self.authorization_token}",
-                "Accept": "application/json",
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-            
-            response = requests.get(url, headers=headers)
+            response = self.session.get(url, headers=self._api_headers_accept)
             
             if response.status_code == 200:
-                result = response.json()
-                return result
+                return self._json(response)
             else:
-                print(f"Failed to check share details: {response.status_code}")
+                logger.warning("Failed to check share details: %s", response.status_code)
                 return None
                 
         except Exception as e:
-            print(f"Error checking share details: {e}")
+            logger.warning("Error checking share details: %s", e)
             return None
 
     def check_fuel_status(self):
@@ -984,23 +1102,16 @@ class FarcasterAutoVote:
             # Endpoint untuk get fuel status
             url = f"https://versus-prod-api.wreckleague.xyz/v1/user/data?fId={self.user_id}"
             
-            headers = {
-                "Authorization": f"Bearer {self.authorization_token}",
-                "Accept": "application/json",
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-            
-            response = requests.get(url, headers=headers)
+            response = self.session.get(url, headers=self._api_headers_accept)
             
             if response.status_code == 200:
-                result = response.json()
-                return result
+                return self._json(response)
             else:
-                print(f"Failed to check fuel status: {response.status_code}")
+                logger.warning("Failed to check fuel status: %s", response.status_code)
                 return None
                 
         except Exception as e:
-            print(f"Error checking fuel status: {e}")
+            logger.warning("Error checking fuel status: %s", e)
             return None
 
     def try_different_triggers(self):
@@ -1032,70 +1143,74 @@ class FarcasterAutoVote:
             }
         ]
         
-        headers = {
-            "Authorization": f"Bearer {self.authorization_token}",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        }
+        headers = self._api_headers_json
         
-        print("🔍 TESTING DIFFERENT TRIGGER METHODS")
-        print("=" * 40)
+        logger.info("🔍 TESTING DIFFERENT TRIGGER METHODS")
+        logger.info("=" * 40)
         
-        for i, trigger in enumerate(triggers_to_try, 1):
-            print(f"{i}. Testing: {trigger['name']}")
-            print(f"   URL: {trigger['url']}")
-            print(f"   Method: {trigger['method']}")
-            
+        def send(trigger):
             try:
-                if trigger['method'] == 'POST':
-                    response = requests.post(trigger['url'], headers=headers)
-                else:
-                    response = requests.get(trigger['url'], headers=headers)
-                
-                print(f"   Status: {response.status_code}")
+                return self.session.request(trigger['method'], trigger['url'], headers=headers)
+            except Exception as e:
+                return e
+        
+        # Trigger dicoba sesuai prioritas. POST (mengubah state) hanya dikirim jika trigger
+        # sebelumnya gagal; GET yang berurutan di-probe paralel lalu dibaca sesuai urutan
+        i = 0
+        while i < len(triggers_to_try):
+            batch_end = i + 1
+            if triggers_to_try[i]['method'] == 'GET':
+                while batch_end < len(triggers_to_try) and triggers_to_try[batch_end]['method'] == 'GET':
+                    batch_end += 1
+            batch = triggers_to_try[i:batch_end]
+            if len(batch) > 1:
+                results = self.fetch_concurrently(*(functools.partial(send, trigger) for trigger in batch))
+            else:
+                results = [send(batch[0])]
+            
+            for number, trigger, response in zip(range(i + 1, batch_end + 1), batch, results):
+                logger.info("%s. Testing: %s", number, trigger['name'])
+                logger.info("   URL: %s", trigger['url'])
+                logger.info("   Method: %s", trigger['method'])
                 
-                if response.status_code == 200:
-                    print("   ✅ SUCCESS!")
-                    try:
-                        result = response.json()
-                        print(f"   Response: {result}")
-                    except:
-                        print(f"   Response: {response.text[:100]}")
-                    return trigger['url'], trigger['method']
+                if isinstance(response, Exception):
+                    logger.warning("   ❌ Error: %s", response)
                 else:
-                    print(f"   ❌ Failed")
+                    logger.info("   Status: %s", response.status_code)
                     
-            except Exception as e:
-                print(f"   ❌ Error: {e}")
-            
-            print()
+                    if response.status_code == 200:
+                        logger.info("   ✅ SUCCESS!")
+                        try:
+                            result = self._json(response)
+                            logger.info("   Response: %s", result)
+                        except ValueError:
+                            logger.info("   Response: %s", response.text[:100])
+                        return trigger['url'], trigger['method']
+                    logger.warning("   ❌ Failed")
+                
+                logger.info("")
+            i = batch_end
         
-        print("❌ All trigger methods failed")
+        logger.warning("❌ All trigger methods failed")
         return None, None
 
     def simple_share_process(self, custom_text=None):
         """Proses share sederhana - trigger task + post cast"""
         try:
-            print("🚀 STARTING SHARE PROCESS")
-            print("=" * 30)
+            logger.info("🚀 STARTING SHARE PROCESS")
+            logger.info("=" * 30)
             
             # 1. Trigger share task dengan method yang benar
-            print("1. Triggering share task...")
+            logger.info("1. Triggering share task...")
             url = f"https://versus-prod-api.wreckleague.xyz/v1/analysis?fId={self.user_id}"
-            headers = {
-                "Authorization": f"Bearer {self.authorization_token}",
-                "Accept": "application/json",
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
             
             # GET analytics (working method)
-            response = requests.get(url, headers=headers)
+            response = self.session.get(url, headers=self._api_headers_accept)
             if response.status_code == 200:
-                print("   ✅ Analytics retrieved successfully")
+                logger.info("   ✅ Analytics retrieved successfully")
                 
                 # Coba POST analytics event untuk share button click
-                print("   📊 Sending share button analytics...")
+                logger.info("   📊 Sending share button analytics...")
                 analytics_url = "https://versus-prod-api.wreckleague.xyz/v1/analysis"
                 analytics_payload = {
                     "userName": "mrmoney",
@@ -1106,73 +1221,29 @@ class FarcasterAutoVote:
                     "eventName": "Button Click"
                 }
                 
-                analytics_headers = headers.copy()
-                analytics_headers["Content-Type"] = "application/json"
-                
-                analytics_response = requests.post(analytics_url, headers=analytics_headers, json=analytics_payload)
+                analytics_response = self.session.post(analytics_url, headers=self._api_headers_json, json=analytics_payload)
                 if analytics_response.status_code in [200, 201]:
-                    print("   ✅ Share analytics sent successfully")
+                    logger.info("   ✅ Share analytics sent successfully")
                 else:
-                    print(f"   ⚠️  Share analytics response: {analytics_response.status_code}")
+                    logger.warning("   ⚠️  Share analytics response: %s", analytics_response.status_code)
                     
             else:
-                print(f"   ❌ Analytics failed: {response.status_code}")
+                logger.warning("   ❌ Analytics failed: %s", response.status_code)
                 return False
             
             time.sleep(2)
             
             # 2. Post promotional cast
-            print("2. Posting promotional cast...")
-            cast_url = "https://client.farcaster.xyz/v2/casts"
-            
-            cast_headers = self.base_headers.copy()
-            cast_headers.update({
-                "idempotency-key": self._generate_idempotency_key(),
-                "traceparent": f"00-000000000000000000{random.randint(100000000000, 999999999999)}-{random.randint(1000000000000000, 9999999999999999):x}-01",
-            })
-            
-            if custom_text:
-                cast_text = custom_text
-            else:
-                # Random variasi text dengan typo natural untuk avoid spam detection
-                text_variations = [
-                    "Help me get Fuel by likeing this cast!\n5 Likes = 1 Fuel🔋\nSupport my mech battles in Wreck League Versus 🤖 by @towerecosystem",
-                    "Pls help me get Fuel by liking this cast!\n5 Like = 1 Fuel🔋\nSuport my mech battles in Wreck League Versus 🤖 by @towerecosystem", 
-                    "Help me get Fuel by likng this cast!\n5 Likes = 1 Fuel🔋\nSupport my mech batles in Wreck League Versus 🤖 by @towerecosystem",
-                    "Help me get Fuel by liking this cast pls!\n5 Likes = 1 Fuel🔋\nSupport my mech battles in Wreck League Versus 🤖 by @towerecosystem",
-                    "Help me get Fuel by liking this cast!\n5 Likes = 1 Fuel🔋\nSupport my mech battles in Wreck League Versus 🤖 by @towerecosystem thx!",
-                    "Hlp me get Fuel by liking this cast!\n5 Likes = 1 Fuel🔋\nSupport my mech battles in Wreck League Versus 🤖 by @towerecosystem",
-                    "Help me get Fuel by liking this cast!\n5 likes = 1 fuel🔋\nSupport my mech battles in Wreck League Versus 🤖 by @towerecosystem",
-                    "Help me get Fuel by likeing this cast plz!\n5 Likes = 1 Fuel🔋\nSupport my mech battles in Wreck League Versus 🤖 by @towerecosystem"
-                ]
-                cast_text = random.choice(text_variations)
-            
-            payload = {
-                "text": cast_text,
-                "embeds": [f"https://versus.wreckleague.xyz/{self.user_id}"]
-            }
-            
-            print(f"   Text: {cast_text[:50]}...")
-            
-            cast_response = requests.post(cast_url, headers=cast_headers, json=payload)
-            
-            if cast_response.status_code in [200, 201]:
-                print("   ✅ Cast posted successfully!")
-                result = cast_response.json()
-                if 'result' in result and 'cast' in result['result']:
-                    cast_info = result['result']['cast']
-                    print(f"   🆔 Cast hash: {cast_info.get('hash', 'Unknown')}")
-                
-                print("\n🎉 Share process completed!")
-                print("📈 Get likes on your cast to earn fuel!")
-                print("💡 Wait a few minutes then check share details!")
+            logger.info("2. Posting promotional cast...")
+            if self._post_cast(custom_text, send_tracking=False):
+                logger.info("\n🎉 Share process completed!")
+                logger.info("📈 Get likes on your cast to earn fuel!")
+                logger.info("💡 Wait a few minutes then check share details!")
                 return True
-            else:
-                print(f"   ❌ Cast failed: {cast_response.status_code}")
-                return False
+            return False
                 
         except Exception as e:
-            print(f"❌ Share process failed: {e}")
+            logger.warning("❌ Share process failed: %s", e)
             return False
     
     def run_auto_vote(self):
@@ -1180,6 +1251,8 @@ class FarcasterAutoVote:
         print("=" * 60)
         print("STARTING FARCASTER AUTO VOTE PROCESS")
         print("=" * 60)
+        # Step 1-4 gagal = masalah koneksi/API; submit_prediction menimpa dengan alasan yang lebih spesifik
+        self.last_failure = "server"
         
         try:
             # 1. Send mini app event (open)
@@ -1190,9 +1263,13 @@ class FarcasterAutoVote:
                 print("✗ Failed to send mini app event")
                 return False
             
+            # 2-4 saling independen: ambil frame info, user data, dan match details paralel
+            frame_info, user_data, match_details = self.fetch_concurrently(
+                self.get_frame_info, self.get_user_data, self.get_match_details
+            )
+            
             # 2. Get frame info
             print("2. Getting frame information...")
-            frame_info = self.get_frame_info()
             if frame_info:
                 print("✓ Frame info retrieved successfully")
             else:
@@ -1201,7 +1278,6 @@ class FarcasterAutoVote:
             
             # 3. Get user data
             print("3. Getting user data...")
-            user_data = self.get_user_data()
             if user_data:
                 print("✓ User data retrieved successfully")
                 print(f"   User: {user_data.get('username', 'Unknown')}")
@@ -1211,7 +1287,6 @@ class FarcasterAutoVote:
             
             # 4. Get match details
             print("4. Getting match details...")
-            match_details = self.get_match_details()
             if match_details:
                 print("✓ Match details retrieved successfully")
                 if 'match' in match_details:
@@ -1224,13 +1299,13 @@ class FarcasterAutoVote:
             print("5. Submitting prediction vote...")
             if self.submit_prediction():
                 print("✓ Prediction vote submitted successfully!")
+                self.last_failure = None
+                self._fail_streak = 0
                 
-                # 6. Send amplitude tracking
+                # 6. Send amplitude tracking (background, tidak ditunggu)
                 print("6. Sending tracking data...")
-                if self.send_amplitude_tracking():
-                    print("✓ Tracking data sent successfully")
-                else:
-                    print("✗ Failed to send tracking data")
+                self.track_in_background(self.send_amplitude_tracking)
+                print("✓ Tracking data queued")
                 
                 return True
             else:
@@ -1241,17 +1316,28 @@ class FarcasterAutoVote:
             print(f"✗ Error in auto vote process: {e}")
             return False
 
+# Session bersama untuk semua bot di CLI: temp/share/vote bot dan setiap cycle continuous
+# memakai pool koneksi yang sama, jadi tidak ada handshake TLS baru per instance
+_SHARED_SESSION = FarcasterAutoVote.get_session()
+
+# Jawaban konfirmasi yang dianggap "ya" (Enter kosong = default ya)
+_YES_ANSWERS = frozenset({'y', 'yes', ''})
+
+def _load_text_file(file_path):
+    """Baca file token kecil sebagai bytes (unbuffered), strip, lalu decode sekali"""
+    with open(file_path, 'rb', buffering=0) as f:
+        return f.read().strip().decode('utf-8')
+
 def load_authorization_token(file_path="account.txt"):
     """Load authorization token dari file"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            token = f.read().strip()
-            if token:
-                print(f"✓ Authorization token loaded from {file_path}")
-                return token
-            else:
-                print(f"✗ Empty authorization token in {file_path}")
-                return None
+        token = _load_text_file(file_path)
+        if token:
+            print(f"✓ Authorization token loaded from {file_path}")
+            return token
+        else:
+            print(f"✗ Empty authorization token in {file_path}")
+            return None
     except Exception as e:
         print(f"✗ Error loading authorization token: {e}")
         return None
@@ -1259,14 +1345,13 @@ def load_authorization_token(file_path="account.txt"):
 def load_privy_token():
     """Load privy token dari privy.txt"""
     try:
-        with open('privy.txt', 'r') as f:
-            token = f.read().strip()
-            if token:
-                print("✓ Privy token loaded from privy.txt")
-                return token
-            else:
-                print("❌ privy.txt is empty")
-                return None
+        token = _load_text_file('privy.txt')
+        if token:
+            print("✓ Privy token loaded from privy.txt")
+            return token
+        else:
+            print("❌ privy.txt is empty")
+            return None
     except FileNotFoundError:
         print("❌ privy.txt not found")
         return None
@@ -1286,7 +1371,7 @@ def main():
         return
     
     # Buat instance sementara untuk deteksi fuel
-    temp_bot = FarcasterAutoVote(auth_token, 1, 10, None)
+    temp_bot = FarcasterAutoVote(auth_token, 1, 10, None, session=_SHARED_SESSION)
     
     print("\n🔍 Detecting user fuel...")
     current_fuel = temp_bot.get_user_fuel_info()
@@ -1316,7 +1401,7 @@ def main():
         privy_token = load_privy_token()
         
         # Buat instance untuk share
-        share_bot = FarcasterAutoVote(auth_token, 1, 10, None, privy_token)
+        share_bot = FarcasterAutoVote(auth_token, 1, 10, None, privy_token, session=_SHARED_SESSION)
         
         use_custom = "n"  # Auto-set to no custom text
         custom_text = None
@@ -1332,20 +1417,20 @@ def main():
         print("\n📊 FUEL STATUS & SHARE DETAILS")
         print("=" * 35)
         
+        # Dua request independen, diambil paralel
+        fuel_status, share_details = temp_bot.fetch_concurrently(temp_bot.check_fuel_status, temp_bot.check_share_details)
+        
         print("🔋 Basic Fuel Status:")
-        fuel_status = temp_bot.check_fuel_status()
         if fuel_status:
             print(f"📊 Fuel status:")
-            import json
-            print(json.dumps(fuel_status, indent=2))
+            print(_pp(fuel_status))
         else:
             print("❌ Gagal mendapatkan status fuel")
             
         print("\n📈 Share Details:")
-        share_details = temp_bot.check_share_details()
         if share_details:
             print(f"📊 Share details:")
-            print(json.dumps(share_details, indent=2))
+            print(_pp(share_details))
         else:
             print("❌ Gagal mendapatkan share details")
         return
@@ -1357,10 +1442,10 @@ def main():
         
         fuel_status = temp_bot.check_fuel_status()
         if fuel_status:
-            print(f"📊 Current fuel status: {fuel_status}")
+            print(f"📊 Current fuel balance: {extract_fuel_balance(fuel_status)}")
         
         confirm = input("\nClaim fuel reward sekarang? (y/n): ").strip().lower()
-        if confirm == 'y' or confirm == '':
+        if confirm in _YES_ANSWERS:
             if temp_bot.claim_fuel_reward():
                 print("✅ Fuel berhasil di-claim!")
             else:
@@ -1372,7 +1457,7 @@ def main():
         print("\n🔍 TEST DIFFERENT TRIGGERS")
         print("=" * 30)
         
-        test_bot = FarcasterAutoVote(auth_token, 1, 10, None)
+        test_bot = FarcasterAutoVote(auth_token, 1, 10, None, session=_SHARED_SESSION)
         working_url, working_method = test_bot.try_different_triggers()
         
         if working_url:
@@ -1416,7 +1501,7 @@ def main():
     # Fuel configuration
     if current_fuel > 0:
         use_auto = "y"  # Auto-use detected fuel
-        if use_auto == 'y' or use_auto == '':
+        if use_auto in _YES_ANSWERS:
             max_fuel = current_fuel
             print(f"✅ Using auto-detected fuel: {max_fuel}")
         else:
@@ -1478,7 +1563,8 @@ def main():
         authorization_token=auth_token,
         fuel_amount=fuel_amount,
         max_fuel=max_fuel,
-        team_preference=team_choice
+        team_preference=team_choice,
+        session=_SHARED_SESSION
     )
     
     if continuous_mode:
@@ -1492,19 +1578,13 @@ def main():
                 vote_count += 1
                 print(f"\n🔄 VOTE ATTEMPT #{vote_count}")
                 print("=" * 30)
+                bot.invalidate_cache()
                 
-                # Check current fuel
+                # Check current fuel lewat bot utama (token sama, cache user data ikut dipakai run_auto_vote)
                 try:
-                    temp_bot = FarcasterAutoVote(auth_token, 1, 10, None)
-                    fuel_info = temp_bot.get_user_fuel_info()
-                    if fuel_info and isinstance(fuel_info, dict) and 'data' in fuel_info:
-                        fuel_data = fuel_info['data']
-                        if isinstance(fuel_data, dict) and 'data' in fuel_data:
-                            current_fuel_check = fuel_data['data'].get('fuelBalance', 0)
-                        else:
-                            current_fuel_check = 3  # Default fallback
-                    else:
-                        current_fuel_check = 3  # Default fallback
+                    # Cek fuel sambil prefetch match details ke cache bot (dipakai run_auto_vote)
+                    user_data, _ = bot.fetch_concurrently(bot._get_user_data_raw, bot.get_match_details)
+                    current_fuel_check = extract_fuel_balance(user_data, default=3)  # Default fallback 3
                         
                     if current_fuel_check < fuel_amount:
                         print(f"❌ Insufficient fuel! Available: {current_fuel_check}, Required: {fuel_amount}")
@@ -1527,39 +1607,35 @@ def main():
                 if success:
                     print(f"✅ Vote #{vote_count} successful!")
                     
-                    # Show timing info
-                    try:
-                        match_details = bot.get_match_details()
-                        if match_details and 'data' in match_details and match_details['data']['matchData']:
-                            current_match = match_details['data']['matchData'][0]
-                            show_match_timing_info(current_match)
-                            
-                            # Calculate wait time until next voting window
-                            voting_end_str = current_match.get('votingEndTime') or current_match.get('endTime')
-                            if voting_end_str:
-                                voting_end = parse_iso_time(voting_end_str)
-                                now_utc = datetime.datetime.now(pytz.UTC)
-                                
-                                if voting_end and now_utc < voting_end:
-                                    remaining = (voting_end - now_utc).total_seconds()
-                                    wait_time = remaining + 120  # Wait until voting ends + 2 minutes
-                                    print(f"⏳ Next check in {format_duration(wait_time)}")
-                                    print("💤 Waiting for next voting window...")
-                                    time.sleep(wait_time)
-                                else:
-                                    print("⏳ Voting ended, checking for next match in 60 seconds...")
-                                    time.sleep(60)
-                            else:
-                                print("⏳ No timing info, waiting 5 minutes...")
-                                time.sleep(300)
-                    except Exception as e:
-                        print(f"⚠️ Could not get timing info: {e}")
+                    # Show timing info (match details masih di cache dari run_auto_vote)
+                    voting_end = _show_timing_and_return_end(bot.get_match_details())
+                    
+                    # Calculate wait time until next voting window
+                    if voting_end:
+                        now_utc = _now(_UTC)
+                        if now_utc < voting_end:
+                            remaining = (voting_end - now_utc).total_seconds()
+                            wait_time = remaining + 120  # Wait until voting ends + 2 minutes
+                            print(f"⏳ Next check in {format_duration(wait_time)}")
+                            print("💤 Waiting for next voting window...")
+                            sleep_with_progress(wait_time, "⏰ Next check in")
+                        else:
+                            print(f"⏳ Voting ended, checking for next match in {_NEXT_MATCH_POLL_SECONDS} seconds...")
+                            time.sleep(_NEXT_MATCH_POLL_SECONDS)
+                    else:
+                        print("⏳ No timing info, waiting 5 minutes...")
                         time.sleep(300)
                         
                 else:
                     print(f"❌ Vote #{vote_count} failed!")
-                    print("🔄 Will retry in 2 minutes...")
-                    time.sleep(120)
+                    if bot.last_failure == "window_closed":
+                        # Window tutup: tidak perlu backoff, langsung cek match berikutnya
+                        print(f"🔄 Voting window closed, checking next match in {_NEXT_MATCH_POLL_SECONDS} seconds...")
+                        time.sleep(_NEXT_MATCH_POLL_SECONDS)
+                    else:
+                        delay = bot.retry_delay()
+                        print(f"🔄 Will retry in {format_duration(delay)}...")
+                        time.sleep(delay)
                     
         except KeyboardInterrupt:
             print(f"\n\n⛔ Continuous voting stopped by user")
@@ -1573,6 +1649,9 @@ def main():
         print("\n🗳️  STARTING AUTO VOTE PROCESS")
         print("=" * 40)
         success = bot.run_auto_vote()
+        # Match details untuk timing info dibaca setelah vote: run_auto_vote sudah mengisi cache
+        # (_cached_get), jadi ini cache hit atau revalidasi ETag dengan data setelah vote masuk
+        match_details = bot.get_match_details()
         
         if success:
             print("\n🎉 Auto vote process completed successfully!")
@@ -1580,27 +1659,11 @@ def main():
             print(f"💰 Sisa fuel: {remaining_fuel}")
             print(f"💡 Tips: Gunakan menu share untuk claim fuel!")
             print(f"🔗 Your profile: https://versus.wreckleague.xyz/{bot.user_id}")
-            
-            # Tampilkan informasi timing match
-            try:
-                match_details = bot.get_match_details()
-                if match_details and 'data' in match_details and match_details['data']['matchData']:
-                    current_match = match_details['data']['matchData'][0]
-                    show_match_timing_info(current_match)
-            except Exception as e:
-                print(f"⚠️ Could not load timing info: {e}")
-                
         else:
             print("\n❌ Auto vote process failed!")
-            
-            # Tampilkan timing info juga untuk kasus gagal (mungkin voting window tutup)
-            try:
-                match_details = bot.get_match_details()
-                if match_details and 'data' in match_details and match_details['data']['matchData']:
-                    current_match = match_details['data']['matchData'][0]
-                    show_match_timing_info(current_match)
-            except Exception as e:
-                print(f"⚠️ Could not load timing info: {e}")
+        
+        # Tampilkan informasi timing match, juga untuk kasus gagal (mungkin voting window tutup)
+        _show_timing_and_return_end(match_details)
 
 def continuous_auto_vote():
     """Continuous auto vote yang berjalan sesuai timing detection"""
@@ -1615,10 +1678,12 @@ def continuous_auto_vote():
     print()
     
     vote_count = 0
+    bot = None
     
     try:
         while True:
             vote_count += 1
+            did_sleep = False  # True jika cycle ini sudah menunggu setelah vote
             print(f"\n🔄 VOTE CYCLE #{vote_count}")
             print("=" * 40)
             
@@ -1628,8 +1693,15 @@ def continuous_auto_vote():
                 print("❌ No authorization token found!")
                 break
                 
-            # Auto-detect fuel
-            current_fuel = detect_user_fuel(auth_token)
+            # Setup bot sekali per token supaya session & cache ETag match details dipakai lintas cycle
+            if bot is None or bot.authorization_token != auth_token:
+                bot = FarcasterAutoVote(auth_token, 1, 10, "auto", session=_SHARED_SESSION)
+            else:
+                # Cycle baru (biasanya setelah lewat batas voting window): jangan pakai data lama
+                bot.invalidate_cache()
+            
+            # Auto-detect fuel dan ambil match details secara paralel
+            current_fuel, match_details = bot.fetch_concurrently(bot.get_user_fuel_info, bot.get_match_details)
             if current_fuel is None or current_fuel <= 0:
                 print("❌ No fuel available for voting!")
                 print("⏳ Checking again in 5 minutes...")
@@ -1637,31 +1709,25 @@ def continuous_auto_vote():
                 continue
                 
             print(f"⛽ Available fuel: {current_fuel}")
-            
-            # Setup bot
-            bot = FarcasterAutoVote(auth_token, 1, current_fuel, "auto")
+            bot.max_fuel = current_fuel
             
             # Get current match timing
-            match_details = bot.get_match_details()
             if not match_details or 'data' not in match_details or not match_details['data']['matchData']:
-                print("⚠️ No match data available, checking again in 1 minute...")
-                time.sleep(60)
+                print(f"⚠️ No match data available, checking again in {_NEXT_MATCH_POLL_SECONDS} seconds...")
+                time.sleep(_NEXT_MATCH_POLL_SECONDS)
                 continue
                 
             current_match = match_details['data']['matchData'][0]
             
-            # Parse timing
-            voting_start_str = current_match.get('votingStartTime')
-            voting_end_str = current_match.get('votingEndTime') or current_match.get('endTime')
+            # Parse timing (di-cache per match ID, cycle berikutnya di match yang sama tidak parse ulang)
+            voting_start, voting_end = match_window(current_match)
             
-            if not voting_start_str or not voting_end_str:
-                print("⚠️ No voting timing available, checking again in 1 minute...")
-                time.sleep(60)
+            if not voting_start or not voting_end:
+                print(f"⚠️ No voting timing available, checking again in {_NEXT_MATCH_POLL_SECONDS} seconds...")
+                time.sleep(_NEXT_MATCH_POLL_SECONDS)
                 continue
             
-            voting_start = parse_iso_time(voting_start_str)
-            voting_end = parse_iso_time(voting_end_str)
-            now_utc = datetime.datetime.now(pytz.UTC)
+            now_utc = _now(_UTC)
             
             print(f"🕐 Current time: {format_time_wib(now_utc)}")
             print(f"🟢 Voting start: {format_time_wib(voting_start)}")
@@ -1675,12 +1741,7 @@ def continuous_auto_vote():
                 print(f"💤 Waiting until voting starts...")
                 
                 # Wait sampai voting start dengan countdown
-                while datetime.datetime.now(pytz.UTC) < voting_start:
-                    remaining = (voting_start - datetime.datetime.now(pytz.UTC)).total_seconds()
-                    if remaining <= 0:
-                        break
-                    print(f"⏰ Starting in {format_duration(remaining)}", end='\r')
-                    time.sleep(min(30, remaining))
+                sleep_with_progress(wait_time, "⏰ Starting in")
                 
                 print(f"\n🚀 Voting window opened! Attempting vote...")
                 
@@ -1694,12 +1755,30 @@ def continuous_auto_vote():
                 # Voting sudah selesai
                 print("⌛ Current voting window has ended")
                 print("🔍 Looking for next match...")
-                time.sleep(60)
+                time.sleep(_NEXT_MATCH_POLL_SECONDS)
                 continue
             
-            # Attempt vote
-            print(f"\n🗳️ Attempting vote #{vote_count}...")
-            success = bot.run_auto_vote()
+            # Attempt vote; jika ditolak karena voting belum mulai, tunggu lalu langsung
+            # coba lagi dengan match yang sama tanpa kembali ke awal cycle
+            while True:
+                print(f"\n🗳️ Attempting vote #{vote_count}...")
+                success = bot.run_auto_vote()
+                if success:
+                    break
+                
+                now_utc = _now(_UTC)
+                if not now_utc < voting_start:
+                    break
+                
+                print(f"❌ Vote #{vote_count} failed!")
+                show_match_timing_info(current_match)
+                print("💡 Vote failed because voting hasn't started yet")
+                wait_time = (voting_start - now_utc).total_seconds()
+                print(f"⏳ Waiting {format_duration(wait_time)} for voting to start...")
+                sleep_with_progress(wait_time, "⏰ Starting in")
+            
+            # Kirim sisa event amplitude sekarang, jangan tunggu sampai cycle berikutnya
+            bot.flush_amplitude(force=True)
             
             if success:
                 print(f"✅ Vote #{vote_count} successful!")
@@ -1710,23 +1789,15 @@ def continuous_auto_vote():
                 show_match_timing_info(current_match)
                 
                 # Calculate wait time until voting ends
-                now_utc = datetime.datetime.now(pytz.UTC)
+                now_utc = _now(_UTC)
                 if now_utc < voting_end:
                     wait_until_end = (voting_end - now_utc).total_seconds()
                     print(f"\n⏳ Waiting {format_duration(wait_until_end)} until voting ends...")
                     print("💤 Sleeping until next voting window...")
                     
                     # Sleep dengan progress indicator
-                    sleep_interval = min(60, wait_until_end / 10)  # Update setiap menit atau 10% dari waktu
-                    slept = 0
-                    while slept < wait_until_end:
-                        remaining = wait_until_end - slept
-                        print(f"⏰ Next check in {format_duration(remaining)}", end='\r')
-                        sleep_time = min(sleep_interval, remaining)
-                        time.sleep(sleep_time)
-                        slept += sleep_time
-                        if remaining <= 0:
-                            break
+                    sleep_with_progress(wait_until_end, "⏰ Next check in")
+                    did_sleep = True
                     
                     print(f"\n🔄 Voting window ended, looking for next match...")
                 else:
@@ -1739,22 +1810,23 @@ def continuous_auto_vote():
                 show_match_timing_info(current_match)
                 
                 # If vote failed, might be timing issue
-                now_utc = datetime.datetime.now(pytz.UTC)
+                now_utc = _now(_UTC)
                 if now_utc > voting_end:
                     print("💡 Vote failed because voting window closed")
                     print("🔄 Looking for next voting window...")
-                elif now_utc < voting_start:
-                    print("💡 Vote failed because voting hasn't started yet")
-                    wait_time = (voting_start - now_utc).total_seconds()
-                    print(f"⏳ Waiting {format_duration(wait_time)} for voting to start...")
-                    time.sleep(wait_time)
+                elif bot.last_failure == "window_closed":
+                    print("💡 Vote failed because the match is no longer accepting votes")
+                    print("🔄 Looking for next voting window...")
                 else:
-                    print("💡 Vote failed for other reason, retrying in 2 minutes...")
-                    time.sleep(120)
+                    delay = bot.retry_delay()
+                    print(f"💡 Vote failed for other reason, retrying in {format_duration(delay)}...")
+                    time.sleep(delay)
+                    did_sleep = True
                     
-            # Small delay before next cycle
+            # Small delay before next cycle, hanya jika belum menunggu di atas
             print("\n" + "="*60)
-            time.sleep(5)
+            if not did_sleep:
+                time.sleep(5)
                 
     except KeyboardInterrupt:
         print(f"\n\n⛔ Continuous auto vote stopped by user")
@@ -1765,4 +1837,11 @@ def continuous_auto_vote():
         print(f"📊 Total vote cycles: {vote_count}")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", handlers=[logging.StreamHandler()])
+    # Jalankan dengan --debug untuk menampilkan status setiap request,
+    # atau --quiet untuk hanya menampilkan warning/error dari proses share
+    if "--debug" in sys.argv[1:]:
+        logger.setLevel(logging.DEBUG)
+    elif "--quiet" in sys.argv[1:]:
+        logging.getLogger().setLevel(logging.WARNING)
     main()
@@ -5,6 +5,8 @@ Script untuk melakukan otomatisasi vote fuel frame di Farcaster
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import time
 import random
@@ -12,30 +14,106 @@ import datetime
 import signal
 import sys
 import os
-import pytz
 import uuid
 import threading
-import queue
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import unquote, quote
+from types import MappingProxyType
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+try:
+    import orjson  # Opsional: decode JSON lebih cepat
+except ImportError:
+    orjson = None
+
+def _json(response):
+    """Decode body response JSON langsung dari bytes, pakai orjson jika tersedia"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return json.loads(response.content)
+
+def _dumps(obj):
+    """Encode body JSON ke bytes, pakai orjson jika tersedia"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+# Timezone dibuat sekali di level modul (stdlib zoneinfo, tanpa pytz)
+_UTC = datetime.timezone.utc
+try:
+    _WIB = ZoneInfo('Asia/Jakarta')
+except ZoneInfoNotFoundError:
+    # Tanpa database tz (mis. Windows tanpa paket tzdata): WIB selalu UTC+7, tanpa DST
+    _WIB = datetime.timezone(datetime.timedelta(hours=7), 'WIB')
 
 # Global configuration variables
 global_team_preference = "auto"
 global_fuel_strategy = "max"
 global_min_fuel_threshold = 1
 
-# Color codes for terminal styling
+def build_session():
+    """Buat requests.Session dengan connection pool + retry, dipakai bersama oleh semua bot"""
+    # Hanya GET yang di-retry otomatis supaya vote (PUT) / claim (POST) tidak terkirim dua kali
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({"GET", "HEAD", "OPTIONS"}),
+        raise_on_status=False
+    )
+    # pool_maxsize cukup besar untuk mode multi-akun threaded supaya koneksi tidak dibuang/dibuat ulang
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=64, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.headers.update({
+        "accept": "*/*",
+        "accept-language": "en-US,en;q=0.9",
+        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    })
+    return session
+
+# (connect, read) timeout: connect gagal cepat, read tetap longgar untuk API yang lambat
+_TIMEOUT = (3.05, 10)
+# Batas worker vote paralel per cycle (selaras dengan pool_maxsize, tidak satu thread per akun)
+_MAX_VOTE_WORKERS = 32
+# Retry PUT/POST hanya untuk kondisi yang pasti belum diproses server (tidak ada risiko vote dobel)
+_WRITE_RETRY_STATUSES = frozenset({429, 503})
+_WRITE_RETRY_ATTEMPTS = 3
+_WRITE_RETRY_BASE = 1.0
+_WRITE_RETRY_CAP = 30.0
+# Executor bersama untuk request fallback match details (tidak membuat thread pool per panggilan)
+_FALLBACK_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="match-fallback")
+# Berapa lama payload match details dipakai ulang dalam satu vote (detik)
+_MATCH_CACHE_TTL = 5.0
+# Backoff re-GET setelah registrasi, berhenti begitu user data sudah 200
+_REGISTER_POLL_DELAYS = (0.2, 0.4, 0.8, 1.6)
+
+# Satu session untuk seluruh proses: koneksi keep-alive ke warpcast/wreckleague dipakai ulang
+# oleh semua akun, thread, dan bot sementara
+_SESSION = build_session()
+
+# Color codes for terminal styling (konstanta modul, tanpa lookup atribut class)
+RED = '\033[91m'
+GREEN = '\033[92m'
+YELLOW = '\033[93m'
+BLUE = '\033[94m'
+MAGENTA = '\033[95m'
+CYAN = '\033[96m'
+WHITE = '\033[97m'
+BOLD = '\033[1m'
+END = '\033[0m'
+
 class Colors:
-    RED = '\033[91m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    MAGENTA = '\033[95m'
-    CYAN = '\033[96m'
-    WHITE = '\033[97m'
-    BOLD = '\033[1m'
+    RED = RED
+    GREEN = GREEN
+    YELLOW = YELLOW
+    BLUE = BLUE
+    MAGENTA = MAGENTA
+    CYAN = CYAN
+    WHITE = WHITE
+    BOLD = BOLD
     UNDERLINE = '\033[4m'
-    END = '\033[0m'
+    END = END
     BG_RED = '\033[41m'
     BG_GREEN = '\033[42m'
     BG_YELLOW = '\033[43m'
@@ -45,58 +123,75 @@ class Colors:
 
 def colored_text(text, color):
     """Add color to text"""
-    return f"{color}{text}{Colors.END}"
+    return f"{color}{text}{END}"
 
-def print_colored_box(title, content, color=Colors.CYAN):
+# Garis/tepi box yang dicetak berulang di loop cycle, cukup dibuat sekali
+_BOX_TOP_CYAN = colored_text('╔' + '═' * 68 + '╗', CYAN)
+_BOX_TOP_MAGENTA = colored_text('╔' + '═' * 68 + '╗', MAGENTA)
+_BOX_TOP_GREEN = colored_text('╔' + '═' * 68 + '╗', GREEN)
+_BOX_BOTTOM_CYAN = colored_text('╚' + '═' * 68 + '╝', CYAN)
+_BOX_BOTTOM_MAGENTA = colored_text('╚' + '═' * 68 + '╝', MAGENTA)
+_BOX_BOTTOM_GREEN = colored_text('╚' + '═' * 68 + '╝', GREEN)
+_BOX_END_CYAN = colored_text('└' + '─' * 68 + '┘', CYAN)
+_BOX_END_MAGENTA = colored_text('└' + '─' * 68 + '┘', MAGENTA)
+_BOX_END_YELLOW = colored_text('└' + '─' * 68 + '┘', YELLOW)
+_BOX_END_BLUE = colored_text('└' + '─' * 68 + '┘', BLUE)
+_BOX_EDGE_CYAN = colored_text('║', CYAN)
+_BOX_EDGE_MAGENTA = colored_text('║', MAGENTA)
+_BOX_EDGE_GREEN = colored_text('║', GREEN)
+_BOX_BAR_CYAN = colored_text('│', CYAN)
+_BOX_BAR_MAGENTA = colored_text('│', MAGENTA)
+_BOX_BAR_YELLOW = colored_text('│', YELLOW)
+_BOX_BAR_BLUE = colored_text('│', BLUE)
+
+def print_colored_box(title, content, color=CYAN):
     """Print content in a colored box"""
     lines = content.split('\n') if isinstance(content, str) else content
     max_length = max(len(line) for line in lines) if lines else 50
     box_width = max(max_length + 4, len(title) + 4, 60)
+    inner = box_width - 4
+    rule = "─" * (box_width - 2)
     
-    print(colored_text("┌" + "─" * (box_width - 2) + "┐", color))
-    print(colored_text(f"│ {title.center(box_width - 4)} │", color))
-    print(colored_text("├" + "─" * (box_width - 2) + "┤", color))
-    
-    for line in lines:
-        padding = box_width - len(line) - 4
-        print(colored_text(f"│ {line}{' ' * padding} │", color))
-    
-    print(colored_text("└" + "─" * (box_width - 2) + "┘", color))
+    # Seluruh box dirangkai dulu lalu ditulis sekali (padding lewat format spec)
+    rows = [
+        f"┌{rule}┐",
+        f"│ {title.center(inner)} │",
+        f"├{rule}┤",
+        *(f"│ {line:<{inner}} │" for line in lines),
+        f"└{rule}┘"
+    ]
+    sys.stdout.write("".join(f"{color}{row}{END}\n" for row in rows))
 
 def print_simple_status(message, status="info"):
     """Print simple status message without confusing JSON"""
     colors = {
-        "success": Colors.GREEN,
-        "error": Colors.RED, 
-        "info": Colors.CYAN,
-        "warning": Colors.YELLOW
+        "success": GREEN,
+        "error": RED, 
+        "info": CYAN,
+        "warning": YELLOW
     }
-    color = colors.get(status, Colors.WHITE)
+    color = colors.get(status, WHITE)
     print(f"{colored_text(message, color)}")
     
     print(f"{colored_text('═' * 70, color)}")
 
 def parse_iso_time(iso_string):
-    """Parse ISO time string ke datetime object"""
+    """Parse ISO time string ke datetime object, None jika kosong / tidak valid"""
+    # Script ini butuh Python 3.12, fromisoformat sudah menerima suffix 'Z' langsung
     try:
-        # Remove 'Z' dan parse
-        if iso_string.endswith('Z'):
-            iso_string = iso_string[:-1] + '+00:00'
         dt = datetime.datetime.fromisoformat(iso_string)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=pytz.UTC)
-        return dt
-    except Exception as e:
-        print(f"Error parsing time: {e}")
+    except (TypeError, ValueError):
         return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=_UTC)
+    return dt
 
 def format_time_wib(dt):
     """Format datetime ke WIB timezone"""
     try:
-        wib = pytz.timezone('Asia/Jakarta')
         if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=pytz.UTC)
-        wib_time = dt.astimezone(wib)
+            dt = dt.replace(tzinfo=_UTC)
+        wib_time = dt.astimezone(_WIB)
         return wib_time.strftime('%Y-%m-%d %H:%M:%S WIB')
     except:
         return str(dt)
@@ -105,7 +200,7 @@ def get_voting_timing(match_data):
     """Get voting timing status for a match"""
     try:
         # Simple timing check
-        now = datetime.datetime.now(pytz.UTC)
+        now = datetime.datetime.now(_UTC)
         
         # For now, assume voting is always open if match exists
         # In real implementation, you'd check votingStartTime and votingEndTime
@@ -121,15 +216,35 @@ def get_voting_timing(match_data):
 
 def format_duration(seconds):
     """Format duration dalam format yang mudah dibaca"""
+    seconds = int(seconds)
     if seconds < 60:
-        return f"{int(seconds)} seconds"
-    elif seconds < 3600:
-        minutes = int(seconds // 60)
+        return f"{seconds} seconds"
+    minutes = seconds // 60
+    if minutes < 60:
         return f"{minutes} minutes"
-    else:
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        return f"{hours}h {minutes}m"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes}m"
+
+# (match_id, voting_start_str, voting_end_str) -> (voting_start, voting_end) yang sudah di-parse
+_timing_cache = {}
+
+def _cached_voting_window(match_data, voting_start_str, voting_end_str):
+    """Parse voting window sekali per match; polling match yang sama memakai hasil cache"""
+    key = (match_data.get('_id'), voting_start_str, voting_end_str)
+    window = _timing_cache.get(key)
+    if window is None:
+        if len(_timing_cache) >= 32:
+            _timing_cache.clear()  # Match lama tidak dipakai lagi
+        window = _timing_cache[key] = (parse_iso_time(voting_start_str), parse_iso_time(voting_end_str))
+    return window
+
+def _voting_end_ts(match_data):
+    """Epoch akhir voting dari window yang sudah di-parse _cached_voting_window (payload tidak diubah)"""
+    voting_end_str = match_data.get('votingEndTime') or match_data.get('endTime')
+    if not voting_end_str:
+        return None
+    voting_end = _cached_voting_window(match_data, match_data.get('votingStartTime'), voting_end_str)[1]
+    return voting_end.timestamp() if voting_end else None
 
 def show_match_timing_info(match_data):
     """Tampilkan info timing match dengan deteksi yang lebih akurat"""
@@ -138,9 +253,8 @@ def show_match_timing_info(match_data):
         voting_end_str = match_data.get('votingEndTime') or match_data.get('endTime')
         
         if voting_start_str and voting_end_str:
-            voting_start = parse_iso_time(voting_start_str)
-            voting_end = parse_iso_time(voting_end_str)
-            now_utc = datetime.datetime.now(pytz.UTC)
+            voting_start, voting_end = _cached_voting_window(match_data, voting_start_str, voting_end_str)
+            now_utc = datetime.datetime.now(_UTC)
             
             print(f"\n⏰ MATCH TIMING INFO:")
             print(f"🕐 Current time: {format_time_wib(now_utc)}")
@@ -165,6 +279,32 @@ def show_match_timing_info(match_data):
         print(f"⚠️ Could not parse timing info: {e}")
         return 'error', 0
 
+def _sleep_until(deadline, tick=60, on_tick=None):
+    """Tidur sampai deadline time.monotonic(), bangun tiap tick hanya untuk progress"""
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        if on_tick:
+            on_tick(remaining)
+        time.sleep(min(tick, remaining))
+
+# Countdown dari banyak thread ditulis satu per satu; warna hanya jika output ke terminal
+_print_lock = threading.Lock()
+_STDOUT_IS_TTY = sys.stdout.isatty()
+
+def _progress_printer(template, color=None, end='\r'):
+    """Buat on_tick untuk _sleep_until; no-op kalau stdout bukan terminal (log file tidak perlu countdown)"""
+    if not _STDOUT_IS_TTY:
+        return lambda remaining: None
+
+    def on_tick(remaining):
+        text = template.format(format_duration(remaining))
+        with _print_lock:
+            sys.stdout.write((colored_text(text, color) if color else text) + end)
+            sys.stdout.flush()
+    return on_tick
+
 def wait_for_next_match(bot_instance, max_wait_minutes=30):
     """Wait dan deteksi match baru dengan timing info"""
     print(f"\n🔍 Checking for new match with timing info...")
@@ -174,7 +314,7 @@ def wait_for_next_match(bot_instance, max_wait_minutes=30):
             print(f"🔄 Attempt {attempt + 1}/{max_wait_minutes} - Checking match status...")
             
             # Get fresh match data
-            match_details = bot_instance.get_match_details()
+            match_details = bot_instance.get_match_details(force_refresh=True)
             if not match_details or 'data' not in match_details or not match_details['data']['matchData']:
                 print(f"⚠️ No match data available, waiting 1 minute...")
                 time.sleep(60)
@@ -195,8 +335,8 @@ def wait_for_next_match(bot_instance, max_wait_minutes=30):
                 if voting_start_str:
                     voting_start = parse_iso_time(voting_start_str)
                     
-                    while datetime.datetime.now(pytz.UTC) < voting_start:
-                        remaining = (voting_start - datetime.datetime.now(pytz.UTC)).total_seconds()
+                    while datetime.datetime.now(_UTC) < voting_start:
+                        remaining = (voting_start - datetime.datetime.now(_UTC)).total_seconds()
                         if remaining <= 0:
                             break
                         print(f"⏰ Voting starts in {format_duration(remaining)}", end='\r')
@@ -228,12 +368,104 @@ def wait_for_next_match(bot_instance, max_wait_minutes=30):
     return False, None
 
 class FarcasterAutoVote:
-    def __init__(self, authorization_token, fuel_amount=1, max_fuel=10, team_preference=None, lazy_init=False):
+    # Lokasi fuel yang mungkin di payload /v1/user/data, path paling umum di depan
+    _FUEL_PATHS = (
+        ('data', 'fuelBalance'),
+        ('data', 'data', 'fuelBalance'),
+        ('data', 'fuel'),
+        ('data', 'data', 'fuel'),
+        ('data', 'user', 'fuel'),
+        ('fuel',),
+        ('fuelBalance',),
+        ('user', 'fuel'),
+        ('data', 'user', 'fuelBalance')
+    )
+    
+    # Normalisasi preferensi user ke nama tim (CORRECTED MAPPING)
+    _TEAM_MAP = {
+        'blue': 'blue', 'biru': 'blue', 'kanan': 'blue', 'right': 'blue',
+        'red': 'red', 'merah': 'red', 'kiri': 'red', 'left': 'red'
+    }
+    # Blue = Index 0 (Team pertama), Red = Index 1 (Team kedua)
+    _TEAM_BY_INDEX = ("blue", "red")
+    # Field mechType jika ada: Left = Blue Team, Right = Red Team
+    _TEAM_BY_MECH_TYPE = {'left': 'blue', 'right': 'red'}
+    # Label tim yang terpilih saat menampilkan pilihan mech
+    _TEAM_LABELS = {'blue': " (🔵 Tim Biru)", 'red': " (🔴 Tim Merah)"}
+    
+    # Headers match details yang lebih lengkap seperti di script asli (read-only, dipakai bersama)
+    _MATCH_HEADERS = MappingProxyType({
+        "accept": "*/*",
+        "accept-language": "en-US,en;q=0.9",
+        "if-none-match": 'W/"100b-Y/gj6927mGNPyq8v7gTfbP0qRuM"',
+        "priority": "u=1, i",
+        "sec-ch-ua": '"Not;A=Brand";v="99", "Microsoft Edge";v="139", "Chromium";v="139"',
+        "sec-ch-ua-mobile": "?0",
+        "sec-ch-ua-platform": '"Windows"',
+        "sec-fetch-dest": "empty",
+        "sec-fetch-mode": "cors",
+        "sec-fetch-site": "same-site",
+        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36 Edg/139.0.0.0"
+    })
+    # Headers submit prediction (PUT), sama untuk semua akun/thread
+    _PREDICT_HEADERS = MappingProxyType({
+        "accept": "*/*",
+        "accept-language": "en-US,en;q=0.9",
+        "content-type": "application/json",
+        "priority": "u=1, i",
+        "sec-ch-ua": '"Not;A=Brand";v="99", "Microsoft Edge";v="139", "Chromium";v="139"',
+        "sec-ch-ua-mobile": "?0",
+        "sec-ch-ua-platform": '"Windows"',
+        "sec-fetch-dest": "empty",
+        "sec-fetch-mode": "cors",
+        "sec-fetch-site": "same-site",
+        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36 Edg/139.0.0.0"
+    })
+    
+    def __init__(self, authorization_token, fuel_amount=1, max_fuel=10, team_preference=None, lazy_init=False, verbose=True):
         self.authorization_token = authorization_token
+        self.verbose = verbose
         self.fuel_amount = fuel_amount
         self.max_fuel = max_fuel
         self.team_preference = team_preference
+        self._normalized_pref = self._TEAM_MAP.get(team_preference)
         self.user_id = None
+        self.session = _SESSION
+        # (timestamp monotonic, payload) match details terakhir, lihat get_match_details
+        self._match_cache = (float('-inf'), None)
+        # (user_id, tuple URL) endpoint match details; user_id bisa di-set belakangan (lazy_init)
+        self._match_endpoints = (None, ())
+        
+        # Header per endpoint dibangun sekali per instance (token tidak berubah selama bot hidup)
+        self._warpcast_headers = {
+            'authorization': f'Bearer {authorization_token}',
+            'content-type': 'application/json',
+            'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        }
+        self._user_data_headers = {
+            "accept": "*/*",
+            "accept-language": "en-US,en;q=0.9",
+            "authorization": f"Bearer {authorization_token}",
+            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+        }
+        self._register_headers = {
+            "accept": "*/*",
+            "content-type": "application/json",
+            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+        }
+        # Headers yang sama persis dengan browser request dari enpointclaim.txt
+        self._reward_headers = {
+            'accept': '*/*',
+            'accept-language': 'id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7',
+            'sec-ch-ua': '"Not-A.Brand";v="99", "Chromium";v="124"',
+            'sec-ch-ua-mobile': '?0',
+            'sec-ch-ua-platform': '"Linux"',
+            'sec-fetch-dest': 'empty',
+            'sec-fetch-mode': 'cors',
+            'sec-fetch-site': 'same-site',
+            'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        }
+        self._claim_headers = {**self._reward_headers, 'content-type': 'application/json'}
         
         # Only auto-detect FID when not lazy initialization
         if not lazy_init:
@@ -252,17 +484,11 @@ class FarcasterAutoVote:
     def detect_fid_from_token(self):
         """Auto-detect FID dari authorization token"""
         try:
-            headers = {
-                'authorization': f'Bearer {self.authorization_token}',
-                'content-type': 'application/json',
-                'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
             url = "https://client.warpcast.com/v2/me"
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.session.get(url, headers=self._warpcast_headers, timeout=_TIMEOUT)
             
             if response.status_code == 200:
-                data = response.json()
+                data = _json(response)
                 user_data = data.get('result', {}).get('user', {})
                 fid = user_data.get('fid')
                 username = user_data.get('username', 'Unknown')
@@ -280,24 +506,41 @@ class FarcasterAutoVote:
         """Generate UUID untuk keperluan API"""
         return str(uuid.uuid4())
 
+    def _fetch_parallel(self, *calls):
+        """Jalankan beberapa request independen bersamaan, hasil sesuai urutan calls"""
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            futures = [executor.submit(call) for call in calls]
+            return [future.result() for future in futures]
+
+    def _request_with_retry(self, method, url, **kwargs):
+        """Request write dengan backoff+jitter untuk 429/503/connect timeout, 4xx lain langsung dikembalikan"""
+        for attempt in range(_WRITE_RETRY_ATTEMPTS):
+            last_attempt = attempt == _WRITE_RETRY_ATTEMPTS - 1
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.exceptions.ConnectTimeout:
+                # Koneksi belum terbentuk, request belum terkirim -> aman diulang
+                if last_attempt:
+                    raise
+            else:
+                if response.status_code not in _WRITE_RETRY_STATUSES or last_attempt:
+                    return response
+            delay = min(_WRITE_RETRY_CAP, _WRITE_RETRY_BASE * 2 ** attempt * (1 + random.random() * 0.5))
+            print(f"{colored_text(f'🔄 Transient error, retrying in {delay:.1f}s ({attempt + 1}/{_WRITE_RETRY_ATTEMPTS})...', YELLOW)}")
+            time.sleep(delay)
+
     def register_user_to_frame(self):
         """Register user ke Wreck League frame jika belum terdaftar"""
         try:
             # Get user info dari Warpcast API
-            headers = {
-                'authorization': f'Bearer {self.authorization_token}',
-                'content-type': 'application/json',
-                'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
             url = "https://client.warpcast.com/v2/me"
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.session.get(url, headers=self._warpcast_headers, timeout=_TIMEOUT)
             
             if response.status_code != 200:
                 print("❌ Could not get user info from Warpcast")
                 return False
                 
-            user_data = response.json().get('result', {}).get('user', {})
+            user_data = _json(response).get('result', {}).get('user', {})
             fid = user_data.get('fid')
             username = user_data.get('username')
             display_name = user_data.get('displayName')
@@ -312,6 +555,9 @@ class FarcasterAutoVote:
             print(f"   Username: @{username}")
             print(f"   Display Name: {display_name}")
             
+            # Satu notification token per registrasi, dipakai di user/add dan user/notification
+            notification_token = self._generate_uuid()
+            
             # Register user ke Wreck League
             register_payload = {
                 "user": {
@@ -324,23 +570,19 @@ class FarcasterAutoVote:
                     "clientFid": 9152,
                     "added": True,
                     "notificationDetails": {
-                        "token": self._generate_uuid(),
+                        "token": notification_token,
                         "url": "https://api.farcaster.xyz/v1/frame-notifications"
                     }
                 }
             }
             
             register_url = "https://versus-prod-api.wreckleague.xyz/v1/user/add"
-            register_headers = {
-                "accept": "*/*",
-                "content-type": "application/json",
-                "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
+            register_headers = self._register_headers
             
-            response = requests.post(register_url, 
-                                   headers=register_headers, 
-                                   json=register_payload, 
-                                   timeout=10)
+            response = self.session.post(register_url, 
+                                         headers=register_headers, 
+                                         json=register_payload, 
+                                         timeout=_TIMEOUT)
             
             if response.status_code in [200, 201]:
                 print("✅ User successfully registered to Wreck League!")
@@ -350,68 +592,67 @@ class FarcasterAutoVote:
                     "fid": fid,
                     "clientFid": 9152,
                     "notificationDetails": {
-                        "token": self._generate_uuid(),
+                        "token": notification_token,
                         "url": "https://api.farcaster.xyz/v1/frame-notifications"
                     }
                 }
                 
                 notification_url = "https://versus-prod-api.wreckleague.xyz/v1/user/notification"
-                requests.post(notification_url, 
-                            headers=register_headers, 
-                            json=notification_payload, 
-                            timeout=5)
+                self.session.post(notification_url, 
+                                  headers=register_headers, 
+                                  json=notification_payload, 
+                                  timeout=5)
                 
                 return True
             else:
-                print(f"{colored_text(f'❌ Registration failed: {response.status_code}', Colors.RED)}")
+                print(f"{colored_text(f'❌ Registration failed: {response.status_code}', RED)}")
                 return False
                 
         except Exception as e:
-            print(f"{colored_text(f'❌ Error registering user: {e}', Colors.RED)}")
+            print(f"{colored_text(f'❌ Error registering user: {e}', RED)}")
             return False
 
     def get_user_fuel_info(self, fid=None, skip_claim=False):
         """Get accurate fuel info with comprehensive debugging"""
         try:
             fid = fid or self.ensure_initialized()
-            print(f"{colored_text(f'🔍 Checking fuel for FID: {fid}', Colors.CYAN)}")
+            print(f"{colored_text(f'🔍 Checking fuel for FID: {fid}', CYAN)}")
             
             # Only claim fuel if not skipped (untuk avoid multiple claims per cycle)
             if not skip_claim:
                 try:
-                    print(f"{colored_text('🎁 Checking for claimable fuel rewards...', Colors.CYAN)}")
+                    print(f"{colored_text('🎁 Checking for claimable fuel rewards...', CYAN)}")
                     claim_success = self.claim_fuel_reward()
                     if claim_success:
                         time.sleep(2)  # Wait for balance to update
-                        print(f"{colored_text('✅ Fuel claimed, refreshing data...', Colors.GREEN)}")
+                        print(f"{colored_text('✅ Fuel claimed, refreshing data...', GREEN)}")
                     else:
-                        print(f"{colored_text('ℹ️ No fuel claimed, continuing with current balance...', Colors.YELLOW)}")
+                        print(f"{colored_text('ℹ️ No fuel claimed, continuing with current balance...', YELLOW)}")
                     time.sleep(1)
                 except Exception as e:
-                    print(f"{colored_text(f'⚠️ Reward check failed: {e}', Colors.YELLOW)}")
+                    print(f"{colored_text(f'⚠️ Reward check failed: {e}', YELLOW)}")
             else:
-                print(f"{colored_text('⏩ Skipping fuel claim check (already done this cycle)', Colors.CYAN)}")
+                print(f"{colored_text('⏩ Skipping fuel claim check (already done this cycle)', CYAN)}")
             
             url = f"https://versus-prod-api.wreckleague.xyz/v1/user/data?fId={fid}"
-            headers = {
-                "accept": "*/*",
-                "accept-language": "en-US,en;q=0.9",
-                "authorization": f"Bearer {self.authorization_token}",
-                "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
+            headers = self._user_data_headers
             
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.session.get(url, headers=headers, timeout=_TIMEOUT)
             
             if response.status_code == 404:
-                print(f"{colored_text('❌ User not found, attempting registration...', Colors.RED)}")
+                print(f"{colored_text('❌ User not found, attempting registration...', RED)}")
                 if self.register_user_to_frame():
-                    time.sleep(3)
-                    response = requests.get(url, headers=headers, timeout=10)
+                    response = self.session.get(url, headers=headers, timeout=_TIMEOUT)
+                    for delay in _REGISTER_POLL_DELAYS:
+                        if response.status_code == 200:
+                            break
+                        time.sleep(delay)
+                        response = self.session.get(url, headers=headers, timeout=_TIMEOUT)
                 else:
                     return 0
             
             if response.status_code == 200:
-                data = response.json()
+                data = _json(response)
                 
                 # Check for canClaimFuel
                 user_data = data.get('data', {}) if isinstance(data, dict) else {}
@@ -419,21 +660,11 @@ class FarcasterAutoVote:
                 
                 # Additional backup check menggunakan endpoint reward langsung
                 try:
-                    reward_headers = {
-                        'accept': '*/*',
-                        'accept-language': 'id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7',
-                        'sec-ch-ua': '"Not-A.Brand";v="99", "Chromium";v="124"',
-                        'sec-ch-ua-mobile': '?0',
-                        'sec-ch-ua-platform': '"Linux"',
-                        'sec-fetch-dest': 'empty',
-                        'sec-fetch-mode': 'cors',
-                        'sec-fetch-site': 'same-site'
-                    }
                     reward_url = f"https://versus-prod-api.wreckleague.xyz/v1/user/fuelReward?fId={fid}"
-                    reward_response = requests.get(reward_url, headers=reward_headers, timeout=5)
+                    reward_response = self.session.get(reward_url, headers=self._reward_headers, timeout=5)
                     
                     if reward_response.status_code == 200:
-                        reward_data = reward_response.json()
+                        reward_data = _json(reward_response)
                         
                         # Check for any claimable fuel indications
                         if isinstance(reward_data, dict):
@@ -442,14 +673,14 @@ class FarcasterAutoVote:
                                 if isinstance(reward_obj, dict):
                                     claimable = reward_obj.get('claimableFuel', 0)
                                     if claimable > 0:
-                                        print(f"{colored_text(f'🎁 BACKUP CHECK: Found {claimable} claimable fuel!', Colors.GREEN)}")
+                                        print(f"{colored_text(f'🎁 BACKUP CHECK: Found {claimable} claimable fuel!', GREEN)}")
                                         can_claim = True
                             
                             # Check untuk fuelsToCllaim di root level
                             if 'fuelsToCllaim' in reward_data:
                                 claimable = reward_data.get('fuelsToCllaim', 0)
                                 if claimable > 0:
-                                    print(f"{colored_text(f'🎁 BACKUP CHECK: Found {claimable} fuelsToCllaim!', Colors.GREEN)}")
+                                    print(f"{colored_text(f'🎁 BACKUP CHECK: Found {claimable} fuelsToCllaim!', GREEN)}")
                                     can_claim = True
                                     
                             # Check untuk fuelsData structure
@@ -458,92 +689,62 @@ class FarcasterAutoVote:
                                 if isinstance(fuels_data, dict) and 'fuelsToCllaim' in fuels_data:
                                     claimable = fuels_data.get('fuelsToCllaim', 0)
                                     if claimable > 0:
-                                        print(f"{colored_text(f'🎁 BACKUP CHECK: Found {claimable} fuels in fuelsData!', Colors.GREEN)}")
+                                        print(f"{colored_text(f'🎁 BACKUP CHECK: Found {claimable} fuels in fuelsData!', GREEN)}")
                                         can_claim = True
                 except Exception as reward_e:
-                    print(f"{colored_text(f'⚠️ Backup reward check failed: {reward_e}', Colors.YELLOW)}")
+                    print(f"{colored_text(f'⚠️ Backup reward check failed: {reward_e}', YELLOW)}")
                 
                 if can_claim:
-                    print(f"{colored_text('🎁 Can claim fuel: YES - Auto claiming...', Colors.GREEN)}")
+                    print(f"{colored_text('🎁 Can claim fuel: YES - Auto claiming...', GREEN)}")
                     if self.claim_fuel_reward():
                         time.sleep(2)
-                        response = requests.get(url, headers=headers, timeout=10)
+                        response = self.session.get(url, headers=headers, timeout=_TIMEOUT)
                         if response.status_code == 200:
-                            data = response.json()
-                            print(f"{colored_text('✅ Data refreshed after fuel claim', Colors.GREEN)}")
+                            data = _json(response)
+                            print(f"{colored_text('✅ Data refreshed after fuel claim', GREEN)}")
                 else:
-                    print(f"{colored_text('🎁 Can claim fuel: NO', Colors.YELLOW)}")
+                    print(f"{colored_text('🎁 Can claim fuel: NO', YELLOW)}")
                 
-                # Enhanced fuel path detection with better error handling
-                fuel_paths = [
-                    ['data', 'fuelBalance'],
-                    ['data', 'data', 'fuelBalance'],
-                    ['data', 'fuel'],
-                    ['data', 'data', 'fuel'],
-                    ['data', 'user', 'fuel'],
-                    ['fuel'],
-                    ['fuelBalance'],
-                    ['user', 'fuel'],
-                    ['data', 'user', 'fuelBalance']
-                ]
+                print(f"{colored_text('🔍 Checking fuel status...', CYAN)}")
                 
-                print(f"{colored_text('🔍 Checking fuel status...', Colors.CYAN)}")
-                
-                # Try fuel paths without verbose debugging
-                for path in fuel_paths:
-                    try:
-                        fuel_value = data
-                        for key in path:
-                            if isinstance(fuel_value, dict) and key in fuel_value:
-                                fuel_value = fuel_value[key]
-                            else:
-                                raise KeyError(f"Key '{key}' not found")
-                        
-                        if isinstance(fuel_value, (int, float)) and fuel_value >= 0:
+                # Try fuel paths without verbose debugging (dict.get, tanpa exception per path)
+                for path in self._FUEL_PATHS:
+                    fuel_value = data
+                    for key in path:
+                        fuel_value = fuel_value.get(key) if isinstance(fuel_value, dict) else None
+                    
+                    if isinstance(fuel_value, (int, float)) and fuel_value >= 0:
+                        if self.verbose:
                             path_str = " -> ".join(path)
-                            print(f"{colored_text(f'✅ Found fuel: {fuel_value} (via {path_str})', Colors.GREEN)}")
-                            return int(fuel_value)
-                            
-                    except:
-                        continue
+                            print(f"{colored_text(f'✅ Found fuel: {fuel_value} (via {path_str})', GREEN)}")
+                        else:
+                            print(f"{colored_text(f'✅ Found fuel: {fuel_value}', GREEN)}")
+                        return int(fuel_value)
                 
                 # If no fuel found, return 0 quietly
-                print(f"{colored_text('❌ No fuel found in account', Colors.RED)}")
+                print(f"{colored_text('❌ No fuel found in account', RED)}")
                 return 0
             else:
-                print(f"{colored_text(f'❌ API returned status {response.status_code}', Colors.RED)}")
-                print(f"{colored_text(f'Response: {response.text[:200]}', Colors.WHITE)}")
+                print(f"{colored_text(f'❌ API returned status {response.status_code}', RED)}")
+                print(f"{colored_text(f'Response: {response.text[:200]}', WHITE)}")
                 return 0
             
         except Exception as e:
-            print(f"{colored_text(f'❌ Critical error in fuel detection: {e}', Colors.RED)}")
+            print(f"{colored_text(f'❌ Critical error in fuel detection: {e}', RED)}")
             return 0
 
     def claim_fuel_reward(self):
         """Claim fuel reward if available"""
         try:
-            print(f"{colored_text('🎁 Checking for claimable fuel rewards...', Colors.YELLOW)}")
-            
-            # Headers yang sama persis dengan browser request dari enpointclaim.txt
-            headers = {
-                'accept': '*/*',
-                'accept-language': 'id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7',
-                'sec-ch-ua': '"Not-A.Brand";v="99", "Chromium";v="124"',
-                'sec-ch-ua-mobile': '?0',
-                'sec-ch-ua-platform': '"Linux"',
-                'sec-fetch-dest': 'empty',
-                'sec-fetch-mode': 'cors',
-                'sec-fetch-site': 'same-site',
-                'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
+            print(f"{colored_text('🎁 Checking for claimable fuel rewards...', YELLOW)}")
             
             # Step 1: Check for available rewards first (GET request)
             check_url = f"https://versus-prod-api.wreckleague.xyz/v1/user/fuelReward?fId={self.user_id}"
             
-            check_response = requests.get(check_url, headers=headers, timeout=10)
+            check_response = self.session.get(check_url, headers=self._reward_headers, timeout=_TIMEOUT)
             
             if check_response.status_code == 200:
-                reward_data = check_response.json()
+                reward_data = _json(check_response)
                 
                 # Multiple checks untuk detect claimable fuel
                 claimable_amount = 0
@@ -558,7 +759,7 @@ class FarcasterAutoVote:
                         claimable_amount = reward_data.get('fuel', 0)
                     elif 'fuelsToClaim' in reward_data:  # Correct spelling!
                         claimable_amount = reward_data.get('fuelsToClaim', 0)
-                        print(f"{colored_text(f'🎯 Found fuelsToClaim at root: {claimable_amount}', Colors.GREEN)}")
+                        print(f"{colored_text(f'🎯 Found fuelsToClaim at root: {claimable_amount}', GREEN)}")
                     
                     # Check di dalam 'data' object
                     if 'data' in reward_data and reward_data['data']:
@@ -571,7 +772,7 @@ class FarcasterAutoVote:
                             elif 'fuelsToClaim' in data_obj:  # Correct spelling!
                                 detected = data_obj.get('fuelsToClaim', 0)
                                 claimable_amount = max(claimable_amount, detected)
-                                print(f"{colored_text(f'🎯 Found fuelsToClaim in data: {detected}', Colors.GREEN)}")
+                                print(f"{colored_text(f'🎯 Found fuelsToClaim in data: {detected}', GREEN)}")
                             
                             # Check untuk flag canClaim atau similar
                             if 'canClaim' in data_obj and data_obj.get('canClaim'):
@@ -585,7 +786,7 @@ class FarcasterAutoVote:
                                 if 'fuelsToClaim' in fuels_data:  # Correct spelling!
                                     detected = fuels_data.get('fuelsToClaim', 0)
                                     claimable_amount = max(claimable_amount, detected)
-                                    print(f"{colored_text(f'🎯 Found fuelsToClaim in data.fuelsData: {detected}', Colors.GREEN)}")
+                                    print(f"{colored_text(f'🎯 Found fuelsToClaim in data.fuelsData: {detected}', GREEN)}")
                     
                     # Check nested dalam fuelsData jika ada di root (fallback)
                     if 'fuelsData' in reward_data:
@@ -593,34 +794,33 @@ class FarcasterAutoVote:
                         if isinstance(fuels_data, dict) and 'fuelsToClaim' in fuels_data:
                             detected = fuels_data.get('fuelsToClaim', 0)
                             claimable_amount = max(claimable_amount, detected)
-                            print(f"{colored_text(f'🎯 Found fuelsToClaim in root fuelsData: {detected}', Colors.GREEN)}")
+                            print(f"{colored_text(f'🎯 Found fuelsToClaim in root fuelsData: {detected}', GREEN)}")
                     
                     # Jika ada nilai claimable > 0, set flag
                     if claimable_amount > 0:
                         claim_available = True
                 
-                print(f"{colored_text(f'🎁 Claimable fuel detected: {claimable_amount}', Colors.CYAN)}")
+                print(f"{colored_text(f'🎁 Claimable fuel detected: {claimable_amount}', CYAN)}")
                 
                 # Attempt claim jika ada indikasi reward tersedia
                 if claim_available or claimable_amount > 0:
-                    print(f"{colored_text(f'🎁 Found claimable fuel! Attempting to claim...', Colors.GREEN)}")
+                    print(f"{colored_text(f'🎁 Found claimable fuel! Attempting to claim...', GREEN)}")
                     
                     # Step 2: Claim the rewards (POST request)
-                    claim_headers = headers.copy()
-                    claim_headers['content-type'] = 'application/json'
+                    claim_headers = self._claim_headers
                     
                     claim_payload = {"fId": self.user_id}
                     
-                    claim_response = requests.post(
+                    claim_response = self.session.post(
                         "https://versus-prod-api.wreckleague.xyz/v1/user/fuelReward", 
                         headers=claim_headers, 
                         json=claim_payload, 
-                        timeout=10
+                        timeout=_TIMEOUT
                     )
                     
                     if claim_response.status_code == 200:
-                        claim_result = claim_response.json()
-                        print(f"{colored_text('✅ Fuel reward claimed successfully!', Colors.GREEN)}")
+                        claim_result = _json(claim_response)
+                        print(f"{colored_text('✅ Fuel reward claimed successfully!', GREEN)}")
                         
                         # Try to extract new fuel balance
                         new_fuel = None
@@ -634,36 +834,36 @@ class FarcasterAutoVote:
                                 new_fuel = claim_result['fuel']
                         
                         if new_fuel is not None:
-                            print(f"{colored_text(f'⛽ New fuel balance: {new_fuel}', Colors.CYAN)}")
+                            print(f"{colored_text(f'⛽ New fuel balance: {new_fuel}', CYAN)}")
                         
                         return True
                     else:
-                        print(f"{colored_text(f'❌ Failed to claim fuel reward: {claim_response.status_code}', Colors.RED)}")
+                        print(f"{colored_text(f'❌ Failed to claim fuel reward: {claim_response.status_code}', RED)}")
                         if claim_response.text:
-                            print(f"{colored_text(f'Response: {claim_response.text}', Colors.YELLOW)}")
+                            print(f"{colored_text(f'Response: {claim_response.text}', YELLOW)}")
                         return False
                 else:
-                    print(f"{colored_text('ℹ️ No claimable fuel rewards available at this time', Colors.YELLOW)}")
+                    print(f"{colored_text('ℹ️ No claimable fuel rewards available at this time', YELLOW)}")
                     return False
             else:
-                print(f"{colored_text(f'❌ Failed to check fuel rewards: {check_response.status_code}', Colors.RED)}")
+                print(f"{colored_text(f'❌ Failed to check fuel rewards: {check_response.status_code}', RED)}")
                 if check_response.text:
-                    print(f"{colored_text(f'Response: {check_response.text}', Colors.YELLOW)}")
+                    print(f"{colored_text(f'Response: {check_response.text}', YELLOW)}")
                 return False
                 
         except Exception as e:
-            print(f"{colored_text(f'❌ Error in claim_fuel_reward: {e}', Colors.RED)}")
+            print(f"{colored_text(f'❌ Error in claim_fuel_reward: {e}', RED)}")
             return False
 
     def get_best_mech(self, match_id, team_preference=None):
         """Pilih mech terbaik berdasarkan win probability dan preferensi tim"""
         try:
-            print(f"{colored_text(f'🤖 Analyzing mechs for match {match_id}...', Colors.CYAN)}")
+            print(f"{colored_text(f'🤖 Analyzing mechs for match {match_id}...', CYAN)}")
             
             # Get match details untuk mech list
             match_details = self.get_match_details()
             if not match_details or 'data' not in match_details:
-                print(f"{colored_text('❌ Could not get match details', Colors.RED)}")
+                print(f"{colored_text('❌ Could not get match details', RED)}")
                 return None
             
             # Find mechs in match data
@@ -675,62 +875,83 @@ class FarcasterAutoVote:
                 mechs = current_match['mechs']
             
             if not mechs:
-                print(f"{colored_text('❌ No mechs found in match data', Colors.RED)}")
+                print(f"{colored_text('❌ No mechs found in match data', RED)}")
                 return None
             
             # Select best mech (simple: first one with highest win probability)
             best_mech = max(mechs, key=lambda x: x.get('winProbability', 0))
             mech_name = best_mech.get('name', 'Unknown')
-            print(f"{colored_text(f'🏆 Selected mech: {mech_name}', Colors.GREEN)}")
+            print(f"{colored_text(f'🏆 Selected mech: {mech_name}', GREEN)}")
             return best_mech
             
         except Exception as e:
-            print(f"{colored_text(f'❌ Error in get_best_mech: {e}', Colors.RED)}")
+            print(f"{colored_text(f'❌ Error in get_best_mech: {e}', RED)}")
             return None
 
-    def get_match_details(self):
-        """Mendapatkan detail match terbaru - prioritas endpoint terstable"""
-        try:
-            # Prioritas endpoint yang paling stabil
-            endpoints = [
+    def _get_match_endpoints(self):
+        """Tuple endpoint match details (prioritas paling stabil dulu), dibangun ulang hanya jika user_id berubah"""
+        endpoints_fid, endpoints = self._match_endpoints
+        if endpoints_fid != self.user_id or not endpoints:
+            endpoints = (
                 f"https://versus-prod-api.wreckleague.xyz/v1/match/details?fId={self.user_id}",
                 f"https://versus-prod-api.wreckleague.xyz/v1/analysis?fId={self.user_id}",
                 "https://versus-prod-api.wreckleague.xyz/v1/analysis"
-            ]
+            )
+            self._match_endpoints = (self.user_id, endpoints)
+        return endpoints
+
+    def seed_match_details(self, data, fetched_at):
+        """Isi cache match details dengan payload yang sudah di-fetch di luar (mis. sekali per cycle)"""
+        # Pakai waktu fetch asli (time.monotonic) supaya TTL tetap berlaku dan payload lama tidak dianggap fresh
+        if data:
+            self._match_cache = (fetched_at, data)
+
+    def _read_match_response(self, index, url, get_response):
+        """Ambil satu response endpoint match details, return payload jika 200 atau None"""
+        try:
+            print(f"🔍 Trying primary endpoint {index}: {url.split('/')[-1]}")
+            response = get_response()
+            print(f"📊 Response status: {response.status_code}")
             
-            # Headers yang lebih lengkap seperti di script asli
-            headers = {
-                "accept": "*/*",
-                "accept-language": "en-US,en;q=0.9",
-                "if-none-match": 'W/"100b-Y/gj6927mGNPyq8v7gTfbP0qRuM"',
-                "priority": "u=1, i",
-                "sec-ch-ua": '"Not;A=Brand";v="99", "Microsoft Edge";v="139", "Chromium";v="139"',
-                "sec-ch-ua-mobile": "?0",
-                "sec-ch-ua-platform": '"Windows"',
-                "sec-fetch-dest": "empty",
-                "sec-fetch-mode": "cors",
-                "sec-fetch-site": "same-site",
-                "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36 Edg/139.0.0.0"
-            }
+            if response.status_code == 200:
+                data = _json(response)
+                print(f"✅ Match details retrieved successfully from endpoint {index}")
+                return data
+            print(f"⚠️ Endpoint {index} returned {response.status_code}")
+        except Exception as e:
+            print(f"❌ Endpoint {index} error: {e}")
+        return None
+
+    def get_match_details(self, force_refresh=False):
+        """Mendapatkan detail match terbaru - prioritas endpoint terstable (di-cache 5 detik)"""
+        # submit_prediction, get_best_mech, dan get_latest_match_id memakai payload yang sama
+        cached_at, cached_data = self._match_cache
+        if not force_refresh and cached_data is not None and time.monotonic() - cached_at < _MATCH_CACHE_TTL:
+            return cached_data
+        
+        try:
+            endpoints = self._get_match_endpoints()
+            headers = self._MATCH_HEADERS
             
             print(f"🔍 Getting match details for FID: {self.user_id}")
             
-            for i, url in enumerate(endpoints, 1):
-                try:
-                    print(f"🔍 Trying primary endpoint {i}: {url.split('/')[-1]}")
-                    response = requests.get(url, headers=headers, timeout=10)
-                    print(f"📊 Response status: {response.status_code}")
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        print(f"✅ Match details retrieved successfully from endpoint {i}")
-                        return data
-                    else:
-                        print(f"⚠️ Endpoint {i} returned {response.status_code}")
-                        
-                except Exception as e:
-                    print(f"❌ Endpoint {i} error: {e}")
-                    continue
+            primary, fallbacks = endpoints[0], endpoints[1:]
+            data = self._read_match_response(
+                1, primary, lambda: self.session.get(primary, headers=headers, timeout=_TIMEOUT))
+            
+            if data is None:
+                # Endpoint utama gagal: fallback di-request paralel lewat executor bersama,
+                # hasil tetap diambil sesuai prioritas
+                futures = [_FALLBACK_EXECUTOR.submit(self.session.get, url, headers=headers, timeout=_TIMEOUT)
+                           for url in fallbacks]
+                for index, (url, future) in enumerate(zip(fallbacks, futures), 2):
+                    data = self._read_match_response(index, url, future.result)
+                    if data is not None:
+                        break
+            
+            if data is not None:
+                self._match_cache = (time.monotonic(), data)
+                return data
             
             print("❌ All endpoints failed to get match details")
             return None
@@ -740,24 +961,13 @@ class FarcasterAutoVote:
             return None
 
     def get_latest_match_id(self, fid=None):
-        """Mendapatkan match ID terbaru yang tersedia"""
+        """Mendapatkan match ID terbaru yang tersedia (dari match details yang di-cache)"""
         try:
-            fid = fid or self.user_id
-            # Coba endpoint untuk list match atau active match
-            url = f"https://versus-prod-api.wreckleague.xyz/v1/match/details?fId={fid}"
-            
-            headers = {
-                "accept": "*/*",
-                "accept-language": "en-US,en;q=0.9",
-                "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-            
-            response = requests.get(url, headers=headers)
-            print(f"🔍 Checking for latest match... Status: {response.status_code}")
+            # Endpoint yang sama dengan get_match_details, jadi pakai payload cache-nya
+            data = self.get_match_details()
+            print("🔍 Checking for latest match...")
             
-            if response.status_code == 200:
-                data = response.json()
-                
+            if data:
                 if data.get('data') and data['data'].get('matchDetails'):
                     match_details = data['data']['matchDetails']
                     if isinstance(match_details, list) and len(match_details) > 0:
@@ -787,13 +997,18 @@ class FarcasterAutoVote:
                 else:
                     print("⚠️ No match data in response")
             else:
-                print(f"❌ Failed to get latest match: {response.status_code}")
+                print("❌ Failed to get latest match")
             
             return None
         except Exception as e:
             print(f"❌ Error getting latest match ID: {e}")
             return None
 
+    def _mech_team(self, index, mech):
+        """Tim sebuah mech dari posisinya; field mechType (jika ada) menimpa tebakan dari posisi"""
+        team = self._TEAM_BY_INDEX[index] if index < 2 else ""
+        return self._TEAM_BY_MECH_TYPE.get(mech.get('mechType'), team)
+
     def select_mech_by_preference(self, mech_details):
         """
         Pilih mech berdasarkan preferensi tim atau strategy terbaik
@@ -802,80 +1017,60 @@ class FarcasterAutoVote:
             mech_details (list): List detail mech dari match
             
         Returns:
-            dict: Mech yang dipilih
+            tuple: (index, mech) yang dipilih, atau (None, None) jika kosong
         """
         if not mech_details:
-            return None
+            return None, None
             
         if len(mech_details) == 1:
-            return mech_details[0]
+            return 0, mech_details[0]
         
-        # Jika ada preferensi tim
-        if self.team_preference:
+        # Jika ada preferensi tim yang dikenali
+        if self._normalized_pref:
             # Coba identifikasi tim berdasarkan posisi atau data
             for i, mech in enumerate(mech_details):
-                team_indicator = ""
-                
-                # CORRECTED MAPPING:
-                # Blue = Index 0 (Team pertama), Red = Index 1 (Team kedua)
-                if i == 0:
-                    team_indicator = "blue"   # Index 0 = Blue Team
-                elif i == 1:
-                    team_indicator = "red"    # Index 1 = Red Team
+                team_indicator = self._mech_team(i, mech)
                 
-                # Cek berdasarkan field mechType jika ada
-                if 'mechType' in mech:
-                    if mech['mechType'] == 'left':
-                        team_indicator = "blue"   # Left = Blue Team
-                    elif mech['mechType'] == 'right':
-                        team_indicator = "red"    # Right = Red Team
-                
-                # Match dengan preferensi user (CORRECTED)
-                if (self.team_preference in ['blue', 'biru', 'kanan', 'right'] and team_indicator == "blue") or \
-                   (self.team_preference in ['red', 'merah', 'kiri', 'left'] and team_indicator == "red"):
+                # Match dengan preferensi user
+                if team_indicator == self._normalized_pref:
                     print(f"🎯 Selected mech by team preference: {self.team_preference} -> {mech['mechId']}")
                     print(f"   Team: {team_indicator.upper()} (Index: {i})")
-                    return mech
+                    return i, mech
         
         # Jika tidak ada preferensi atau tidak ditemukan, pilih yang terbaik
         # Prioritas: 1. Winning probability, 2. Vote count, 3. Fuel points
-        best_mech = max(mech_details, key=lambda m: (
-            m.get('winningProbability', 0),
-            m.get('mechVotes', {}).get('voteCount', 0),
-            m.get('mechVotes', {}).get('fuelPoints', 0)
+        best_index = max(range(len(mech_details)), key=lambda i: (
+            mech_details[i].get('winningProbability', 0),
+            mech_details[i].get('mechVotes', {}).get('voteCount', 0),
+            mech_details[i].get('mechVotes', {}).get('fuelPoints', 0)
         ))
+        best_mech = mech_details[best_index]
         
         print(f"🎯 Selected best mech: {best_mech['mechId']}")
         print(f"   Win Probability: {best_mech.get('winningProbability', 0)}%")
-        return best_mech
+        return best_index, best_mech
 
     def submit_prediction(self, fid=None, mech_id=None, match_id=None, fuel_points=None):
         """Submit prediction/vote dengan fuel points dan auto claim fuel"""
         try:
             fid = fid or self.user_id
             
-            # Auto check dan claim fuel sebelum voting
-            print(f"\n{colored_text('⛽ Checking fuel status before voting...', Colors.YELLOW)}")
-            current_fuel = self.get_user_fuel_info()
-            print(f"{colored_text(f'💰 Available fuel: {current_fuel}', Colors.GREEN)}")
-            
-            # Auto-detect latest match ID jika tidak disediakan
-            if not match_id:
-                print(f"{colored_text('🔍 Auto-detecting latest match ID...', Colors.CYAN)}")
-                match_id = self.get_latest_match_id(fid)
-                if not match_id:
-                    print(f"{colored_text('❌ Could not auto-detect match ID', Colors.RED)}")
-                    return False
-                print(f"{colored_text(f'✅ Using auto-detected match ID: {match_id}', Colors.GREEN)}")
+            # Auto check/claim fuel dan ambil match details secara paralel (keduanya independen)
+            print(f"\n{colored_text('⛽ Checking fuel status before voting...', YELLOW)}")
+            current_fuel, match_details = self._fetch_parallel(self.get_user_fuel_info, self.get_match_details)
+            print(f"{colored_text(f'💰 Available fuel: {current_fuel}', GREEN)}")
             
-            # Ambil match details untuk data terbaru  
-            match_details = self.get_match_details()
             if not match_details or 'data' not in match_details or not match_details['data']['matchData']:
-                print(f"{colored_text('❌ No active match found', Colors.RED)}")
+                print(f"{colored_text('❌ No active match found', RED)}")
                 return False
 
             current_match = match_details['data']['matchData'][0]
             
+            # Match ID diambil dari match details yang sama (tidak perlu request get_latest_match_id)
+            if not match_id:
+                match_id = current_match['_id']
+                print(f"{colored_text(f'✅ Using auto-detected match ID: {match_id}', GREEN)}")
+            
             # Cek apakah sudah vote - tapi tetap lanjut karena bisa vote tim yang sama
             if current_match.get('isVoted', False):
                 print("ℹ️  Previous vote detected, checking if additional vote possible...")
@@ -894,19 +1089,15 @@ class FarcasterAutoVote:
             # Pilih mech berdasarkan preferensi atau strategy
             if not mech_id and 'mechDetails' in current_match:
                 mech_details = current_match['mechDetails']
-                selected_mech = self.select_mech_by_preference(mech_details)
+                mech_index, selected_mech = self.select_mech_by_preference(mech_details)
                 
                 if selected_mech:
                     mech_id = selected_mech['mechId']
                     
-                    # Tampilkan info mech yang dipilih
+                    # Tampilkan info mech yang dipilih, label dari tim yang sama dengan saat seleksi
                     team_info = ""
                     if len(mech_details) >= 2:
-                        mech_index = next((i for i, m in enumerate(mech_details) if m['mechId'] == mech_id), -1)
-                        if mech_index == 0:
-                            team_info = " (🔴 Tim Merah/Kiri)"  # Index 0 = Merah = Kiri
-                        elif mech_index == 1:
-                            team_info = " (🔵 Tim Biru/Kanan)"  # Index 1 = Biru = Kanan
+                        team_info = self._TEAM_LABELS.get(self._mech_team(mech_index, selected_mech), "")
                     
                     print(f"🎯 Selected mech {mech_id}{team_info}")
                     
@@ -971,21 +1162,9 @@ class FarcasterAutoVote:
             
             # Submit prediction
             url = "https://versus-prod-api.wreckleague.xyz/v2/matches/predict"
-            headers = {
-                "accept": "*/*",
-                "accept-language": "en-US,en;q=0.9",
-                "content-type": "application/json",
-                "priority": "u=1, i",
-                "sec-ch-ua": '"Not;A=Brand";v="99", "Microsoft Edge";v="139", "Chromium";v="139"',
-                "sec-ch-ua-mobile": "?0",
-                "sec-ch-ua-platform": '"Windows"',
-                "sec-fetch-dest": "empty",
-                "sec-fetch-mode": "cors",
-                "sec-fetch-site": "same-site",
-                "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36 Edg/139.0.0.0"
-            }
+            headers = self._PREDICT_HEADERS
             
-            print(f"\n{colored_text('🚀 Submitting prediction to blockchain...', Colors.BOLD + Colors.CYAN)}")
+            print(f"\n{colored_text('🚀 Submitting prediction to blockchain...', BOLD + CYAN)}")
             
             # Create a beautiful prediction info box
             pred_info = [
@@ -995,17 +1174,18 @@ class FarcasterAutoVote:
                 f"⛽ Fuel Points: {fuel_points}"
             ]
             
-            print_colored_box("PREDICTION DETAILS", pred_info, Colors.CYAN)
+            print_colored_box("PREDICTION DETAILS", pred_info, CYAN)
             
-            response = requests.put(url, headers=headers, json=payload, timeout=10)
+            # Body di-encode sendiri (content-type sudah ada di _PREDICT_HEADERS)
+            response = self._request_with_retry("PUT", url, headers=headers, data=_dumps(payload), timeout=_TIMEOUT)
             
             if response.status_code == 200:
-                result = response.json()
+                result = _json(response)
                 print_simple_status("🎉 Prediction submitted successfully! 🎯", "success")
                 return True
             else:
                 try:
-                    error_data = response.json()
+                    error_data = _json(response)
                     if 'message' in error_data:
                         print_simple_status(f"❌ Error: {error_data['message']}", "error")
                     else:
@@ -1021,27 +1201,27 @@ class FarcasterAutoVote:
     def run_auto_vote(self):
         """Main function untuk auto vote"""
         try:
-            print(f"{colored_text('🚀 Starting auto vote process...', Colors.BOLD + Colors.CYAN)}")
-            print(f"{colored_text(f'👤 User FID: {self.user_id}', Colors.YELLOW)}")
-            print(f"{colored_text(f'⛽ Fuel amount: {self.fuel_amount}', Colors.GREEN)}")
+            print(f"{colored_text('🚀 Starting auto vote process...', BOLD + CYAN)}")
+            print(f"{colored_text(f'👤 User FID: {self.user_id}', YELLOW)}")
+            print(f"{colored_text(f'⛽ Fuel amount: {self.fuel_amount}', GREEN)}")
             team_pref = self.team_preference or "Auto"
-            print(f"{colored_text(f'🎯 Team preference: {team_pref}', Colors.MAGENTA)}")
+            print(f"{colored_text(f'🎯 Team preference: {team_pref}', MAGENTA)}")
             
             # Initialize vote counter
             self.votes_submitted = 0
             
             # Step 1: Check and claim fuel rewards before voting
-            print(f"\n{colored_text('🎁 Checking for fuel rewards...', Colors.CYAN)}")
+            print(f"\n{colored_text('🎁 Checking for fuel rewards...', CYAN)}")
             try:
                 self.claim_fuel_reward()
                 time.sleep(1)  # Brief delay after claiming
             except Exception as e:
-                print(f"{colored_text(f'⚠️ Fuel claim check failed, continuing: {e}', Colors.YELLOW)}")
+                print(f"{colored_text(f'⚠️ Fuel claim check failed, continuing: {e}', YELLOW)}")
             
             # Get match details
             match_details = self.get_match_details()
             if not match_details:
-                print(f"{colored_text('❌ Could not get match details', Colors.RED)}")
+                print(f"{colored_text('❌ Could not get match details', RED)}")
                 return False
             
             # Get timing info
@@ -1054,27 +1234,47 @@ class FarcasterAutoVote:
             
             if success:
                 self.votes_submitted = 1  # Track successful vote
-                print(f"{colored_text('🎉 Vote submitted successfully! 🎯', Colors.BOLD + Colors.GREEN)}")
+                print(f"{colored_text('🎉 Vote submitted successfully! 🎯', BOLD + GREEN)}")
                 return True
             else:
-                print(f"{colored_text('❌ Vote submission failed!', Colors.RED)}")
+                print(f"{colored_text('❌ Vote submission failed!', RED)}")
                 return False
                 
         except Exception as e:
-            print(f"{colored_text(f'❌ Error in auto vote: {e}', Colors.RED)}")
+            print(f"{colored_text(f'❌ Error in auto vote: {e}', RED)}")
             return False
 
+    @classmethod
+    def run_batch(cls, tokens, fuel_amount=1, team_preference=None, max_workers=10):
+        """Submit prediction untuk banyak token sekaligus (thread per akun), return list bool sesuai urutan tokens"""
+        if not tokens:
+            return []
+
+        def vote(token):
+            bot = cls(token, fuel_amount=fuel_amount, team_preference=team_preference, verbose=False)
+            return bool(bot.user_id) and bot.submit_prediction()
+
+        results = [False] * len(tokens)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(tokens))) as executor:
+            futures = {executor.submit(vote, token): i for i, token in enumerate(tokens)}
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    print(f"{colored_text(f'❌ Batch vote error (account {i + 1}): {e}', RED)}")
+        return results
+
 def load_authorization_token(file_path="account.txt"):
     """Load multiple authorization tokens dari file"""
     try:
-        tokens = []
         if os.path.exists(file_path):
             with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                for line in lines:
-                    token = line.strip()
-                    if token and token.startswith('MK-'):
-                        tokens.append(token)
+                found = [token for token in (line.strip() for line in f) if token.startswith('MK-')]
+            # Token dobel akan menjalankan dua bot untuk akun yang sama, jadi dibuang (urutan tetap)
+            tokens = list(dict.fromkeys(found))
+            if len(tokens) < len(found):
+                print(f"⚠️ Skipped {len(found) - len(tokens)} duplicate token(s)")
             
             if tokens:
                 print(f"✅ Loaded {len(tokens)} authorization token(s)")
@@ -1089,7 +1289,47 @@ def load_authorization_token(file_path="account.txt"):
         print(f"❌ Error loading tokens: {e}")
         return []
 
-def process_single_account_vote(account_info, team_preference, fuel_strategy, custom_fuel, results_queue):
+# Payload match dibagi ke semua akun dalam satu cycle, jadi cukup di-fetch sekali.
+# Field per-user (status vote milik akun yang dipakai untuk fetch) dibuang supaya tidak
+# terbaca sebagai status akun lain
+_SHARED_MATCH_TTL = 15.0
+_PER_USER_MATCH_FIELDS = frozenset({'isVoted'})
+_shared_match_lock = threading.Lock()
+_shared_match = (float('-inf'), None)
+
+def _strip_per_user_fields(data):
+    """Salinan payload match details tanpa field per-user di setiap matchData"""
+    matches = (data.get('data') or {}).get('matchData') if isinstance(data, dict) else None
+    if not matches:
+        return data
+    stripped = [
+        {key: value for key, value in match.items() if key not in _PER_USER_MATCH_FIELDS} if isinstance(match, dict) else match
+        for match in matches
+    ]
+    return {**data, 'data': {**data['data'], 'matchData': stripped}}
+
+def get_match_details_shared(bot, ttl=_SHARED_MATCH_TTL):
+    """Match details dari cache bersama antar akun/thread sebagai (cached_at, data); fetch ulang lewat bot jika lebih tua dari ttl"""
+    global _shared_match
+    # Lock ditahan selama fetch supaya thread lain menunggu hasil yang sama, bukan ikut fetch
+    with _shared_match_lock:
+        cached_at, cached_data = _shared_match
+        if cached_data is not None and time.monotonic() - cached_at < ttl:
+            return _shared_match
+        fetched_at = time.monotonic()
+        data = bot.get_match_details(force_refresh=True)
+        if not data:
+            return fetched_at, None
+        _shared_match = (fetched_at, _strip_per_user_fields(data))
+        return _shared_match
+
+def _lazy_account_bot(account):
+    """Bot ringan untuk request match, pakai FID akun yang sudah terdeteksi jika ada"""
+    bot = FarcasterAutoVote(account['token'], 1, 10, None, lazy_init=True)
+    bot.user_id = account.get('fid') or bot.detect_fid_from_token()
+    return bot
+
+def process_single_account_vote(account_info, team_preference, fuel_strategy, custom_fuel, match_details=None, match_fetched_at=None):
     """Process single account voting in thread"""
     try:
         account_index = account_info['index']
@@ -1100,7 +1340,9 @@ def process_single_account_vote(account_info, team_preference, fuel_strategy, cu
         
         # Initialize bot instance
         fuel_amount = custom_fuel if fuel_strategy == "custom" else None
-        bot = FarcasterAutoVote(token, fuel_amount, 10, team_preference)
+        bot = FarcasterAutoVote(token, fuel_amount, 10, team_preference, verbose=False)
+        if match_fetched_at is not None:
+            bot.seed_match_details(match_details, match_fetched_at)
         
         # Run voting process
         success = bot.run_auto_vote()
@@ -1115,7 +1357,6 @@ def process_single_account_vote(account_info, team_preference, fuel_strategy, cu
             'votes_count': votes_count
         }
         
-        results_queue.put(result)
         vote_status = f"Success ({votes_count} votes)" if success else "Failed"
         print(f"✅ [Thread-{account_index}] Account {account_index} voting completed: {vote_status}")
         
@@ -1129,7 +1370,6 @@ def process_single_account_vote(account_info, team_preference, fuel_strategy, cu
             'error': str(e),
             'votes_count': 0
         }
-        results_queue.put(error_result)
         print(f"❌ [Thread-{account_info['index']}] Error in account {account_info['index']}: {e}")
         return error_result
 
@@ -1155,7 +1395,12 @@ def run_account_continuous_thread(account_info, thread_id, delay_config=None, te
             min_delay, max_delay = 30, 300  # Default threading delay
         
         print(f"\n🧵 [Thread-{thread_id+1}] Starting continuous voting for Account {account['index']} (FID: Auto-detecting...)")
-        print(f"{colored_text(f'🎲 [Thread-{thread_id+1}] Delay config: {format_duration(min_delay)} - {format_duration(max_delay)} (for continuous mode)', Colors.MAGENTA)}")
+        print(f"{colored_text(f'🎲 [Thread-{thread_id+1}] Delay config: {format_duration(min_delay)} - {format_duration(max_delay)} (for continuous mode)', MAGENTA)}")
+        
+        # Jitter start per thread (pengganti sleep 2 detik per akun saat start) supaya request pertama
+        # semua akun tidak menghantam API bersamaan
+        start_jitter = random.uniform(0, min(2 * len(account_info), 10))
+        time.sleep(start_jitter)
         
         # Initialize bot untuk account ini dengan konfigurasi global
         # Team preference conversion: "auto" -> None for FarcasterAutoVote
@@ -1163,7 +1408,8 @@ def run_account_continuous_thread(account_info, thread_id, delay_config=None, te
         
         # Create bot dengan fuel_amount = None untuk max strategy (akan detect real-time)
         # Use lazy_init=False to ensure FID detection works properly
-        bot = FarcasterAutoVote(token, None, 10, bot_team_pref, lazy_init=False)
+        # verbose=False: log ringkas karena banyak thread menulis ke terminal yang sama
+        bot = FarcasterAutoVote(token, None, 10, bot_team_pref, lazy_init=False, verbose=False)
         
         print(f"🎯 [Thread-{thread_id+1}] Fuel strategy: {fuel_strategy}")
         print(f"⛽ [Thread-{thread_id+1}] Min fuel threshold: {min_fuel_threshold}")
@@ -1177,8 +1423,8 @@ def run_account_continuous_thread(account_info, thread_id, delay_config=None, te
             try:
                 account_cycle_count += 1  # Independent counter
                 
-                # Real-time fuel detection untuk setiap voting cycle
-                current_account_fuel = bot.get_user_fuel_info()
+                # Real-time fuel detection + match details untuk setiap voting cycle, satu putaran paralel
+                current_account_fuel, match_details = bot._fetch_parallel(bot.get_user_fuel_info, bot.get_match_details)
                 print(f"\n💰 [Account-{account['index']}] Current fuel: {current_account_fuel}")
                 
                 # Determine fuel amount per cycle berdasarkan strategy dan fuel aktual
@@ -1208,20 +1454,18 @@ def run_account_continuous_thread(account_info, thread_id, delay_config=None, te
                 # Update bot dengan fuel amount yang benar untuk cycle ini
                 bot.fuel_amount = vote_fuel_amount
                 
-                print(f"\n{colored_text('╔' + '═' * 68 + '╗', Colors.MAGENTA)}")
+                print(f"\n{_BOX_TOP_MAGENTA}")
                 # Use bot.user_id instead of account['fid'] for accurate display
                 display_fid = bot.user_id if bot.user_id else fid
                 thread_text = f"🔄 [Account-{account['index']}] Personal Cycle #{account_cycle_count} (FID: {display_fid})"
-                print(f"{colored_text('║', Colors.MAGENTA)} {colored_text(thread_text, Colors.BOLD + Colors.WHITE):>60} {colored_text('║', Colors.MAGENTA)}")
-                print(f"{colored_text('╚' + '═' * 68 + '╝', Colors.MAGENTA)}")
+                print(f"{_BOX_EDGE_MAGENTA} {colored_text(thread_text, BOLD + WHITE):>60} {_BOX_EDGE_MAGENTA}")
+                print(_BOX_BOTTOM_MAGENTA)
                 
-                current_fuel = bot.get_user_fuel_info()
-                print(f"{colored_text(f'⛽ [Account-{account['index']}] Current fuel: {current_fuel}', Colors.GREEN)}")
+                # Fuel dan match details sudah diambil di awal cycle (tanpa GET + claim check kedua)
+                print(f"{colored_text(f'⛽ [Account-{account['index']}] Current fuel: {current_account_fuel}', GREEN)}")
                 
-                # Get match details
-                match_details = bot.get_match_details()
                 if not match_details or 'data' not in match_details or not match_details['data']['matchData']:
-                    print(f"{colored_text(f'❌ [Account-{account['index']}] No active match found, waiting 2 minutes...', Colors.RED)}")
+                    print(f"{colored_text(f'❌ [Account-{account['index']}] No active match found, waiting 2 minutes...', RED)}")
                     time.sleep(120)
                     continue
                 
@@ -1230,158 +1474,144 @@ def run_account_continuous_thread(account_info, thread_id, delay_config=None, te
                 
                 # Check if this is a new match
                 if last_match_id != match_id:
-                    print(f"{colored_text(f'🆕 [Account-{account['index']}] New match detected: {match_id[:10]}...', Colors.GREEN)}")
+                    print(f"{colored_text(f'🆕 [Account-{account['index']}] New match detected: {match_id[:10]}...', GREEN)}")
                     last_match_id = match_id
                     
                     if is_first_vote:
                         # Voting pertama - TANPA delay
                         vote_delay_seconds = 0
-                        print(f"{colored_text(f'🚀 [Account-{account['index']}] First vote - NO DELAY (immediate voting)', Colors.GREEN)}")
+                        print(f"{colored_text(f'🚀 [Account-{account['index']}] First vote - NO DELAY (immediate voting)', GREEN)}")
                         is_first_vote = False
                     else:
                         # Continuous voting - DENGAN delay random
                         vote_delay_seconds = random.randint(min_delay, max_delay)
-                        print(f"{colored_text(f'🎲 [Account-{account['index']}] Continuous mode delay: {format_duration(vote_delay_seconds)} after voting starts', Colors.MAGENTA)}")
+                        print(f"{colored_text(f'🎲 [Account-{account['index']}] Continuous mode delay: {format_duration(vote_delay_seconds)} after voting starts', MAGENTA)}")
                 
                 # PROPER timing detection dan handling
                 status, remaining_time = show_match_timing_info(current_match)
-                print(f"{colored_text(f'📊 [Account-{account['index']}] Match Status: {status.upper()}', Colors.CYAN)}")
+                print(f"{colored_text(f'📊 [Account-{account['index']}] Match Status: {status.upper()}', CYAN)}")
                 
                 if status == 'waiting':
-                    print(f"{colored_text(f'⏳ [Thread-{thread_id+1}] Voting not started yet, waiting {format_duration(remaining_time)}...', Colors.YELLOW)}")
+                    print(f"{colored_text(f'⏳ [Thread-{thread_id+1}] Voting not started yet, waiting {format_duration(remaining_time)}...', YELLOW)}")
                     
                     # Wait dengan countdown yang akurat
                     voting_start_str = current_match.get('votingStartTime')
                     if voting_start_str:
                         voting_start = parse_iso_time(voting_start_str)
                         
-                        while datetime.datetime.now(pytz.UTC) < voting_start:
-                            remaining = (voting_start - datetime.datetime.now(pytz.UTC)).total_seconds()
-                            if remaining <= 0:
-                                break
-                            print(f"{colored_text(f'⏰ [Thread-{thread_id+1}] Voting starts in {format_duration(remaining)}', Colors.CYAN)}", end='\r')
-                            time.sleep(min(30, remaining))
+                        if voting_start:
+                            _sleep_until(time.monotonic() + (voting_start - datetime.datetime.now(_UTC)).total_seconds(), tick=30,
+                                         on_tick=_progress_printer(f"⏰ [Thread-{thread_id+1}] Voting starts in {{}}", CYAN))
                         
-                        print(f"\n{colored_text(f'🚀 [Thread-{thread_id+1}] Voting window opened!', Colors.GREEN)}")
+                        print(f"\n{colored_text(f'🚀 [Thread-{thread_id+1}] Voting window opened!', GREEN)}")
                         
                         # Apply delay logic berdasarkan first vote atau continuous
                         if vote_delay_seconds > 0:
-                            print(f"{colored_text(f'🎲 [Thread-{thread_id+1}] Waiting random delay {format_duration(vote_delay_seconds)} before voting...', Colors.MAGENTA)}")
+                            print(f"{colored_text(f'🎲 [Thread-{thread_id+1}] Waiting random delay {format_duration(vote_delay_seconds)} before voting...', MAGENTA)}")
                             
-                            # Countdown untuk random delay
-                            delay_remaining = vote_delay_seconds
-                            while delay_remaining > 0:
-                                print(f"{colored_text(f'⏳ [Thread-{thread_id+1}] Voting in {format_duration(delay_remaining)}', Colors.YELLOW)}", end='\r')
-                                sleep_time = min(10, delay_remaining)  # Update setiap 10 detik
-                                time.sleep(sleep_time)
-                                delay_remaining -= sleep_time
+                            # Countdown untuk random delay (deadline monotonic, tidak drift)
+                            _sleep_until(time.monotonic() + vote_delay_seconds,
+                                         on_tick=_progress_printer(f"⏳ [Thread-{thread_id+1}] Voting in {{}}", YELLOW))
                             
-                            print(f"\n{colored_text(f'🎯 [Thread-{thread_id+1}] Random delay finished, voting now!', Colors.GREEN)}")
+                            print(f"\n{colored_text(f'🎯 [Thread-{thread_id+1}] Random delay finished, voting now!', GREEN)}")
                         else:
-                            print(f"{colored_text(f'🎯 [Thread-{thread_id+1}] No delay - voting immediately!', Colors.GREEN)}")
+                            print(f"{colored_text(f'🎯 [Thread-{thread_id+1}] No delay - voting immediately!', GREEN)}")
                     
                 elif status == 'open':
-                    print(f"{colored_text(f'✅ [Thread-{thread_id+1}] Voting is open!', Colors.GREEN)}")
+                    print(f"{colored_text(f'✅ [Thread-{thread_id+1}] Voting is open!', GREEN)}")
                     
                     # Check berapa lama voting sudah berjalan dan apply delay logic
                     voting_start_str = current_match.get('votingStartTime')
                     if voting_start_str and vote_delay_seconds > 0:
                         voting_start = parse_iso_time(voting_start_str)
-                        now_utc = datetime.datetime.now(pytz.UTC)
+                        now_utc = datetime.datetime.now(_UTC)
                         time_since_start = (now_utc - voting_start).total_seconds()
                         
                         if time_since_start < vote_delay_seconds:
                             # Masih dalam periode delay, tunggu sisa delay
                             remaining_delay = vote_delay_seconds - time_since_start
-                            print(f"{colored_text(f'🎲 [Thread-{thread_id+1}] Waiting remaining delay {format_duration(remaining_delay)}...', Colors.MAGENTA)}")
+                            print(f"{colored_text(f'🎲 [Thread-{thread_id+1}] Waiting remaining delay {format_duration(remaining_delay)}...', MAGENTA)}")
                             
-                            while remaining_delay > 0:
-                                print(f"{colored_text(f'⏳ [Thread-{thread_id+1}] Voting in {format_duration(remaining_delay)}', Colors.YELLOW)}", end='\r')
-                                sleep_time = min(10, remaining_delay)
-                                time.sleep(sleep_time)
-                                remaining_delay -= sleep_time
+                            _sleep_until(time.monotonic() + remaining_delay,
+                                         on_tick=_progress_printer(f"⏳ [Thread-{thread_id+1}] Voting in {{}}", YELLOW))
                             
-                            print(f"\n{colored_text(f'🎯 [Thread-{thread_id+1}] Random delay finished, voting now!', Colors.GREEN)}")
+                            print(f"\n{colored_text(f'🎯 [Thread-{thread_id+1}] Random delay finished, voting now!', GREEN)}")
                         else:
-                            print(f"{colored_text(f'🎯 [Thread-{thread_id+1}] Delay period passed, voting immediately!', Colors.GREEN)}")
+                            print(f"{colored_text(f'🎯 [Thread-{thread_id+1}] Delay period passed, voting immediately!', GREEN)}")
                     else:
-                        print(f"{colored_text(f'🎯 [Thread-{thread_id+1}] No delay - voting immediately!', Colors.GREEN)}")
+                        print(f"{colored_text(f'🎯 [Thread-{thread_id+1}] No delay - voting immediately!', GREEN)}")
                     
                     # Try to vote setelah delay
                     success = bot.submit_prediction()
                     
                     if success:
-                        print(f"{colored_text(f'🎉 [Account-{account['index']}] Vote submitted successfully! 🎯', Colors.BOLD + Colors.GREEN)}")
+                        print(f"{colored_text(f'🎉 [Account-{account['index']}] Vote submitted successfully! 🎯', BOLD + GREEN)}")
                         
                         # PROPER WAIT sampai voting ends dengan timing detection yang akurat
-                        print(f"{colored_text(f'⏳ [Account-{account['index']}] Now waiting until voting window completely ends...', Colors.YELLOW)}")
+                        print(f"{colored_text(f'⏳ [Account-{account['index']}] Now waiting until voting window completely ends...', YELLOW)}")
                         
                         voting_end_str = current_match.get('votingEndTime') or current_match.get('endTime')
                         if voting_end_str:
-                            voting_end = parse_iso_time(voting_end_str)
-                            
-                            # Real-time countdown sampai voting berakhir
-                            while datetime.datetime.now(pytz.UTC) < voting_end:
-                                remaining = (voting_end - datetime.datetime.now(pytz.UTC)).total_seconds()
-                                if remaining <= 0:
-                                    break
-                                print(f"{colored_text(f'⏰ [Account-{account['index']}] Voting ends in {format_duration(remaining)}', Colors.CYAN)}")
-                                time.sleep(min(30, remaining))
+                            # Countdown sampai voting berakhir, sekali konversi ke deadline monotonic
+                            voting_end_ts = _voting_end_ts(current_match)
+                            if voting_end_ts:
+                                _sleep_until(time.monotonic() + voting_end_ts - time.time(),
+                                             on_tick=_progress_printer(f"⏰ [Account-{account['index']}] Voting ends in {{}}", CYAN, end='\n'))
                             
-                            print(f"\n{colored_text(f'✅ [Account-{account['index']}] Voting window ended! Searching for next match...', Colors.BLUE)}")
+                            print(f"\n{colored_text(f'✅ [Account-{account['index']}] Voting window ended! Searching for next match...', BLUE)}")
                             
                             # Wait for next match dengan proper detection
-                            print(f"{colored_text(f'🔍 [Account-{account['index']}] Intelligent next match detection...', Colors.CYAN)}")
+                            print(f"{colored_text(f'🔍 [Account-{account['index']}] Intelligent next match detection...', CYAN)}")
                             found_new_match, new_match_data = wait_for_next_match(bot, max_wait_minutes=30)
                             
                             if found_new_match:
-                                print(f"{colored_text(f'🎉 [Account-{account['index']}] Next match detected! Starting new personal cycle...', Colors.GREEN)}")
+                                print(f"{colored_text(f'🎉 [Account-{account['index']}] Next match detected! Starting new personal cycle...', GREEN)}")
                                 last_match_id = None  # Reset untuk force detection match baru
                                 continue  # Langsung ke cycle berikutnya tanpa delay
                             else:
-                                print(f"{colored_text(f'⚠️ [Account-{account['index']}] No next match found within 30 minutes, waiting 5 minutes before retry...', Colors.YELLOW)}")
+                                print(f"{colored_text(f'⚠️ [Account-{account['index']}] No next match found within 30 minutes, waiting 5 minutes before retry...', YELLOW)}")
                                 time.sleep(300)
                         else:
-                            print(f"{colored_text(f'⚠️ [Account-{account['index']}] Could not get voting end time, waiting 5 minutes...', Colors.YELLOW)}")
+                            print(f"{colored_text(f'⚠️ [Account-{account['index']}] Could not get voting end time, waiting 5 minutes...', YELLOW)}")
                             time.sleep(300)
                     else:
-                        print(f"{colored_text(f'❌ [Account-{account['index']}] Vote failed, waiting 2 minutes before retry...', Colors.RED)}")
+                        print(f"{colored_text(f'❌ [Account-{account['index']}] Vote failed, waiting 2 minutes before retry...', RED)}")
                         time.sleep(120)
                         
                 elif status == 'closed':
-                    print(f"{colored_text(f'⌛ [Account-{account['index']}] Voting window has closed, searching for next match...', Colors.BLUE)}")
+                    print(f"{colored_text(f'⌛ [Account-{account['index']}] Voting window has closed, searching for next match...', BLUE)}")
                     
                     # Wait for next match dengan intelligent detection
-                    print(f"{colored_text(f'🔍 [Account-{account['index']}] Intelligent next match detection...', Colors.CYAN)}")
+                    print(f"{colored_text(f'🔍 [Account-{account['index']}] Intelligent next match detection...', CYAN)}")
                     found_new_match, new_match_data = wait_for_next_match(bot, max_wait_minutes=30)
                     
                     if found_new_match:
-                        print(f"{colored_text(f'🎉 [Account-{account['index']}] Next match detected! Starting new personal cycle...', Colors.GREEN)}")
+                        print(f"{colored_text(f'🎉 [Account-{account['index']}] Next match detected! Starting new personal cycle...', GREEN)}")
                         last_match_id = None  # Reset untuk force detection match baru
                         continue  # Langsung ke cycle berikutnya
                     else:
-                        print(f"{colored_text(f'⚠️ [Account-{account['index']}] No next match found within 30 minutes, waiting 5 minutes...', Colors.YELLOW)}")
+                        print(f"{colored_text(f'⚠️ [Account-{account['index']}] No next match found within 30 minutes, waiting 5 minutes...', YELLOW)}")
                         time.sleep(300)
                     
                 else:
-                    print(f"{colored_text(f'⚠️ [Account-{account['index']}] Unknown timing status: {status}, waiting 2 minutes...', Colors.YELLOW)}")
+                    print(f"{colored_text(f'⚠️ [Account-{account['index']}] Unknown timing status: {status}, waiting 2 minutes...', YELLOW)}")
                     time.sleep(120)
                     
                 # Small delay before next cycle check (hanya jika tidak continue)
                 time.sleep(5)
                 
             except Exception as e:
-                print(f"{colored_text(f'❌ [Account-{account['index']}] Error in personal cycle #{account_cycle_count}: {e}', Colors.RED)}")
+                print(f"{colored_text(f'❌ [Account-{account['index']}] Error in personal cycle #{account_cycle_count}: {e}', RED)}")
                 time.sleep(60)  # Wait 1 minute on error
                 
     except KeyboardInterrupt:
         account_index = account.get('index', 'Unknown')
-        print(f"\n{colored_text(f'⛔ [Account-{account_index}] Personal thread stopped by user after {account_cycle_count} cycles', Colors.BOLD + Colors.RED)}")
+        print(f"\n{colored_text(f'⛔ [Account-{account_index}] Personal thread stopped by user after {account_cycle_count} cycles', BOLD + RED)}")
         # Force exit thread
         import os
         os._exit(0)
     except Exception as e:
-        print(f"\n{colored_text(f'❌ [Account-{account['index']}] Personal thread error: {e}', Colors.RED)}")
+        print(f"\n{colored_text(f'❌ [Account-{account['index']}] Personal thread error: {e}', RED)}")
         # Force exit thread on critical error
         import os
         os._exit(1)
@@ -1414,7 +1644,6 @@ def threaded_continuous_multi_account_vote(active_accounts, delay_config=None, t
             threads.append(thread)
             thread.start()
             print(f"🧵 Started thread for Account {account['index']} (FID: Auto-detecting...)")
-            time.sleep(2)  # Delay antar thread start
         
         print(f"\n✅ All {len(threads)} threads started successfully!")
         print("🔄 Threads are running continuously...")
@@ -1468,34 +1697,39 @@ def threaded_multi_account_vote(account_info_list, use_threading=False, delay_co
     account_info_list = active_accounts
     
     # Use global configuration instead of asking user
-    print(f"\n{colored_text('🎯 Using global team preference:', Colors.YELLOW)} {colored_text(global_team_preference.title(), Colors.CYAN)}")
-    print(f"{colored_text('⛽ Using global fuel strategy:', Colors.YELLOW)} {colored_text(global_fuel_strategy.title(), Colors.CYAN)} (min: {global_min_fuel_threshold})")
+    print(f"\n{colored_text('🎯 Using global team preference:', YELLOW)} {colored_text(global_team_preference.title(), CYAN)}")
+    print(f"{colored_text('⛽ Using global fuel strategy:', YELLOW)} {colored_text(global_fuel_strategy.title(), CYAN)} (min: {global_min_fuel_threshold})")
     
     vote_cycle = 0
+    # Satu bot helper untuk match details & deteksi match berikutnya, dipakai ulang setiap cycle
+    match_bot = _lazy_account_bot(account_info_list[0])
     
     try:
         while True:
             vote_cycle += 1
             
             # Beautiful cycle header
-            print(f"\n{colored_text('╔' + '═' * 68 + '╗', Colors.CYAN)}")
-            print(f"{colored_text('║', Colors.CYAN)} {colored_text(f'🔄 VOTE CYCLE #{vote_cycle}', Colors.BOLD + Colors.WHITE):>40} {colored_text('║', Colors.CYAN)}")
+            print(f"\n{_BOX_TOP_CYAN}")
+            print(f"{_BOX_EDGE_CYAN} {colored_text(f'🔄 VOTE CYCLE #{vote_cycle}', BOLD + WHITE):>40} {_BOX_EDGE_CYAN}")
             current_time = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            print(f"{colored_text('║', Colors.CYAN)} {colored_text(f'⏰ {current_time}', Colors.YELLOW):>50} {colored_text('║', Colors.CYAN)}")
-            print(f"{colored_text('╚' + '═' * 68 + '╝', Colors.CYAN)}")
+            print(f"{_BOX_EDGE_CYAN} {colored_text(f'⏰ {current_time}', YELLOW):>50} {_BOX_EDGE_CYAN}")
+            print(_BOX_BOTTOM_CYAN)
+            
+            # Match details di-fetch sekali untuk semua akun di cycle ini
+            cycle_match_at, cycle_match = get_match_details_shared(match_bot)
             
             if use_threading:
                 # Threading approach
-                print(f"\n{colored_text('┌─ Threading Info ─' + '─' * 48 + '┐', Colors.MAGENTA)}")
+                print(f"\n{colored_text('┌─ Threading Info ─' + '─' * 48 + '┐', MAGENTA)}")
                 threading_msg = f'🧵 Using threaded execution for {len(account_info_list)} accounts...'
-                print(f"{colored_text('│', Colors.MAGENTA)} {colored_text(threading_msg, Colors.WHITE):<60} {colored_text('│', Colors.MAGENTA)}")
-                print(f"{colored_text('└' + '─' * 68 + '┘', Colors.MAGENTA)}")
-                results_queue = queue.Queue()
+                print(f"{_BOX_BAR_MAGENTA} {colored_text(threading_msg, WHITE):<60} {_BOX_BAR_MAGENTA}")
+                print(_BOX_END_MAGENTA)
+                all_results = []
                 
-                with ThreadPoolExecutor(max_workers=len(account_info_list)) as executor:
+                with ThreadPoolExecutor(max_workers=min(_MAX_VOTE_WORKERS, len(account_info_list))) as executor:
                     # Submit all tasks
                     future_to_account = {
-                        executor.submit(process_single_account_vote, acc_info, global_team_preference, global_fuel_strategy, global_min_fuel_threshold, results_queue): acc_info
+                        executor.submit(process_single_account_vote, acc_info, global_team_preference, global_fuel_strategy, global_min_fuel_threshold, match_details=cycle_match, match_fetched_at=cycle_match_at): acc_info
                         for acc_info in account_info_list
                     }
                     
@@ -1503,56 +1737,48 @@ def threaded_multi_account_vote(account_info_list, use_threading=False, delay_co
                     for future in as_completed(future_to_account):
                         account_info = future_to_account[future]
                         try:
-                            result = future.result()
+                            all_results.append(future.result())
                         except Exception as exc:
                             account_index = account_info.get('index', 'Unknown')
-                            print(f"{colored_text(f'❌ [Thread] Account {account_index} generated an exception: {exc}', Colors.RED)}")
-                
-                # Collect results
-                all_results = []
-                while not results_queue.empty():
-                    all_results.append(results_queue.get())
+                            print(f"{colored_text(f'❌ [Thread] Account {account_index} generated an exception: {exc}', RED)}")
                     
             else:
                 # Sequential approach  
-                print(f"\n{colored_text('┌─ Sequential Mode ─' + '─' * 47 + '┐', Colors.BLUE)}")
-                print(f"{colored_text('│', Colors.BLUE)} {colored_text(f'🔄 Using sequential execution for {len(account_info_list)} accounts...', Colors.WHITE):<60} {colored_text('│', Colors.BLUE)}")
-                print(f"{colored_text('└' + '─' * 68 + '┘', Colors.BLUE)}")
+                print(f"\n{colored_text('┌─ Sequential Mode ─' + '─' * 47 + '┐', BLUE)}")
+                print(f"{_BOX_BAR_BLUE} {colored_text(f'🔄 Using sequential execution for {len(account_info_list)} accounts...', WHITE):<60} {_BOX_BAR_BLUE}")
+                print(_BOX_END_BLUE)
                 all_results = []
-                results_queue = queue.Queue()
                 
                 for acc_info in account_info_list:
-                    result = process_single_account_vote(acc_info, global_team_preference, global_fuel_strategy, global_min_fuel_threshold, results_queue)
+                    result = process_single_account_vote(acc_info, global_team_preference, global_fuel_strategy, global_min_fuel_threshold, match_details=cycle_match, match_fetched_at=cycle_match_at)
                     all_results.append(result)
             
                 # Summary results
                 successful_votes = sum(1 for r in all_results if r['success'])
                 total_votes = sum(r.get('votes_count', 0) for r in all_results)
                 
-                print(f"\n{colored_text('╔' + '═' * 68 + '╗', Colors.MAGENTA)}")
-                print(f"{colored_text('║', Colors.MAGENTA)} {colored_text(f'📊 CYCLE #{vote_cycle} SUMMARY', Colors.BOLD + Colors.WHITE):>50} {colored_text('║', Colors.MAGENTA)}")
-                print(f"{colored_text('╚' + '═' * 68 + '╝', Colors.MAGENTA)}")
-                print(f"{colored_text(f'✅ Successful accounts: {successful_votes}/{len(account_info_list)}', Colors.GREEN)}")
-                print(f"{colored_text(f'🗳️  Total votes submitted: {total_votes}', Colors.CYAN)}")
+                print(f"\n{_BOX_TOP_MAGENTA}")
+                print(f"{_BOX_EDGE_MAGENTA} {colored_text(f'📊 CYCLE #{vote_cycle} SUMMARY', BOLD + WHITE):>50} {_BOX_EDGE_MAGENTA}")
+                print(_BOX_BOTTOM_MAGENTA)
+                print(f"{colored_text(f'✅ Successful accounts: {successful_votes}/{len(account_info_list)}', GREEN)}")
+                print(f"{colored_text(f'🗳️  Total votes submitted: {total_votes}', CYAN)}")
                 
                 # Detail per account dengan border
-                print(f"\n{colored_text('┌─ Account Details ─' + '─' * 47 + '┐', Colors.YELLOW)}")
+                print(f"\n{colored_text('┌─ Account Details ─' + '─' * 47 + '┐', YELLOW)}")
                 for result in sorted(all_results, key=lambda x: x['account_index']):
-                    status_color = Colors.GREEN if result['success'] else Colors.RED
+                    status_color = GREEN if result['success'] else RED
                     status = "✅ Success" if result['success'] else "❌ Failed"
                     votes = result.get('votes_count', 0)
                     error = f" - {result.get('error', '')}" if 'error' in result else ""
                     account_line = f"Account {result['account_index']} (FID: {result['fid']}): {status} ({votes} votes){error}"
-                    print(f"{colored_text('│', Colors.YELLOW)} {colored_text(account_line, status_color):<60} {colored_text('│', Colors.YELLOW)}")
-                print(f"{colored_text('└' + '─' * 68 + '┘', Colors.YELLOW)}")
+                    print(f"{_BOX_BAR_YELLOW} {colored_text(account_line, status_color):<60} {_BOX_BAR_YELLOW}")
+                print(_BOX_END_YELLOW)
                 
                 if successful_votes > 0:
-                    # Get timing info from first successful account dengan deteksi yang lebih baik
+                    # Get timing info dengan deteksi yang lebih baik
                     try:
-                        first_successful_token = next(acc['token'] for acc in account_info_list 
-                                                    if any(r['account_index'] == acc['index'] and r['success'] for r in all_results))
-                        temp_bot = FarcasterAutoVote(first_successful_token, 1, 10, None)
-                        match_details = temp_bot.get_match_details()
+                        # votingEndTime diambil dari payload cycle ini, tidak perlu request lagi
+                        match_details = cycle_match or get_match_details_shared(match_bot)[1]
                         
                         if match_details and 'data' in match_details and match_details['data']['matchData']:
                             current_match = match_details['data']['matchData'][0]
@@ -1565,30 +1791,24 @@ def threaded_multi_account_vote(account_info_list, use_threading=False, delay_co
                                 print("💤 All accounts voted, sleeping until next voting window...")
                                 
                                 # Sleep dengan countdown yang akurat
-                                voting_end_str = current_match.get('votingEndTime') or current_match.get('endTime')
-                                if voting_end_str:
-                                    voting_end = parse_iso_time(voting_end_str)
-                                    
-                                    while datetime.datetime.now(pytz.UTC) < voting_end:
-                                        remaining = (voting_end - datetime.datetime.now(pytz.UTC)).total_seconds()
-                                        if remaining <= 0:
-                                            break
-                                        print(f"⏰ Voting ends in {format_duration(remaining)}", end='\r')
-                                        time.sleep(min(30, remaining))
+                                voting_end_ts = _voting_end_ts(current_match)
+                                if voting_end_ts:
+                                    _sleep_until(time.monotonic() + voting_end_ts - time.time(),
+                                                 on_tick=_progress_printer("⏰ Voting ends in {}"))
                                 
                                 print(f"\n🔄 Voting window ended, looking for next match...")
                             
                             # Wait for next match dengan deteksi timing yang akurat
-                            print(f"\n{colored_text('🔍 NEXT MATCH DETECTION', Colors.BOLD + Colors.BLUE)}")
-                            print(f"{colored_text('⚡ Starting intelligent match detection...', Colors.CYAN)}")
+                            print(f"\n{colored_text('🔍 NEXT MATCH DETECTION', BOLD + BLUE)}")
+                            print(f"{colored_text('⚡ Starting intelligent match detection...', CYAN)}")
                             
                             # Wait dan deteksi match berikutnya
-                            found_new_match, new_match_data = wait_for_next_match(temp_bot, max_wait_minutes=30)
+                            found_new_match, new_match_data = wait_for_next_match(match_bot, max_wait_minutes=30)
                             
                             if found_new_match and new_match_data:
-                                print(f"{colored_text('🎉 New match detected! Continuing with next cycle...', Colors.GREEN)}")
+                                print(f"{colored_text('🎉 New match detected! Continuing with next cycle...', GREEN)}")
                             else:
-                                print(f"{colored_text('⚠️ No new match found, waiting 5 minutes before retry...', Colors.YELLOW)}")
+                                print(f"{colored_text('⚠️ No new match found, waiting 5 minutes before retry...', YELLOW)}")
                                 time.sleep(300)
                         else:
                             print("⚠️  Could not get match details, waiting 2 minutes...")
@@ -1640,8 +1860,8 @@ def continuous_multi_account_vote(account_info, delay_config=None, team_preferen
     print(f"⛽ Will check fuel for {len(active_accounts)} accounts during voting...")
     
     # Use global configuration instead of asking user
-    print(f"\n{colored_text('🎯 Using global team preference:', Colors.YELLOW)} {colored_text(team_preference.title(), Colors.CYAN)}")
-    print(f"{colored_text('⛽ Using global fuel strategy:', Colors.YELLOW)} {colored_text(fuel_strategy.title(), Colors.CYAN)} (min: {min_fuel_threshold})")
+    print(f"\n{colored_text('🎯 Using global team preference:', YELLOW)} {colored_text(team_preference.title(), CYAN)}")
+    print(f"{colored_text('⛽ Using global fuel strategy:', YELLOW)} {colored_text(fuel_strategy.title(), CYAN)} (min: {min_fuel_threshold})")
     
     print(f"\n✅ CONFIGURATION SUMMARY:")
     print(f"🎨 Team preference: {global_team_preference or 'Auto'}")
@@ -1690,7 +1910,7 @@ def continuous_multi_account_vote(account_info, delay_config=None, team_preferen
             
             voting_start = parse_iso_time(voting_start_str)
             voting_end = parse_iso_time(voting_end_str)
-            now_utc = datetime.datetime.now(pytz.UTC)
+            now_utc = datetime.datetime.now(_UTC)
             
             print(f"🕐 Current time: {format_time_wib(now_utc)}")
             print(f"🟢 Voting start: {format_time_wib(voting_start)}")
@@ -1704,8 +1924,8 @@ def continuous_multi_account_vote(account_info, delay_config=None, team_preferen
                 print(f"💤 Waiting until voting starts...")
                 
                 # Wait sampai voting start dengan countdown
-                while datetime.datetime.now(pytz.UTC) < voting_start:
-                    remaining = (voting_start - datetime.datetime.now(pytz.UTC)).total_seconds()
+                while datetime.datetime.now(_UTC) < voting_start:
+                    remaining = (voting_start - datetime.datetime.now(_UTC)).total_seconds()
                     if remaining <= 0:
                         break
                     print(f"⏰ Starting in {format_duration(remaining)}", end='\r')
@@ -1727,9 +1947,9 @@ def continuous_multi_account_vote(account_info, delay_config=None, team_preferen
                 continue
             
             # Vote semua account dengan random delay per account
-            print(f"\n{colored_text('╔' + '═' * 68 + '╗', Colors.GREEN)}")
-            print(f"{colored_text('║', Colors.GREEN)} {colored_text(f'🗳️ Starting vote cycle #{vote_cycle} for all accounts...', Colors.BOLD + Colors.WHITE):>60} {colored_text('║', Colors.GREEN)}")
-            print(f"{colored_text('╚' + '═' * 68 + '╝', Colors.GREEN)}")
+            print(f"\n{_BOX_TOP_GREEN}")
+            print(f"{_BOX_EDGE_GREEN} {colored_text(f'🗳️ Starting vote cycle #{vote_cycle} for all accounts...', BOLD + WHITE):>60} {_BOX_EDGE_GREEN}")
+            print(_BOX_BOTTOM_GREEN)
             successful_votes = 0
             failed_votes = 0
             
@@ -1754,7 +1974,7 @@ def continuous_multi_account_vote(account_info, delay_config=None, team_preferen
                     print(f"🎲 Account {acc['index']} random delay: {format_duration(delay)}")
             
             # SINGLE FUEL CHECK per cycle untuk semua account
-            print(f"\n{colored_text('🔍 Checking fuel status for all accounts (once per cycle)...', Colors.CYAN)}")
+            print(f"\n{colored_text('🔍 Checking fuel status for all accounts (once per cycle)...', CYAN)}")
             account_fuel_status = {}
             
             for acc in active_accounts[:]:  # Copy list untuk avoid modification during iteration
@@ -1773,7 +1993,7 @@ def continuous_multi_account_vote(account_info, delay_config=None, team_preferen
                     current_fuel = temp_bot.get_user_fuel_info()  # First call with claim check
                     
                     if current_fuel <= 0:
-                        print(f"{colored_text(f'❌ Account {acc_index}: No fuel remaining, removing from active list', Colors.RED)}")
+                        print(f"{colored_text(f'❌ Account {acc_index}: No fuel remaining, removing from active list', RED)}")
                         active_accounts.remove(acc)
                         continue
                     
@@ -1784,36 +2004,36 @@ def continuous_multi_account_vote(account_info, delay_config=None, team_preferen
                     }
                     acc['fuel'] = current_fuel
                     
-                    print(f"{colored_text(f'✅ Account {acc_index} (FID: {acc_fid}): {current_fuel} fuel', Colors.GREEN)}")
+                    print(f"{colored_text(f'✅ Account {acc_index} (FID: {acc_fid}): {current_fuel} fuel', GREEN)}")
                     
                 except Exception as e:
-                    print(f"{colored_text(f'❌ Account {acc_index}: Error checking fuel - {e}', Colors.RED)}")
+                    print(f"{colored_text(f'❌ Account {acc_index}: Error checking fuel - {e}', RED)}")
                     active_accounts.remove(acc)
                     continue
             
             if not active_accounts:
-                print(f"{colored_text('❌ No accounts with fuel remaining!', Colors.RED)}")
+                print(f"{colored_text('❌ No accounts with fuel remaining!', RED)}")
                 break
             
             # Now vote with cached fuel info
             for acc in active_accounts[:]:  # Copy list để avoid modification during iteration
-                print(f"\n{colored_text('┌─ Account Status ─' + '─' * 49 + '┐', Colors.CYAN)}")
+                print(f"\n{colored_text('┌─ Account Status ─' + '─' * 49 + '┐', CYAN)}")
                 acc_index = acc.get('index', 'Unknown')
                 acc_fid = acc.get('fid', 'Unknown')
-                print(f"{colored_text('│', Colors.CYAN)} {colored_text(f'👤 Account {acc_index}', Colors.BOLD + Colors.WHITE):<20} {colored_text(f'🆔 FID: {acc_fid}', Colors.YELLOW):<25} {colored_text('│', Colors.CYAN)}")
-                print(f"{colored_text('└' + '─' * 68 + '┘', Colors.CYAN)}")
+                print(f"{_BOX_BAR_CYAN} {colored_text(f'👤 Account {acc_index}', BOLD + WHITE):<20} {colored_text(f'🆔 FID: {acc_fid}', YELLOW):<25} {_BOX_BAR_CYAN}")
+                print(_BOX_END_CYAN)
                 
                 try:
                     # Get cached fuel info
                     if acc_index not in account_fuel_status:
-                        print(f"{colored_text(f'❌ Account {acc_index}: No fuel status cached, skipping', Colors.RED)}")
+                        print(f"{colored_text(f'❌ Account {acc_index}: No fuel status cached, skipping', RED)}")
                         continue
                     
                     fuel_info = account_fuel_status[acc_index]
                     current_fuel = fuel_info['fuel']
                     temp_bot = fuel_info['bot']
                     
-                    print(f"{colored_text(f'⛽ Current fuel: {current_fuel}', Colors.GREEN)}")
+                    print(f"{colored_text(f'⛽ Current fuel: {current_fuel}', GREEN)}")
                     
                     # Determine fuel to use based on global strategy
                     if fuel_strategy == "conservative":
@@ -1825,24 +2045,24 @@ def continuous_multi_account_vote(account_info, delay_config=None, team_preferen
                     else:
                         fuel_to_use = current_fuel  # Default to max
                     
-                    print(f"{colored_text(f'🎯 Using {fuel_to_use} fuel for this vote (strategy: {fuel_strategy})', Colors.YELLOW)}")
+                    print(f"{colored_text(f'🎯 Using {fuel_to_use} fuel for this vote (strategy: {fuel_strategy})', YELLOW)}")
                     
                     # TAMBAHAN: Random delay sebelum vote (hanya jika ada delay)
                     delay_time = account_delays[acc_index]
                     if delay_time > 0:
-                        print(f"{colored_text(f'🎲 Random delay: {format_duration(delay_time)} before voting...', Colors.MAGENTA)}")
+                        print(f"{colored_text(f'🎲 Random delay: {format_duration(delay_time)} before voting...', MAGENTA)}")
                         
                         # Countdown untuk delay
                         remaining_delay = delay_time
                         while remaining_delay > 0:
-                            print(f"{colored_text(f'⏳ Account {acc_index} voting in {format_duration(remaining_delay)}', Colors.CYAN)}", end='\r')
+                            print(f"{colored_text(f'⏳ Account {acc_index} voting in {format_duration(remaining_delay)}', CYAN)}", end='\r')
                             sleep_time = min(5, remaining_delay)  # Update setiap 5 detik
                             time.sleep(sleep_time)
                             remaining_delay -= sleep_time
                         
-                        print(f"\n{colored_text(f'🎯 Account {acc_index}: Random delay finished, voting now!', Colors.GREEN)}")
+                        print(f"\n{colored_text(f'🎯 Account {acc_index}: Random delay finished, voting now!', GREEN)}")
                     else:
-                        print(f"{colored_text(f'🎯 Account {acc_index}: No delay - voting immediately!', Colors.GREEN)}")
+                        print(f"{colored_text(f'🎯 Account {acc_index}: No delay - voting immediately!', GREEN)}")
                     
                     # Attempt vote with global team preference
                     bot_team_pref = None if team_preference == "auto" else team_preference
@@ -1850,55 +2070,55 @@ def continuous_multi_account_vote(account_info, delay_config=None, team_preferen
                     success = bot.run_auto_vote()
                     
                     if success:
-                        print(f"{colored_text(f'✅ Account {acc_index}: Vote successful!', Colors.GREEN)}")
+                        print(f"{colored_text(f'✅ Account {acc_index}: Vote successful!', GREEN)}")
                         successful_votes += 1
                         acc['fuel'] -= fuel_to_use  # Update fuel count
                     else:
-                        print(f"{colored_text(f'❌ Account {acc_index}: Vote failed!', Colors.RED)}")
+                        print(f"{colored_text(f'❌ Account {acc_index}: Vote failed!', RED)}")
                         failed_votes += 1
                         
                 except Exception as e:
-                    print(f"{colored_text(f'❌ Account {acc_index}: Error - {e}', Colors.RED)}")
+                    print(f"{colored_text(f'❌ Account {acc_index}: Error - {e}', RED)}")
                     failed_votes += 1
                 
                 # Small delay between accounts
                 time.sleep(2)
             
             # Summary untuk cycle ini
-            print(f"\n{colored_text('╔' + '═' * 68 + '╗', Colors.MAGENTA)}")
-            print(f"{colored_text('║', Colors.MAGENTA)} {colored_text(f'📊 CYCLE #{vote_cycle} SUMMARY', Colors.BOLD + Colors.WHITE):>50} {colored_text('║', Colors.MAGENTA)}")
-            print(f"{colored_text('║', Colors.MAGENTA)} {colored_text(f'✅ Successful votes: {successful_votes}', Colors.GREEN):<35} {colored_text('║', Colors.MAGENTA)}")
-            print(f"{colored_text('║', Colors.MAGENTA)} {colored_text(f'❌ Failed votes: {failed_votes}', Colors.RED):<35} {colored_text('║', Colors.MAGENTA)}")
-            print(f"{colored_text('║', Colors.MAGENTA)} {colored_text(f'⛽ Active accounts remaining: {len(active_accounts)}', Colors.CYAN):<35} {colored_text('║', Colors.MAGENTA)}")
-            print(f"{colored_text('╚' + '═' * 68 + '╝', Colors.MAGENTA)}")
+            print(f"\n{_BOX_TOP_MAGENTA}")
+            print(f"{_BOX_EDGE_MAGENTA} {colored_text(f'📊 CYCLE #{vote_cycle} SUMMARY', BOLD + WHITE):>50} {_BOX_EDGE_MAGENTA}")
+            print(f"{_BOX_EDGE_MAGENTA} {colored_text(f'✅ Successful votes: {successful_votes}', GREEN):<35} {_BOX_EDGE_MAGENTA}")
+            print(f"{_BOX_EDGE_MAGENTA} {colored_text(f'❌ Failed votes: {failed_votes}', RED):<35} {_BOX_EDGE_MAGENTA}")
+            print(f"{_BOX_EDGE_MAGENTA} {colored_text(f'⛽ Active accounts remaining: {len(active_accounts)}', CYAN):<35} {_BOX_EDGE_MAGENTA}")
+            print(_BOX_BOTTOM_MAGENTA)
             
             if successful_votes > 0:
                 # Show timing info dan get status
                 status, remaining_time = show_match_timing_info(current_match)
                 
                 if status == 'open' and remaining_time > 0:
-                    print(f"\n{colored_text('┌─ Waiting Status ─' + '─' * 48 + '┐', Colors.YELLOW)}")
-                    print(f"{colored_text('│', Colors.YELLOW)} {colored_text(f'⏳ Waiting {format_duration(remaining_time)} until voting ends...', Colors.WHITE):<60} {colored_text('│', Colors.YELLOW)}")
-                    print(f"{colored_text('│', Colors.YELLOW)} {colored_text('💤 All accounts voted, sleeping until next voting window...', Colors.CYAN):<60} {colored_text('│', Colors.YELLOW)}")
-                    print(f"{colored_text('└' + '─' * 68 + '┘', Colors.YELLOW)}")
+                    print(f"\n{colored_text('┌─ Waiting Status ─' + '─' * 48 + '┐', YELLOW)}")
+                    print(f"{_BOX_BAR_YELLOW} {colored_text(f'⏳ Waiting {format_duration(remaining_time)} until voting ends...', WHITE):<60} {_BOX_BAR_YELLOW}")
+                    print(f"{_BOX_BAR_YELLOW} {colored_text('💤 All accounts voted, sleeping until next voting window...', CYAN):<60} {_BOX_BAR_YELLOW}")
+                    print(_BOX_END_YELLOW)
                     
                     # Sleep dengan progress indicator sampai voting ends
                     voting_end_str = current_match.get('votingEndTime') or current_match.get('endTime')
                     if voting_end_str:
                         voting_end = parse_iso_time(voting_end_str)
                         
-                        while datetime.datetime.now(pytz.UTC) < voting_end:
-                            remaining = (voting_end - datetime.datetime.now(pytz.UTC)).total_seconds()
+                        while datetime.datetime.now(_UTC) < voting_end:
+                            remaining = (voting_end - datetime.datetime.now(_UTC)).total_seconds()
                             if remaining <= 0:
                                 break
-                            print(f"{colored_text(f'⏰ Voting ends in {format_duration(remaining)}', Colors.YELLOW)}", end='\r')
+                            print(f"{colored_text(f'⏰ Voting ends in {format_duration(remaining)}', YELLOW)}", end='\r')
                             time.sleep(min(30, remaining))
                     
                     print(f"\n🔄 Voting window ended, checking for next match...")
                     
                 # Wait for next match dengan deteksi timing yang akurat
-                print(f"\n{colored_text('🔍 NEXT MATCH DETECTION', Colors.BOLD + Colors.BLUE)}")
-                print(f"{colored_text('⚡ Starting intelligent match detection...', Colors.CYAN)}")
+                print(f"\n{colored_text('🔍 NEXT MATCH DETECTION', BOLD + BLUE)}")
+                print(f"{colored_text('⚡ Starting intelligent match detection...', CYAN)}")
                 
                 # Setup bot untuk deteksi match berikutnya
                 temp_bot = FarcasterAutoVote(active_accounts[0]['token'], 1, 10, None)
@@ -1907,11 +2127,11 @@ def continuous_multi_account_vote(account_info, delay_config=None, team_preferen
                 found_new_match, new_match_data = wait_for_next_match(temp_bot, max_wait_minutes=30)
                 
                 if found_new_match and new_match_data:
-                    print(f"{colored_text('🎉 New match detected! Continuing with next cycle...', Colors.GREEN)}")
+                    print(f"{colored_text('🎉 New match detected! Continuing with next cycle...', GREEN)}")
                     # Update current_match untuk cycle berikutnya
                     current_match = new_match_data
                 else:
-                    print(f"{colored_text('⚠️ No new match found, waiting 5 minutes before retry...', Colors.YELLOW)}")
+                    print(f"{colored_text('⚠️ No new match found, waiting 5 minutes before retry...', YELLOW)}")
                     time.sleep(300)
                     
             else:
@@ -1932,8 +2152,8 @@ def continuous_multi_account_vote(account_info, delay_config=None, team_preferen
 
 def signal_handler(sig, frame):
     """Handle Ctrl+C signal untuk force exit"""
-    print(f"\n\n{colored_text('⛔ CTRL+C DETECTED! FORCE STOPPING ALL PROCESSES...', Colors.BOLD + Colors.RED)}")
-    print(f"{colored_text('👋 Exiting immediately...', Colors.YELLOW)}")
+    print(f"\n\n{colored_text('⛔ CTRL+C DETECTED! FORCE STOPPING ALL PROCESSES...', BOLD + RED)}")
+    print(f"{colored_text('👋 Exiting immediately...', YELLOW)}")
     
     # Force terminate semua threads dan processes
     try:
@@ -1971,22 +2191,22 @@ def main():
     ]
     
     for line in header_lines:
-        print(colored_text(line, Colors.BOLD + Colors.CYAN))
+        print(colored_text(line, BOLD + CYAN))
         time.sleep(0.1)
     
-    print(f"\n{colored_text('🔍 Initializing system...', Colors.YELLOW)}")
+    print(f"\n{colored_text('🔍 Initializing system...', YELLOW)}")
     
     # Load all tokens dari account.txt
-    print(f"{colored_text('📋 Loading authorization tokens...', Colors.BLUE)}")
+    print(f"{colored_text('📋 Loading authorization tokens...', BLUE)}")
     auth_tokens = load_authorization_token()
     if not auth_tokens:
-        print(colored_text("❌ Error: Could not load any authorization tokens!", Colors.RED))
+        print(colored_text("❌ Error: Could not load any authorization tokens!", RED))
         return
     
-    print(f"{colored_text(f'✅ Successfully loaded {len(auth_tokens)} token(s)', Colors.GREEN)}")
+    print(f"{colored_text(f'✅ Successfully loaded {len(auth_tokens)} token(s)', GREEN)}")
     
     # Skip fuel detection di startup - buat simple account info dulu
-    print(f"\n{colored_text(f'� Preparing {len(auth_tokens)} account(s) for configuration...', Colors.MAGENTA)}")
+    print(f"\n{colored_text(f'� Preparing {len(auth_tokens)} account(s) for configuration...', MAGENTA)}")
     account_info = []
     
     for i, token in enumerate(auth_tokens, 1):
@@ -1997,18 +2217,18 @@ def main():
             'fuel': None  # Will be checked when needed
         })
     
-    print(f"{colored_text(f'✅ {len(account_info)} accounts ready for configuration', Colors.GREEN)}")
+    print(f"{colored_text(f'✅ {len(account_info)} accounts ready for configuration', GREEN)}")
     
     # Account summary dengan info placeholder
-    print(f"\n{colored_text('═' * 70, Colors.MAGENTA)}")
-    print(f"{colored_text('📊 ACCOUNT SUMMARY', Colors.BOLD + Colors.MAGENTA)}")
-    print(f"{colored_text('═' * 70, Colors.MAGENTA)}")
-    print(f"{colored_text('� Total Accounts:', Colors.YELLOW)} {colored_text(str(len(account_info)), Colors.GREEN)}")
-    print(f"{colored_text('� Status:', Colors.YELLOW)} {colored_text('Ready for configuration (fuel will be checked before voting)', Colors.CYAN)}")
-    print(f"{colored_text('═' * 70, Colors.MAGENTA)}")
+    print(f"\n{colored_text('═' * 70, MAGENTA)}")
+    print(f"{colored_text('📊 ACCOUNT SUMMARY', BOLD + MAGENTA)}")
+    print(f"{colored_text('═' * 70, MAGENTA)}")
+    print(f"{colored_text('� Total Accounts:', YELLOW)} {colored_text(str(len(account_info)), GREEN)}")
+    print(f"{colored_text('� Status:', YELLOW)} {colored_text('Ready for configuration (fuel will be checked before voting)', CYAN)}")
+    print(f"{colored_text('═' * 70, MAGENTA)}")
     
     # Main menu options with colors
-    print(f"\n{colored_text('🎛️  CONTROL PANEL - SELECT ACTION', Colors.BOLD + Colors.CYAN)}")
+    print(f"\n{colored_text('🎛️  CONTROL PANEL - SELECT ACTION', BOLD + CYAN)}")
     menu_lines = [
         "┌─────────────────────────────────────────────────────────────────┐",
         "│  1. 🚀 Auto Vote All Accounts (Continuous Loop)                │",
@@ -2018,21 +2238,21 @@ def main():
     ]
     
     for line in menu_lines:
-        print(colored_text(line, Colors.BLUE))
+        print(colored_text(line, BLUE))
     
-    action_choice = input(f"\n{colored_text('💫 Choose your action (1/2/3):', Colors.BOLD + Colors.YELLOW)} ").strip()
+    action_choice = input(f"\n{colored_text('💫 Choose your action (1/2/3):', BOLD + YELLOW)} ").strip()
     
     if action_choice == "2":
         # Check fuel status semua account with colors (on-demand)
-        print(f"\n{colored_text('🔍 Checking fuel status for all accounts...', Colors.CYAN)}")
-        print(f"{colored_text('⏳ Please wait while detecting account information...', Colors.YELLOW)}")
+        print(f"\n{colored_text('🔍 Checking fuel status for all accounts...', CYAN)}")
+        print(f"{colored_text('⏳ Please wait while detecting account information...', YELLOW)}")
         
-        print(f"\n{colored_text('═' * 70, Colors.CYAN)}")
-        print(f"{colored_text('⛽ DETAILED FUEL STATUS REPORT', Colors.BOLD + Colors.CYAN)}")
-        print(f"{colored_text('═' * 70, Colors.CYAN)}")
+        print(f"\n{colored_text('═' * 70, CYAN)}")
+        print(f"{colored_text('⛽ DETAILED FUEL STATUS REPORT', BOLD + CYAN)}")
+        print(f"{colored_text('═' * 70, CYAN)}")
         
         for i, acc in enumerate(account_info, 1):
-            print(f"{colored_text(f'🔄 Scanning Account {i}/{len(account_info)}...', Colors.CYAN)}", end=' ')
+            print(f"{colored_text(f'🔄 Scanning Account {i}/{len(account_info)}...', CYAN)}", end=' ')
             try:
                 # Create bot with lazy init and check fuel
                 temp_bot = FarcasterAutoVote(acc['token'], 1, 10, None, lazy_init=True)
@@ -2045,43 +2265,43 @@ def main():
                 
                 if fuel > 0:
                     status_emoji = "🟢"
-                    status_color = Colors.GREEN
-                    fuel_color = Colors.YELLOW
-                    print(f"{colored_text('✅ FOUND FUEL', Colors.GREEN)} - {colored_text(f'FID: {fid}', Colors.WHITE)} {colored_text('|', Colors.CYAN)} {colored_text(f'Fuel: {fuel}', Colors.YELLOW)}")
+                    status_color = GREEN
+                    fuel_color = YELLOW
+                    print(f"{colored_text('✅ FOUND FUEL', GREEN)} - {colored_text(f'FID: {fid}', WHITE)} {colored_text('|', CYAN)} {colored_text(f'Fuel: {fuel}', YELLOW)}")
                 else:
                     status_emoji = "🔴"
-                    status_color = Colors.RED
-                    fuel_color = Colors.RED
-                    print(f"{colored_text('⛽ NO FUEL', Colors.RED)} - {colored_text(f'FID: {fid}', Colors.WHITE)}")
+                    status_color = RED
+                    fuel_color = RED
+                    print(f"{colored_text('⛽ NO FUEL', RED)} - {colored_text(f'FID: {fid}', WHITE)}")
                     
             except Exception as e:
-                print(f"{colored_text('❌', Colors.RED)} {colored_text(f'Error: {str(e)[:30]}...', Colors.RED)}")
+                print(f"{colored_text('❌', RED)} {colored_text(f'Error: {str(e)[:30]}...', RED)}")
                 acc['fid'] = 'Unknown'
                 acc['fuel'] = 0
                 status_emoji = "🔴"
-                status_color = Colors.RED
-                fuel_color = Colors.RED
+                status_color = RED
+                fuel_color = RED
         
-        print(f"{colored_text('═' * 70, Colors.CYAN)}")
+        print(f"{colored_text('═' * 70, CYAN)}")
         return
         
     elif action_choice == "3":
-        print(f"\n{colored_text('═' * 70, Colors.MAGENTA)}")
-        print(f"{colored_text('👋 Thank you for using Farcaster Auto Vote!', Colors.BOLD + Colors.CYAN)}")
-        print(f"{colored_text('💫 See you next time!', Colors.YELLOW)}")
-        print(f"{colored_text('═' * 70, Colors.MAGENTA)}")
+        print(f"\n{colored_text('═' * 70, MAGENTA)}")
+        print(f"{colored_text('👋 Thank you for using Farcaster Auto Vote!', BOLD + CYAN)}")
+        print(f"{colored_text('💫 See you next time!', YELLOW)}")
+        print(f"{colored_text('═' * 70, MAGENTA)}")
         return
         
     elif action_choice != "1":
-        print(f"{colored_text('❌ Invalid choice! Please select 1, 2, or 3.', Colors.RED)}")
+        print(f"{colored_text('❌ Invalid choice! Please select 1, 2, or 3.', RED)}")
         return
     
     # Option 1: Auto Vote All Accounts (Continuous Loop)
     
     # TEAM PREFERENCE CONFIGURATION
-    print(f"\n{colored_text('═' * 70, Colors.MAGENTA)}")
-    print(f"{colored_text('🎯 TEAM PREFERENCE CONFIGURATION', Colors.BOLD + Colors.MAGENTA)}")
-    print(f"{colored_text('═' * 70, Colors.MAGENTA)}")
+    print(f"\n{colored_text('═' * 70, MAGENTA)}")
+    print(f"{colored_text('🎯 TEAM PREFERENCE CONFIGURATION', BOLD + MAGENTA)}")
+    print(f"{colored_text('═' * 70, MAGENTA)}")
     
     team_menu_lines = [
         "┌─────────────────────────────────────────────────────────────────┐",
@@ -2092,24 +2312,24 @@ def main():
     ]
     
     for line in team_menu_lines:
-        print(colored_text(line, Colors.BLUE))
+        print(colored_text(line, BLUE))
     
-    team_choice = input(f"\n{colored_text('🎯 Select team preference (1/2/3):', Colors.BOLD + Colors.YELLOW)} ").strip()
+    team_choice = input(f"\n{colored_text('🎯 Select team preference (1/2/3):', BOLD + YELLOW)} ").strip()
     
     if team_choice == "1":
         global_team_preference = "blue"
-        print(f"{colored_text('✅ Team preference set to: Blue Team', Colors.BLUE)}")
+        print(f"{colored_text('✅ Team preference set to: Blue Team', BLUE)}")
     elif team_choice == "2":
         global_team_preference = "red"
-        print(f"{colored_text('✅ Team preference set to: Red Team', Colors.RED)}")
+        print(f"{colored_text('✅ Team preference set to: Red Team', RED)}")
     else:
         global_team_preference = "auto"
-        print(f"{colored_text('✅ Team preference set to: Auto (Random)', Colors.YELLOW)}")
+        print(f"{colored_text('✅ Team preference set to: Auto (Random)', YELLOW)}")
     
     # FUEL STRATEGY CONFIGURATION
-    print(f"\n{colored_text('═' * 70, Colors.MAGENTA)}")
-    print(f"{colored_text('⛽ FUEL STRATEGY CONFIGURATION', Colors.BOLD + Colors.MAGENTA)}")
-    print(f"{colored_text('═' * 70, Colors.MAGENTA)}")
+    print(f"\n{colored_text('═' * 70, MAGENTA)}")
+    print(f"{colored_text('⛽ FUEL STRATEGY CONFIGURATION', BOLD + MAGENTA)}")
+    print(f"{colored_text('═' * 70, MAGENTA)}")
     
     fuel_menu_lines = [
         "┌─────────────────────────────────────────────────────────────────┐",
@@ -2120,14 +2340,14 @@ def main():
     ]
     
     for line in fuel_menu_lines:
-        print(colored_text(line, Colors.BLUE))
+        print(colored_text(line, BLUE))
     
-    fuel_choice = input(f"\n{colored_text('⛽ Select fuel strategy (1/2/3):', Colors.BOLD + Colors.YELLOW)} ").strip()
+    fuel_choice = input(f"\n{colored_text('⛽ Select fuel strategy (1/2/3):', BOLD + YELLOW)} ").strip()
     
     if fuel_choice == "1":
         global_fuel_strategy = "conservative"
         global_min_fuel_threshold = 3
-        print(f"{colored_text('✅ Fuel strategy set to: Conservative (min fuel: 3)', Colors.GREEN)}")
+        print(f"{colored_text('✅ Fuel strategy set to: Conservative (min fuel: 3)', GREEN)}")
     elif fuel_choice == "3":
         global_fuel_strategy = "custom"
         try:
@@ -2136,20 +2356,20 @@ def main():
                 global_min_fuel_threshold = 1
         except ValueError:
             global_min_fuel_threshold = 1
-        print(f"{colored_text(f'✅ Fuel strategy set to: Custom (min fuel: {global_min_fuel_threshold})', Colors.GREEN)}")
+        print(f"{colored_text(f'✅ Fuel strategy set to: Custom (min fuel: {global_min_fuel_threshold})', GREEN)}")
     else:
         global_fuel_strategy = "max"
         global_min_fuel_threshold = 1
-        print(f"{colored_text('✅ Fuel strategy set to: Max Available (min fuel: 1)', Colors.GREEN)}")
+        print(f"{colored_text('✅ Fuel strategy set to: Max Available (min fuel: 1)', GREEN)}")
     
     # Ask for threading preference
-    print(f"\n{colored_text('═' * 70, Colors.MAGENTA)}")
-    print(f"{colored_text('🧵 EXECUTION MODE CONFIGURATION', Colors.BOLD + Colors.MAGENTA)}")
-    print(f"{colored_text('═' * 70, Colors.MAGENTA)}")
+    print(f"\n{colored_text('═' * 70, MAGENTA)}")
+    print(f"{colored_text('🧵 EXECUTION MODE CONFIGURATION', BOLD + MAGENTA)}")
+    print(f"{colored_text('═' * 70, MAGENTA)}")
     print("🔄 Sequential: Accounts akan vote satu per satu (lebih stabil)")
     print("🧵 Threaded: Semua accounts vote bersamaan (lebih cepat)")
     
-    use_threading_input = input(f"\n{colored_text('🧵 Use multi-threading? (y/n):', Colors.BOLD + Colors.YELLOW)} ").strip().lower()
+    use_threading_input = input(f"\n{colored_text('🧵 Use multi-threading? (y/n):', BOLD + YELLOW)} ").strip().lower()
     use_threading = use_threading_input in ['y', 'yes', '1', 'true']
     
     # Custom delay configuration
@@ -2222,27 +2442,27 @@ def main():
     delay_config = {'min_delay': min_delay, 'max_delay': max_delay}
     
     # Show final configuration summary
-    print(f"\n{colored_text('═' * 70, Colors.MAGENTA)}")
-    print(f"{colored_text('📋 FINAL CONFIGURATION SUMMARY', Colors.BOLD + Colors.MAGENTA)}")
-    print(f"{colored_text('═' * 70, Colors.MAGENTA)}")
-    print(f"{colored_text('🎯 Team Preference:', Colors.YELLOW)} {colored_text(global_team_preference.title(), Colors.CYAN)}")
-    print(f"{colored_text('⛽ Fuel Strategy:', Colors.YELLOW)} {colored_text(global_fuel_strategy.title(), Colors.CYAN)} (min: {global_min_fuel_threshold})")
-    print(f"{colored_text('🎲 Delay Range:', Colors.YELLOW)} {colored_text(f'{format_duration(min_delay)} - {format_duration(max_delay)}', Colors.CYAN)}")
-    print(f"{colored_text('🧵 Execution Mode:', Colors.YELLOW)} {colored_text('Threading' if use_threading else 'Sequential', Colors.CYAN)}")
-    print(f"{colored_text('═' * 70, Colors.MAGENTA)}")
+    print(f"\n{colored_text('═' * 70, MAGENTA)}")
+    print(f"{colored_text('📋 FINAL CONFIGURATION SUMMARY', BOLD + MAGENTA)}")
+    print(f"{colored_text('═' * 70, MAGENTA)}")
+    print(f"{colored_text('🎯 Team Preference:', YELLOW)} {colored_text(global_team_preference.title(), CYAN)}")
+    print(f"{colored_text('⛽ Fuel Strategy:', YELLOW)} {colored_text(global_fuel_strategy.title(), CYAN)} (min: {global_min_fuel_threshold})")
+    print(f"{colored_text('🎲 Delay Range:', YELLOW)} {colored_text(f'{format_duration(min_delay)} - {format_duration(max_delay)}', CYAN)}")
+    print(f"{colored_text('🧵 Execution Mode:', YELLOW)} {colored_text('Threading' if use_threading else 'Sequential', CYAN)}")
+    print(f"{colored_text('═' * 70, MAGENTA)}")
     
     if use_threading:
-        print(f"{colored_text('🧵 Using threaded execution mode...', Colors.GREEN)}")
-        print(f"{colored_text('🎯 Each account will have independent continuous cycles...', Colors.GREEN)}")
+        print(f"{colored_text('🧵 Using threaded execution mode...', GREEN)}")
+        print(f"{colored_text('🎯 Each account will have independent continuous cycles...', GREEN)}")
         
         # Since we skipped fuel check at startup, use all accounts for threading
         # Fuel will be checked during the actual voting process
         active_accounts = account_info  # Use all accounts, fuel check will happen during vote
         if not active_accounts:
-            print(f"{colored_text('❌ No accounts available!', Colors.RED)}")
+            print(f"{colored_text('❌ No accounts available!', RED)}")
             return
             
-        print(f"{colored_text(f'📋 Will check fuel and start voting for {len(active_accounts)} accounts...', Colors.CYAN)}")
+        print(f"{colored_text(f'📋 Will check fuel and start voting for {len(active_accounts)} accounts...', CYAN)}")
             
         threaded_continuous_multi_account_vote(
             active_accounts, 
@@ -2252,7 +2472,7 @@ def main():
             min_fuel_threshold=global_min_fuel_threshold
         )
     else:
-        print(f"{colored_text('🔄 Using sequential execution mode...', Colors.GREEN)}")
+        print(f"{colored_text('🔄 Using sequential execution mode...', GREEN)}")
         continuous_multi_account_vote(
             account_info, 
             delay_config=delay_config,